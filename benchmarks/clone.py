@@ -0,0 +1,57 @@
+import os
+import timeit
+from copy import deepcopy
+
+import sqlglot
+from sqlglot import exp
+
+TPCH = os.path.join(
+    os.path.dirname(__file__), "..", "tests", "fixtures", "optimizer", "tpc-h", "tpc-h.sql"
+)
+
+
+def deepcopy_copy(expression):
+    # The previous implementation of Expression.copy: a recursive deepcopy, followed by a pass
+    # over the new tree that sets the parents again
+    def __deepcopy__(self, memo):
+        copy = self.__class__(**deepcopy(self.args, memo))
+        copy.comments = self.comments
+        copy.type = self.type
+        return copy
+
+    original = exp.Expression.__deepcopy__
+    exp.Expression.__deepcopy__ = __deepcopy__
+    try:
+        new = deepcopy(expression)
+    finally:
+        exp.Expression.__deepcopy__ = original
+
+    for item, parent, _ in new.bfs():
+        if isinstance(item, exp.Expression) and parent:
+            item.parent = parent
+    return new
+
+
+with open(TPCH, encoding="utf-8") as f:
+    # the fixture alternates between the TPC-H queries and their optimized versions
+    statements = [
+        statement.strip() for statement in f.read().split(";") if statement.strip("\n -")
+    ]
+
+queries = [sqlglot.parse_one(sql) for sql in statements[0::2]]
+optimized = [sqlglot.parse_one(sql) for sql in statements[1::2]]
+
+for trees in (queries, optimized):
+    for tree in trees:
+        assert tree.copy() == deepcopy_copy(tree) == tree
+
+print(f"{'Trees':>10}{'copy (ms)':>15}{'deepcopy (ms)':>15}{'speedup':>10}")
+
+for name, trees in {"tpch": queries, "optimized": optimized}.items():
+    copy = min(timeit.repeat(lambda: [t.copy() for t in trees], number=20, repeat=5)) / 20 * 1000
+    legacy = (
+        min(timeit.repeat(lambda: [deepcopy_copy(t) for t in trees], number=20, repeat=5))
+        / 20
+        * 1000
+    )
+    print(f"{name:>10}{copy:>15.3f}{legacy:>15.3f}{legacy / copy:>9.1f}x")
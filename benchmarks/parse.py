@@ -0,0 +1,21 @@
+import timeit
+
+from queries import long, short, tpch
+
+import sqlglot
+from sqlglot.dialects.dialect import Dialect
+
+DIALECTS = ["", "bigquery", "duckdb", "hive", "mysql", "presto", "snowflake", "spark", "tsql"]
+
+print(f"{'Dialect':>10}" + "".join(f"{name + ' (ms)':>14}" for name in ("tpch", "short", "long")))
+
+for dialect_name in DIALECTS:
+    dialect = Dialect.get_or_raise(dialect_name)()
+    parser = dialect.parser()
+    timings = []
+    for sql in (tpch, short, long):
+        # the queries are written in the dialect, e.g. with its own quotes
+        sql = ";\n".join(sqlglot.transpile(sql, write=dialect_name))
+        tokens = dialect.tokenizer.tokenize(sql)
+        timings.append(min(timeit.repeat(lambda: parser.parse(tokens, sql), number=20, repeat=5)))
+    print(f"{dialect_name or 'default':>10}" + "".join(f"{t / 20 * 1000:>14.3f}" for t in timings))
@@ -0,0 +1,27 @@
+import timeit
+
+from queries import crazy, long, short, tpch
+
+from sqlglot.tokens import Tokenizer
+
+
+def tokenize(sql):
+    Tokenizer().tokenize(sql)
+
+
+def tokenize_slow(sql):
+    # Disables the regex based fast path, so that only the character-by-character scanner runs
+    fast_scanner = Tokenizer._FAST_SCANNER
+    Tokenizer._FAST_SCANNER = None
+    try:
+        Tokenizer().tokenize(sql)
+    finally:
+        Tokenizer._FAST_SCANNER = fast_scanner
+
+
+print(f"{'Query':>10}{'fast (ms)':>15}{'slow (ms)':>15}{'speedup':>10}")
+
+for name, sql in {"tpch": tpch, "short": short, "long": long, "crazy": crazy}.items():
+    fast = min(timeit.repeat(lambda: tokenize(sql), number=20, repeat=5)) / 20 * 1000
+    slow = min(timeit.repeat(lambda: tokenize_slow(sql), number=20, repeat=5)) / 20 * 1000
+    print(f"{name:>10}{fast:>15.3f}{slow:>15.3f}{slow / fast:>9.1f}x")
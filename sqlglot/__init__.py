@@ -9,7 +9,7 @@ import typing as t
 from sqlglot import expressions as exp
 from sqlglot.dialects import Dialect, Dialects
 from sqlglot.diff import diff
-from sqlglot.errors import ErrorLevel, ParseError, TokenError, UnsupportedError
+from sqlglot.errors import ErrorLevel, ErrorRecord, ParseError, TokenError, UnsupportedError
 from sqlglot.expressions import Expression
 from sqlglot.expressions import alias_ as alias
 from sqlglot.expressions import (
@@ -40,7 +40,7 @@ schema = MappingSchema()
 
 
 def parse(
-    sql: str, read: t.Optional[str | Dialect] = None, **opts
+    sql: str, read: t.Optional[str | Dialect] = None, workers: t.Optional[int] = None, **opts
 ) -> t.List[t.Optional[Expression]]:
     """
     Parses the given SQL string into a collection of syntax trees, one per parsed SQL statement.
@@ -48,15 +48,75 @@ def parse(
     Args:
         sql: the SQL code string to parse.
         read: the SQL dialect to apply during parsing (eg. "spark", "hive", "presto", "mysql").
-        **opts: other options.
+        workers: if set, the statements are parsed by this many worker processes.
+            See `sqlglot.parallel`.
+        **opts: other options. With `error_level=ErrorLevel.RECOVER`, the recorded errors are only
+            available through `parse_recovering`.
 
     Returns:
         The resulting syntax tree collection.
     """
+    if workers and workers > 1:
+        from sqlglot import parallel
+
+        return parallel.parse(sql, read, workers=workers, **opts)
+
     dialect = Dialect.get_or_raise(read)()
     return dialect.parse(sql, **opts)
 
 
+def parse_recovering(
+    sql: str, read: t.Optional[str | Dialect] = None, **opts
+) -> t.Tuple[t.List[t.Optional[Expression]], t.List[ErrorRecord]]:
+    """
+    Parses the given SQL string with `ErrorLevel.RECOVER`, resuming after each error instead of
+    raising it. The clauses that couldn't be parsed are left out of the syntax trees, and so are the
+    statements that couldn't be parsed at all.
+
+    Example:
+        >>> expressions, errors = parse_recovering("SELECT a FROM x WHERE ) GROUP BY b")
+        >>> expressions[0].sql()
+        'SELECT a FROM x GROUP BY b'
+        >>> [(error.line, error.col) for error in errors]
+        [(1, 23)]
+
+    Args:
+        sql: the SQL code string to parse.
+        read: the SQL dialect to apply during parsing (eg. "spark", "hive", "presto", "mysql").
+        **opts: other options.
+
+    Returns:
+        The resulting syntax tree collection and the records of the errors that were found.
+    """
+    dialect = Dialect.get_or_raise(read)()
+    return dialect.parse_recovering(sql, **opts)
+
+
+def parse_iter(
+    source: str | t.IO, read: t.Optional[str | Dialect] = None, **opts
+) -> t.Iterator[t.Optional[Expression]]:
+    """
+    Lazily parses the given SQL string or file-like object, yielding one syntax tree per SQL statement.
+
+    The input is tokenized incrementally, so the memory used is bounded by the largest statement
+    instead of the whole script. This makes it suitable for huge scripts, e.g. database dumps.
+
+    Example:
+        >>> [e.sql() for e in parse_iter("SELECT 1; SELECT 2")]
+        ['SELECT 1', 'SELECT 2']
+
+    Args:
+        source: the SQL code string, or a text / binary file (or `mmap`) to read it from.
+        read: the SQL dialect to apply during parsing (eg. "spark", "hive", "presto", "mysql").
+        **opts: other options.
+
+    Returns:
+        An iterator over the resulting syntax trees.
+    """
+    dialect = Dialect.get_or_raise(read)()
+    return dialect.parse_iter(source, **opts)
+
+
 def parse_one(
     sql: str,
     read: t.Optional[str | Dialect] = None,
@@ -92,6 +152,7 @@ def transpile(
     write: t.Optional[str | Dialect] = None,
     identity: bool = True,
     error_level: t.Optional[ErrorLevel] = None,
+    workers: t.Optional[int] = None,
     **opts,
 ) -> t.List[str]:
     """
@@ -105,12 +166,22 @@ def transpile(
         identity: if set to `True` and if the target dialect is not specified the source dialect will be used as both:
             the source and the target dialect.
         error_level: the desired error level of the parser.
+        workers: if set, the statements are transpiled by this many worker processes.
+            See `sqlglot.parallel`.
         **opts: other options.
 
     Returns:
         The list of transpiled SQL statements.
     """
     write = write or read if identity else write
+
+    if workers and workers > 1:
+        from sqlglot import parallel
+
+        return parallel.transpile(
+            sql, read, write, workers=workers, error_level=error_level, **opts
+        )
+
     return [
         Dialect.get_or_raise(write)().generate(expression, **opts)
         for expression in parse(sql, read, error_level=error_level)
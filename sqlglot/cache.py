@@ -0,0 +1,595 @@
+"""
+A caching layer in front of `sqlglot.transpile` and `sqlglot.parse_one`.
+
+Applications that process the same statement texts over and over again can use the functions in
+this module as drop-in replacements for their top-level counterparts. The results are memoized in
+a bounded, thread-safe LRU cache that is keyed on the SQL text, the dialects and the options passed.
+
+Example:
+    >>> from sqlglot import cache
+    >>> cache.clear()
+    >>> cache.transpile("SELECT EPOCH_MS(1618088028295)", read="duckdb", write="hive")
+    ['SELECT FROM_UNIXTIME(1618088028295 / 1000)']
+    >>> cache.transpile("SELECT EPOCH_MS(1618088028295)", read="duckdb", write="hive")
+    ['SELECT FROM_UNIXTIME(1618088028295 / 1000)']
+    >>> cache.CACHE.hits, cache.CACHE.misses
+    (1, 1)
+
+Statements that only differ in their literals can share a template instead, which is keyed on their
+tokens with the literals left out, see `transpile_parameterized`:
+
+Example:
+    >>> cache.transpile_parameterized("SELECT * FROM t WHERE id = 123")
+    ['SELECT * FROM t WHERE id = 123']
+    >>> cache.transpile_parameterized("SELECT * FROM t WHERE id = 456")
+    ['SELECT * FROM t WHERE id = 456']
+    >>> cache.TEMPLATES.hit_rate
+    0.5
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import typing as t
+from collections import OrderedDict
+
+import sqlglot
+from sqlglot import expressions as exp
+from sqlglot.dialects.dialect import Dialect
+from sqlglot.errors import ErrorLevel
+from sqlglot.expressions import Expression
+from sqlglot.generator import Generator
+from sqlglot.parser import Parser
+from sqlglot.tokens import Token, TokenType
+
+T = t.TypeVar("T")
+
+
+class LRUCache:
+    """
+    A bounded, thread-safe least recently used cache.
+
+    Args:
+        size: the maximum number of entries to keep. When it's exceeded, the least recently
+            used entry is evicted.
+    """
+
+    def __init__(self, size: int = 1024) -> None:
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: t.Hashable, default: t.Any = None) -> t.Any:
+        """Returns the value cached under `key` and updates the hit/miss counters."""
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: t.Hashable, value: t.Any) -> None:
+        """Caches `value` under `key`, evicting the least recently used entries if needed."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.size:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes all entries from the cache and resets its counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __contains__(self, key: t.Hashable) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of the lookups that were hits."""
+        with self._lock:
+            hits, lookups = self.hits, self.hits + self.misses
+        return hits / lookups if lookups else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"LRUCache(size={self.size}, len={len(self)}, hits={self.hits}, misses={self.misses})"
+        )
+
+
+CACHE = LRUCache()
+
+_MISSING = object()
+
+
+def _cached(key: t.Tuple, compute: t.Callable[[], T]) -> T:
+    try:
+        hash(key)
+    except TypeError:
+        # Some of the options are unhashable, so we can't use them as part of the key
+        return compute()
+
+    result = CACHE.get(key, _MISSING)
+    if result is _MISSING:
+        result = compute()
+        CACHE.set(key, result)
+    return result
+
+
+def transpile(
+    sql: str,
+    read: t.Optional[str | Dialect] = None,
+    write: t.Optional[str | Dialect] = None,
+    identity: bool = True,
+    error_level: t.Optional[ErrorLevel] = None,
+    **opts,
+) -> t.List[str]:
+    """
+    Same as `sqlglot.transpile`, except that the results are looked up in `CACHE` first.
+
+    Note that parser warnings are only logged the first time a statement is transpiled.
+
+    Args:
+        sql: the SQL code string to transpile.
+        read: the source dialect used to parse the input string.
+        write: the target dialect into which the input should be transformed.
+        identity: if set to `True` and if the target dialect is not specified the source dialect
+            will be used as both: the source and the target dialect.
+        error_level: the desired error level of the parser.
+        **opts: other options.
+
+    Returns:
+        The list of transpiled SQL statements.
+    """
+    write = write or read if identity else write
+    key = ("transpile", sql, read, write, error_level, tuple(sorted(opts.items())))
+    return list(
+        _cached(
+            key,
+            lambda: tuple(
+                sqlglot.transpile(sql, read=read, write=write, error_level=error_level, **opts)
+            ),
+        )
+    )
+
+
+def parse_one(
+    sql: str,
+    read: t.Optional[str | Dialect] = None,
+    into: t.Optional[Expression | str] = None,
+    **opts,
+) -> t.Optional[Expression]:
+    """
+    Same as `sqlglot.parse_one`, except that the results are looked up in `CACHE` first.
+
+    A copy of the cached syntax tree is returned every time, so it can be safely mutated.
+
+    Args:
+        sql: the SQL code string to parse.
+        read: the SQL dialect to apply during parsing.
+        into: the SQLGlot Expression to parse into.
+        **opts: other options.
+
+    Returns:
+        The syntax tree for the first parsed statement.
+    """
+    key = ("parse_one", sql, read, into, tuple(sorted(opts.items())))
+    expression = _cached(key, lambda: sqlglot.parse_one(sql, read=read, into=into, **opts))
+    return expression.copy() if expression else expression
+
+
+TEMPLATES = LRUCache()
+
+# the keys of the statements that can't be parameterized, so they aren't tried again
+REJECTED = LRUCache()
+
+# The sentinel values of the parameterized literals, which are used to check that a statement can
+# be parameterized. The numbers are far apart, so that e.g. an index offset can't turn one into
+# another, and the strings are changed by any escaping or case conversion. The strings also contain
+# every time format element of the dialects involved, see `_formats`, so that they're changed by any
+# time format conversion as well.
+SENTINEL_NUMBER = 10**9
+SENTINEL_STEP = 1000
+SENTINEL_STRING = "\x00Sq'l\\{}\x00"
+
+DECIMAL_RE = re.compile(r"\d+\.\d+")
+
+# the names of the functions with custom builders or parsers, by parser class, see `_kinds`
+CUSTOM_FUNCTIONS: t.Dict[t.Type, t.Set[str]] = {}
+
+
+class Template:
+    """
+    The syntax trees of all the statements that only differ in their parameterized literals. Each of
+    these literals is replaced by an `exp.Placeholder`, named after its index, in `expressions`.
+
+    Args:
+        expressions: the syntax trees, with placeholders.
+        kinds: the kind of each parameter, i.e. "int", "decimal" or "string".
+        parts: the generated SQL of each statement, split at the parameters, which are the odd
+            elements. It's only set for templates that are used for transpiling.
+        generator: the generator of the literals in `parts`.
+    """
+
+    __slots__ = ("expressions", "kinds", "parts", "generator")
+
+    def __init__(
+        self,
+        expressions: t.List[t.Optional[Expression]],
+        kinds: t.List[str],
+        parts: t.Optional[t.List[t.List[t.Any]]] = None,
+        generator: t.Optional[Generator] = None,
+    ) -> None:
+        self.expressions = expressions
+        self.kinds = kinds
+        self.parts = parts
+        self.generator = generator
+
+    def bind(self, values: t.List[str]) -> t.List[t.Optional[Expression]]:
+        """Returns copies of the syntax trees, in which the placeholders are set to `values`."""
+        return _replace_placeholders(self.expressions, lambda i: _literal(self.kinds[i], values[i]))
+
+    def render(self, values: t.List[str]) -> t.List[str]:
+        """Returns the generated SQL of the statements, in which the parameters are set to `values`."""
+        assert self.parts is not None and self.generator is not None
+        literals = [
+            self.generator.sql(_literal(kind, value)) for kind, value in zip(self.kinds, values)
+        ]
+        return [
+            "".join(literals[part] if i % 2 else part for i, part in enumerate(parts))
+            for parts in self.parts
+        ]
+
+
+def parse_parameterized(
+    sql: str, read: t.Optional[str | Dialect] = None, **opts
+) -> t.List[t.Optional[Expression]]:
+    """
+    Same as `sqlglot.parse`, except that the syntax trees are looked up in `TEMPLATES` first, on
+    the tokens of `sql` with its literals left out. On a hit, the template's placeholders are set
+    to the literals of `sql` and parsing is skipped.
+
+    Args:
+        sql: the SQL code string to parse.
+        read: the SQL dialect to apply during parsing.
+        **opts: other options.
+
+    Returns:
+        The resulting syntax tree collection.
+    """
+    dialect = Dialect.get_or_raise(read)()
+    tokens = dialect.tokenizer.tokenize(sql)
+    shape, values = _parameterize(dialect, tokens)
+    key = _key("parse", read, tuple(sorted(opts.items())), shape)
+
+    template = TEMPLATES.get(key) if key else None
+    if template:
+        return template.bind(values)
+
+    expressions = dialect.parser(**opts).parse(tokens, sql)
+    if key and key not in REJECTED:
+        _set_template(key, _build_template(dialect, tokens, sql, opts, expressions))
+    return expressions
+
+
+def transpile_parameterized(
+    sql: str,
+    read: t.Optional[str | Dialect] = None,
+    write: t.Optional[str | Dialect] = None,
+    identity: bool = True,
+    error_level: t.Optional[ErrorLevel] = None,
+    **opts,
+) -> t.List[str]:
+    """
+    Same as `sqlglot.transpile`, except that the results are looked up in `TEMPLATES` first, on
+    the tokens of `sql` with its literals left out. On a hit, the literals of `sql` are generated
+    and put in place of the template's parameters, so both parsing and generation are skipped.
+
+    A template is only created if substituting the literals reproduces the results for a
+    different set of values, since the parser and the generator can depend on the value of some
+    literals, e.g. format strings. Statements that can't be parameterized are simply transpiled.
+    Note that parser warnings and unsupported messages are only logged when a template is created.
+
+    Args:
+        sql: the SQL code string to transpile.
+        read: the source dialect used to parse the input string.
+        write: the target dialect into which the input should be transformed.
+        identity: if set to `True` and if the target dialect is not specified the source dialect
+            will be used as both: the source and the target dialect.
+        error_level: the desired error level of the parser.
+        **opts: other options.
+
+    Returns:
+        The list of transpiled SQL statements.
+    """
+    write = write or read if identity else write
+    dialect = Dialect.get_or_raise(read)()
+    tokens = dialect.tokenizer.tokenize(sql)
+    shape, values = _parameterize(dialect, tokens)
+    key = _key("transpile", read, write, error_level, tuple(sorted(opts.items())), shape)
+
+    template = TEMPLATES.get(key) if key else None
+    if template:
+        return template.render(values)
+
+    expressions = dialect.parser(error_level=error_level).parse(tokens, sql)
+    write_dialect = Dialect.get_or_raise(write)()
+    sqls = [write_dialect.generate(expression, **opts) for expression in expressions]
+
+    if key and key not in REJECTED:
+        template = _build_template(dialect, tokens, sql, {"error_level": error_level}, expressions)
+        if template and not _set_parts(
+            template, write_dialect, write_dialect.generator(**opts), sqls, values
+        ):
+            template = None
+        _set_template(key, template)
+    return sqls
+
+
+def _key(*parts: t.Any) -> t.Optional[t.Tuple]:
+    # the shape is None when there's nothing to parameterize
+    if parts[-1] is None:
+        return None
+    try:
+        hash(parts)
+    except TypeError:
+        # Some of the options are unhashable, so we can't use them as part of the key
+        return None
+    return parts
+
+
+def _set_template(key: t.Tuple, template: t.Optional[Template]) -> None:
+    if template:
+        TEMPLATES.set(key, template)
+    else:
+        REJECTED.set(key, True)
+
+
+def _parameterize(
+    dialect: Dialect, tokens: t.List[Token]
+) -> t.Tuple[t.Optional[t.Tuple], t.List[str]]:
+    """
+    Returns the shape of `tokens`, i.e. their types, texts and comments except for the text of the
+    parameterized literals, and the text of these literals. The shape is None if `tokens` contains
+    no literals at all, since there's nothing to gain from a template then.
+    """
+    shape = []
+    values = []
+
+    for token, kind in zip(tokens, _kinds(dialect, tokens)):
+        if kind:
+            values.append(token.text)
+        shape.append((token.token_type, kind or token.text, tuple(token.comments)))
+
+    return (tuple(shape) if values else None), values
+
+
+def _kinds(dialect: Dialect, tokens: t.List[Token]) -> t.List[t.Optional[str]]:
+    """
+    Returns the kind of each token, or None if it's not parameterized. The literals within the
+    calls of functions that are built by custom code aren't parameterized, since the result can
+    depend on their values, e.g. Snowflake's TO_TIMESTAMP('12345') is a unix time conversion.
+    """
+    custom = _custom_functions(dialect)
+    kinds: t.List[t.Optional[str]] = []
+    # whether each open paren is the start of a call of such a function
+    calls = []
+    depth = 0
+
+    for i, token in enumerate(tokens):
+        if token.token_type == TokenType.L_PAREN:
+            previous = tokens[i - 1] if i else None
+            call = bool(
+                previous
+                and previous.token_type != TokenType.STRING
+                and previous.text.upper() in custom
+            )
+            calls.append(call)
+            depth += call
+        elif token.token_type == TokenType.R_PAREN and calls:
+            depth -= calls.pop()
+
+        kinds.append(None if depth else _kind(token))
+
+    return kinds
+
+
+def _custom_functions(dialect: Dialect) -> t.Set[str]:
+    parser_class = t.cast(t.Type[Parser], dialect.parser_class)
+    names = CUSTOM_FUNCTIONS.get(parser_class)
+
+    if names is None:
+        from_arg_list = exp.Func.from_arg_list.__func__  # type: ignore
+        names = {
+            name
+            for name, builder in parser_class.FUNCTIONS.items()
+            if getattr(builder, "__func__", None) is not from_arg_list
+        }
+        names.update(parser_class.FUNCTION_PARSERS)
+        CUSTOM_FUNCTIONS[parser_class] = names
+
+    return names
+
+
+def _kind(token: Token) -> t.Optional[str]:
+    if token.token_type == TokenType.STRING:
+        # empty strings are falsy, so they may be treated differently
+        return "string" if token.text else None
+    if token.token_type == TokenType.NUMBER:
+        if token.text.isdigit():
+            return "int"
+        if DECIMAL_RE.fullmatch(token.text):
+            return "decimal"
+    return None
+
+
+def _sentinel(kind: str, index: int, formats: str = "") -> str:
+    if kind == "string":
+        return SENTINEL_STRING.format(index) + formats
+    number = SENTINEL_NUMBER + SENTINEL_STEP * index
+    return str(number) if kind == "int" else f"{number}.5"
+
+
+def _formats(dialect: Dialect) -> str:
+    return "".join(sorted({**dialect.time_mapping, **(dialect.inverse_time_mapping or {})}))
+
+
+def _literal(kind: str, value: str) -> exp.Literal:
+    return exp.Literal(this=value, is_string=kind == "string")
+
+
+def _build_template(
+    dialect: Dialect,
+    tokens: t.List[Token],
+    sql: str,
+    opts: t.Dict[str, t.Any],
+    expressions: t.List[t.Optional[Expression]],
+) -> t.Optional[Template]:
+    """
+    Parses `tokens` again, with each parameterized literal replaced by a unique sentinel value, and
+    returns the resulting template if binding it to the original literals reproduces `expressions`.
+    """
+    kinds: t.List[str] = []
+    values = []
+    sentinel_tokens = []
+    formats = _formats(dialect)
+
+    for token, kind in zip(tokens, _kinds(dialect, tokens)):
+        if kind:
+            text = _sentinel(kind, len(kinds), formats)
+            kinds.append(kind)
+            values.append(token.text)
+            token = Token(token.token_type, text, token.line, token.col + len(text), token.comments)
+        sentinel_tokens.append(token)
+
+    sentinels = {(_sentinel(kind, i, formats), kind == "string"): i for i, kind in enumerate(kinds)}
+    found = set()
+
+    def placeholder(node: Expression) -> t.Optional[Expression]:
+        if isinstance(node, exp.Placeholder):
+            # named placeholders of the statement itself could be confused with the parameters
+            if node.name.isdigit():
+                raise ValueError(f"Unexpected placeholder {node.name}")
+        elif (node.this, node.is_string) in sentinels:
+            i = sentinels[(node.this, node.is_string)]
+            found.add(i)
+            return exp.Placeholder(this=str(i))
+        return None
+
+    try:
+        parsed = dialect.parser(**opts).parse(sentinel_tokens, sql)
+        template = Template(_replace_literals(parsed, placeholder), kinds)
+        if len(found) != len(kinds):
+            return None
+        if _structure(template.bind(values)) != _structure(expressions):
+            return None
+    except Exception:
+        return None
+
+    return template
+
+
+def _set_parts(
+    template: Template,
+    dialect: Dialect,
+    generator: Generator,
+    sqls: t.List[str],
+    values: t.List[str],
+) -> bool:
+    """
+    Sets the generated SQL of the template, split at its parameters, if rendering it with `values`
+    reproduces `sqls`. Returns whether the template can be rendered.
+    """
+    formats = _formats(dialect)
+    sentinels = [_sentinel(kind, i, formats) for i, kind in enumerate(template.kinds)]
+    sentinel_sqls = {
+        generator.sql(_literal(kind, sentinel)): i
+        for i, (kind, sentinel) in enumerate(zip(template.kinds, sentinels))
+    }
+    pattern = re.compile(f"({'|'.join(re.escape(sentinel) for sentinel in sentinel_sqls)})")
+
+    try:
+        parts = [
+            [
+                sentinel_sqls[part] if i % 2 else part
+                for i, part in enumerate(pattern.split(generator.generate(expression)))
+            ]
+            for expression in _replace_placeholders(
+                template.expressions, lambda i: _literal(template.kinds[i], sentinels[i])
+            )
+        ]
+    except Exception:
+        return False
+
+    template.parts = parts
+    template.generator = generator
+
+    if template.render(values) != sqls:
+        template.parts = None
+        template.generator = None
+        return False
+    return True
+
+
+def _replace_literals(
+    expressions: t.List[t.Optional[Expression]],
+    fun: t.Callable[[Expression], t.Any],
+) -> t.List[t.Optional[Expression]]:
+    """
+    Returns copies of `expressions`, in which every literal and placeholder is replaced by the
+    result of `fun`, unless that's falsy.
+    """
+    return [_copy(expression, fun) if expression else expression for expression in expressions]
+
+
+def _copy(expression: Expression, fun: t.Callable[[Expression], t.Any]) -> Expression:
+    copy = expression.copy()
+
+    for node in list(copy.find_all(exp.Literal, exp.Placeholder)):
+        new_node = fun(node)
+        if new_node:
+            copy = new_node if node is copy else copy
+            node.replace(new_node)
+
+    return copy
+
+
+def _replace_placeholders(
+    expressions: t.List[t.Optional[Expression]], fun: t.Callable[[int], Expression]
+) -> t.List[t.Optional[Expression]]:
+    return _replace_literals(
+        expressions,
+        lambda node: isinstance(node, exp.Placeholder)
+        and node.name.isdigit()
+        and fun(int(node.name)),
+    )
+
+
+def _structure(value: t.Any) -> t.Any:
+    if isinstance(value, Expression):
+        return (
+            value.__class__,
+            tuple((k, _structure(v)) for k, v in value.args.items()),
+            tuple(value.comments or ()),
+        )
+    if isinstance(value, list):
+        return tuple(_structure(v) for v in value)
+    return value
+
+
+def clear() -> None:
+    """Clears `CACHE`, `TEMPLATES` and `REJECTED`."""
+    CACHE.clear()
+    TEMPLATES.clear()
+    REJECTED.clear()
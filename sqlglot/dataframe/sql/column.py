@@ -234,7 +234,8 @@ class Column:
         if not isinstance(self.expression, exp.Case):
             return column_with_if
         new_column = self.copy()
-        new_column.expression.args["ifs"].extend(column_with_if.expression.args["ifs"])
+        for if_ in column_with_if.expression.args["ifs"]:
+            new_column.expression.append("ifs", if_)
         return new_column
 
     def otherwise(self, value: t.Any) -> Column:
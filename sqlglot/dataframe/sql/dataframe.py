@@ -712,7 +712,7 @@ class DataFrame:
         )
         if existing_col_index:
             expression = self.expression.copy()
-            expression.expressions[existing_col_index] = col.expression
+            expression.expressions[existing_col_index].replace(col.expression)
             return self.copy(expression=expression)
         return self.copy().select(col.alias(colName), append=True)
 
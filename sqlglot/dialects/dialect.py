@@ -4,6 +4,7 @@ import typing as t
 from enum import Enum
 
 from sqlglot import exp
+from sqlglot.errors import ErrorLevel
 from sqlglot.generator import Generator
 from sqlglot.helper import flatten, seq_get
 from sqlglot.parser import Parser
@@ -149,6 +150,15 @@ class Dialect(metaclass=_Dialect):
     def parse(self, sql, **opts):
         return self.parser(**opts).parse(self.tokenizer.tokenize(sql), sql)
 
+    def parse_recovering(self, sql, **opts):
+        parser = self.parser(**{**opts, "error_level": ErrorLevel.RECOVER})
+        return parser.parse(self.tokenizer.tokenize(sql), sql), parser.errors
+
+    def parse_iter(self, source, **opts):
+        parser = self.parser(**opts)
+        for tokens, sql, sql_start in self.tokenizer_class()._tokenize_iter(source):
+            yield parser.parse(tokens, sql, sql_start)[0]
+
     def parse_into(self, expression_type, sql, **opts):
         return self.parser(**opts).parse_into(expression_type, self.tokenizer.tokenize(sql), sql)
 
@@ -245,7 +255,7 @@ def no_paren_current_date_sql(self, expression):
 def no_recursive_cte_sql(self, expression):
     if expression.args.get("recursive"):
         self.unsupported("Recursive CTEs are unsupported")
-        expression.args["recursive"] = False
+        expression.set("recursive", False)
     return self.with_sql(expression)
 
 
@@ -203,8 +203,8 @@ class MySQL(Dialect):
 
         STATEMENT_PARSERS = {
             **parser.Parser.STATEMENT_PARSERS,  # type: ignore
-            TokenType.SHOW: lambda self: self._parse_show(),
-            TokenType.SET: lambda self: self._parse_set(),
+            TokenType.SHOW: parser.ParserMethod("_parse_show"),
+            TokenType.SET: parser.ParserMethod("_parse_set"),
         }
 
         SHOW_PARSERS = {
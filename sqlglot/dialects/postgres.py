@@ -37,7 +37,7 @@ def _date_add_sql(kind):
             self.unsupported("Cannot add non literal")
 
         expression = expression.copy()
-        expression.args["is_string"] = True
+        expression.set("is_string", True)
         expression = self.sql(expression)
         return f"{this} {kind} INTERVAL {expression} {unit}"
 
@@ -124,7 +124,7 @@ def _auto_increment_to_serial(expression):
 
     if auto:
         expression = expression.copy()
-        expression.args["constraints"].remove(auto.parent)
+        expression.find(exp.AutoIncrementColumnConstraint).parent.pop()
         kind = expression.args["kind"]
 
         if kind.this == exp.DataType.Type.INT:
@@ -86,7 +86,8 @@ def _schema_sql(self, expression):
     for schema in expression.parent.find_all(exp.Schema):
         if isinstance(schema.parent, exp.Property):
             expression = expression.copy()
-            expression.expressions.extend(schema.expressions)
+            for column in schema.expressions:
+                expression.append("expressions", column.copy())
 
     return self.schema_sql(expression)
 
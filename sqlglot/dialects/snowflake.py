@@ -180,7 +180,7 @@ class Snowflake(Dialect):
 
         PROPERTY_PARSERS = {
             **parser.Parser.PROPERTY_PARSERS,
-            TokenType.PARTITION_BY: lambda self: self._parse_partitioned_by(),
+            TokenType.PARTITION_BY: parser.ParserMethod("_parse_partitioned_by"),
         }
 
     class Tokenizer(tokens.Tokenizer):
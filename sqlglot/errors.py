@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import typing as t
+from dataclasses import dataclass
 from enum import auto
 
 from sqlglot.helper import AutoName
@@ -11,6 +12,7 @@ class ErrorLevel(AutoName):
     WARN = auto()  # Log any parser errors with ERROR level
     RAISE = auto()  # Collect all parser errors and raise a single exception
     IMMEDIATE = auto()  # Immediately raise an exception on the first parser error
+    RECOVER = auto()  # Record parser errors and resume parsing after each, see parse_recovering
 
 
 class SqlglotError(Exception):
@@ -58,6 +60,29 @@ class ParseError(SqlglotError):
         )
 
 
+@dataclass(frozen=True)
+class ErrorRecord:
+    """
+    A parser error that was recorded with ErrorLevel.RECOVER. Unlike a ParseError, it doesn't
+    include a message with the context of the error, which can be built from its location if needed.
+
+    Attributes:
+        description: the description of the error.
+        statement: the index of the statement in which the error occurred, i.e. of the chunk of
+            tokens between semicolons.
+        index: the index of the offending token in the tokens of the statement, or of the
+            parser's position if the error wasn't raised at its current or previous token.
+        line: the line of the offending token.
+        col: the column of the offending token.
+    """
+
+    description: str
+    statement: int
+    index: int
+    line: int
+    col: int
+
+
 class TokenError(SqlglotError):
     pass
 
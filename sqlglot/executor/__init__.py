@@ -3,7 +3,9 @@ import time
 
 from sqlglot import maybe_parse
 from sqlglot.errors import ExecuteError
+from sqlglot.executor.columnar import ColumnarExecutor
 from sqlglot.executor.python import PythonExecutor
+from sqlglot.executor.streaming import StreamingExecutor
 from sqlglot.executor.table import Table, ensure_tables
 from sqlglot.optimizer import optimize
 from sqlglot.planner import Plan
@@ -11,8 +13,14 @@ from sqlglot.schema import ensure_schema
 
 logger = logging.getLogger("sqlglot")
 
+ENGINES = {
+    "python": PythonExecutor,
+    "columnar": ColumnarExecutor,
+    "streaming": StreamingExecutor,
+}
 
-def execute(sql, schema=None, read=None, tables=None):
+
+def execute(sql, schema=None, read=None, tables=None, engine="python", workers=None):
     """
     Run a sql query against data.
 
@@ -27,9 +35,18 @@ def execute(sql, schema=None, read=None, tables=None):
         read (str): the SQL dialect to apply during parsing
             (eg. "spark", "hive", "presto", "mysql").
         tables (dict): additional tables to register.
+        engine (str): the engine used to run the plan, either "python", which processes one row
+            at a time, "columnar", which processes batches of column vectors, or "streaming",
+            which pulls batches of rows through the plan and only materializes pipeline breakers.
+        workers (int): if set, independent steps of the plan run concurrently on a thread pool
+            with this many workers. This only speeds up the steps that wait on I/O, e.g. reading
+            files, since the GIL lets only one of them run Python code at a time.
     Returns:
         sqlglot.executor.Table: Simple columnar data structure.
     """
+    if engine not in ENGINES:
+        raise ExecuteError(f"Unknown engine '{engine}'")
+
     tables = ensure_tables(tables)
     if not schema:
         schema = {
@@ -47,6 +64,6 @@ def execute(sql, schema=None, read=None, tables=None):
     plan = Plan(expression)
     logger.debug("Logical Plan: %s", plan)
     now = time.time()
-    result = PythonExecutor(tables=tables).execute(plan)
+    result = ENGINES[engine](tables=tables, workers=workers).execute(plan)
     logger.debug("Query finished: %f", time.time() - now)
     return result
@@ -0,0 +1,411 @@
+from __future__ import annotations
+
+import collections
+import heapq
+import itertools
+import math
+import typing as t
+
+from sqlglot import exp
+from sqlglot.executor.loader import load_csv
+from sqlglot.executor.python import PythonExecutor
+from sqlglot.executor.table import Table
+
+Vector = t.List[t.Any]
+Scope = t.Dict[t.Optional[str], "ColumnarTable"]
+
+
+class ColumnarTable:
+    """
+    A table that stores its data as one vector (list) per column instead of one tuple per row.
+
+    Args:
+        columns: the names of the columns.
+        vectors: the values of each column, in the same order as `columns`.
+        length: the number of rows, only needed when the table doesn't have any columns.
+    """
+
+    def __init__(
+        self,
+        columns: t.Iterable[str],
+        vectors: t.Optional[t.List[Vector]] = None,
+        length: int = 0,
+    ) -> None:
+        self.columns = tuple(columns)
+        self.vectors = vectors if vectors is not None else [[] for _ in self.columns]
+        assert len(self.vectors) == len(self.columns)
+        self.length = len(self.vectors[0]) if self.vectors else length
+        self.index = {column: i for i, column in enumerate(self.columns)}
+
+    @classmethod
+    def from_rows(cls, columns: t.Iterable[str], rows: t.Sequence[t.Tuple]) -> ColumnarTable:
+        columns = tuple(columns)
+        if not rows:
+            return cls(columns)
+        return cls(columns, [list(vector) for vector in zip(*rows)], length=len(rows))
+
+    @classmethod
+    def from_table(cls, table: Table) -> ColumnarTable:
+        return cls.from_rows(table.columns, table.rows)
+
+    def to_table(self) -> Table:
+        return Table(self.columns, self.rows)
+
+    @property
+    def rows(self) -> t.List[t.Tuple]:
+        if not self.vectors:
+            return [() for _ in range(self.length)]
+        return list(zip(*self.vectors))
+
+    def extend(self, vectors: t.Sequence[Vector]) -> None:
+        for vector, values in zip(self.vectors, vectors):
+            vector.extend(values)
+        self.length = len(self.vectors[0]) if self.vectors else self.length
+
+    def take(self, indices: t.Sequence[t.Optional[int]]) -> ColumnarTable:
+        """Gathers the rows at `indices` into a new table, a `None` index produces a row of nulls."""
+        if None in indices:
+            vectors = [
+                [None if i is None else vector[i] for i in indices] for vector in self.vectors
+            ]
+        else:
+            vectors = [[vector[i] for i in indices] for vector in self.vectors]  # type: ignore
+        return ColumnarTable(self.columns, vectors, length=len(indices))
+
+    def slice(self, start: int, end: int) -> ColumnarTable:
+        vectors = [vector[start:end] for vector in self.vectors]
+        return ColumnarTable(self.columns, vectors, length=max(min(end, self.length) - start, 0))
+
+    def hstack(self, other: ColumnarTable) -> ColumnarTable:
+        """Returns a table with the columns of both tables, the columns of `other` take precedence."""
+        return ColumnarTable(
+            self.columns + other.columns, self.vectors + other.vectors, length=self.length
+        )
+
+    def __getitem__(self, column: str) -> Vector:
+        return self.vectors[self.index[column]]
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __repr__(self) -> str:
+        return repr(self.to_table())
+
+
+class ColumnarContext:
+    def __init__(self, tables: Scope) -> None:
+        self.tables = tables
+
+    def __contains__(self, table: t.Optional[str]) -> bool:
+        return table in self.tables
+
+
+def _map_scope(scope: Scope, func: t.Callable[[ColumnarTable], ColumnarTable]) -> Scope:
+    # multiple names can point to the same table, so we make sure to only process it once
+    mapped: t.Dict[int, ColumnarTable] = {}
+    result = {}
+    for name, table in scope.items():
+        if id(table) not in mapped:
+            mapped[id(table)] = func(table)
+        result[name] = mapped[id(table)]
+    return result
+
+
+def _take(scope: Scope, indices: t.Sequence[t.Optional[int]]) -> Scope:
+    return _map_scope(scope, lambda table: table.take(indices))
+
+
+def _truthy(vector: Vector) -> t.List[int]:
+    return [i for i, value in enumerate(vector) if value]
+
+
+class ColumnarExecutor(PythonExecutor):
+    """
+    An executor that runs the steps of a plan over column vectors instead of row tuples.
+
+    Every expression of a step is compiled into a list comprehension that loops over the vectors
+    of the columns it references, so each Python call processes up to `batch_size` values.
+    """
+
+    def __init__(self, env=None, tables=None, workers=None, batch_size=10000):
+        super().__init__(env=env, tables=tables, workers=workers)
+        self.batch_size = batch_size
+
+    def execute(self, plan):
+        return super().execute(plan).to_table()
+
+    def context(self, tables):
+        return ColumnarContext(tables)
+
+    def copy_tables(self, tables):
+        # columnar tables are never modified in place, so they can be shared between steps
+        return tables
+
+    def vectorize(self, expressions, aggregate=False):
+        """
+        Compile SQL expressions into a Python function that evaluates them over column vectors.
+
+        The returned function takes a scope, which maps table names to `ColumnarTable`s, and the
+        number of rows to process. It returns a tuple with one vector per expression. If
+        `aggregate` is set, column references evaluate to whole vectors and the function returns a
+        tuple with one value per expression instead.
+        """
+        if not expressions:
+            return None
+
+        columns: t.Dict[t.Tuple[t.Optional[str], str], str] = {}
+
+        def to_var(node):
+            if isinstance(node, exp.Column):
+                key = (node.text("table") or None, node.name)
+                if key not in columns:
+                    columns[key] = f"_c{len(columns)}"
+                return exp.Var(this=columns[key])
+            return node
+
+        expressions = [expression.transform(to_var) for expression in expressions]
+
+        with self._lock:
+            codes = [self.generator.generate(expression) for expression in expressions]
+        names = list(columns.values())
+        args = ", ".join(["_n", *names])
+
+        if aggregate:
+            body = "".join(f"{code}, " for code in codes)
+        else:
+            if not names:
+                loop = "for _ in range(_n)"
+            elif len(names) == 1:
+                loop = f"for {names[0]} in {names[0]}"
+            else:
+                loop = f"for {', '.join(names)} in zip({', '.join(names)})"
+            body = "".join(f"[{code} {loop}], " for code in codes)
+
+        func = eval(f"lambda {args}: ({body})", self.env)
+
+        def evaluate(scope: Scope, length: int) -> t.Tuple:
+            if not length and not aggregate:
+                # empty tables don't necessarily know their columns
+                return tuple([] for _ in codes)
+            return func(length, *(scope[table][name] for table, name in columns))
+
+        return evaluate
+
+    def scan(self, step, context):
+        source = step.source
+
+        if source and isinstance(source, exp.Expression):
+            source = source.name or source.alias
+
+        condition = self.vectorize([step.condition] if step.condition else None)
+        projections = self.vectorize(step.projections)
+
+        if source is None:
+            name, scope = None, {None: ColumnarTable((), length=1)}
+        elif source in context:
+            if not projections and not condition:
+                return self.context({step.name: context.tables[source]})
+            name, scope = source, context.tables
+        elif isinstance(step.source, exp.Table) and isinstance(step.source.this, exp.ReadCSV):
+            name = step.source.alias
+            scope = {name: self.scan_csv(step)}
+        else:
+            name = step.source.alias_or_name
+            scope = {name: ColumnarTable.from_table(self.tables.find(step.source))}
+
+        table = scope[name]
+        sink = ColumnarTable(
+            [e.alias_or_name for e in step.projections] if projections else table.columns
+        )
+
+        for start in range(0, len(table), self.batch_size):
+            if len(sink) >= step.limit:
+                break
+
+            batch = _map_scope(scope, lambda table: table.slice(start, start + self.batch_size))
+            length = len(batch[name])
+
+            if condition:
+                indices = _truthy(condition(batch, length)[0])
+                batch = _take(batch, indices)
+                length = len(indices)
+
+            vectors = projections(batch, length) if projections else batch[name].vectors
+            remaining = step.limit - len(sink)
+
+            if length > remaining:
+                vectors = [vector[: int(remaining)] for vector in vectors]
+            sink.extend(vectors)
+
+        return self.context({step.name: sink})
+
+    def scan_csv(self, step):
+        source = step.source.this
+        args = iter(arg.name for arg in source.expressions)
+        delimiter = dict(zip(args, args)).get("delimiter", ",")
+        return ColumnarTable.from_table(load_csv(source.name, delimiter=delimiter))
+
+    def join(self, step, context):
+        source = step.name
+        scope = {source: context.tables[source]}
+        length = len(scope[source])
+
+        for name, join in step.joins.items():
+            table = context.tables[name]
+
+            if join.get("source_key"):
+                source_indices, join_indices = self.hash_join(join, scope, {name: table})
+            else:
+                source_indices, join_indices = self.nested_loop_join(join, scope, {name: table})
+
+            scope = _take(scope, source_indices)
+            scope[name] = table.take(join_indices)
+            length = len(source_indices)
+
+            condition = self.vectorize([join["condition"]] if join["condition"] else None)
+            if condition:
+                indices = _truthy(condition(scope, length)[0])
+                scope = _take(scope, indices)
+                length = len(indices)
+
+        condition = self.vectorize([step.condition] if step.condition else None)
+        projections = self.vectorize(step.projections)
+
+        if not condition and not projections:
+            return self.context(scope)
+
+        if condition:
+            indices = _truthy(condition(scope, length)[0])
+            scope = _take(scope, indices)
+            length = len(indices)
+
+        if length > step.limit:
+            scope = _map_scope(scope, lambda table: table.slice(0, int(step.limit)))
+            length = int(step.limit)
+
+        if projections:
+            sink = ColumnarTable(
+                [e.alias_or_name for e in step.projections], list(projections(scope, length))
+            )
+            return self.context({step.name: sink})
+        return self.context(scope)
+
+    def nested_loop_join(self, _join, source_scope, join_scope):
+        a = range(len(next(iter(source_scope.values()))))
+        b = range(len(next(iter(join_scope.values()))))
+        return [i for i in a for _ in b], [j for _ in a for j in b]
+
+    def hash_join(self, join, source_scope, join_scope):
+        source_key = self.vectorize(join["source_key"])
+        join_key = self.vectorize(join["join_key"])
+        left = join.get("side") == "LEFT"
+        right = join.get("side") == "RIGHT"
+
+        source_length = len(next(iter(source_scope.values())))
+        join_length = len(next(iter(join_scope.values())))
+
+        results = collections.defaultdict(lambda: ([], []))
+
+        for i, key in enumerate(zip(*source_key(source_scope, source_length))):
+            results[key][0].append(i)
+        for i, key in enumerate(zip(*join_key(join_scope, join_length))):
+            results[key][1].append(i)
+
+        source_indices: t.List[t.Optional[int]] = []
+        join_indices: t.List[t.Optional[int]] = []
+        nulls = [None]
+
+        for a_group, b_group in results.values():
+            if left:
+                b_group = b_group or nulls
+            elif right:
+                a_group = a_group or nulls
+
+            for a, b in itertools.product(a_group, b_group):
+                source_indices.append(a)
+                join_indices.append(b)
+
+        return source_indices, join_indices
+
+    def aggregate(self, step, context):
+        scope = dict(context.tables)
+        length = len(next(iter(scope.values())))
+
+        operands = self.vectorize(step.operands)
+
+        if operands:
+            scope[None] = ColumnarTable(
+                [e.alias_or_name for e in step.operands], list(operands(scope, length))
+            )
+
+        group_by = self.vectorize(list(step.group.values()))
+        aggregations = self.vectorize(step.aggregations, aggregate=True)
+        condition = self.vectorize([step.condition] if step.condition else None, aggregate=True)
+
+        groups: t.Dict[t.Tuple, t.List[int]] = {}
+        keys = zip(*group_by(scope, length)) if group_by else itertools.repeat((), length)
+
+        for i, key in enumerate(keys):
+            if key in groups:
+                groups[key].append(i)
+            else:
+                groups[key] = [i]
+
+        table = ColumnarTable([*step.group, *(e.alias_or_name for e in step.aggregations)])
+
+        for key in sorted(groups) if len(groups) > 1 else groups:
+            if len(table) >= step.limit:
+                break
+
+            indices = groups[key]
+            group = scope if len(indices) == length else _take(scope, indices)
+
+            if condition and not condition(group, len(indices))[0]:
+                continue
+
+            values = aggregations(group, len(indices)) if aggregations else ()
+            table.extend([[value] for value in key + values])
+
+        if not length and step.limit > 0 and not group_by:
+            values = aggregations(scope, 0) if aggregations else ()
+            table.extend([[value] for value in values])
+
+        context = self.context({step.name: table, **{name: table for name in scope}})
+
+        if step.projections:
+            return self.scan(step, context)
+        return context
+
+    def sort(self, step, context):
+        length = len(next(iter(context.tables.values())))
+        projection_columns = [p.alias_or_name for p in step.projections]
+        projections = ColumnarTable(
+            projection_columns, list(self.vectorize(step.projections)(context.tables, length))
+        )
+
+        scope = _map_scope(context.tables, lambda table: table.hstack(projections))
+        scope[None] = next(iter(scope.values()))
+
+        keys = list(zip(*self.vectorize(step.key)(scope, length)))
+
+        if math.isinf(step.limit):
+            indices = sorted(range(length), key=keys.__getitem__)
+        else:
+            indices = heapq.nsmallest(step.limit, range(length), key=keys.__getitem__)
+
+        return self.context({step.name: projections.take(indices)})
+
+    def set_operation(self, step, context):
+        left = context.tables[step.left]
+        right = context.tables[step.right]
+
+        if issubclass(step.op, exp.Intersect):
+            rows = list(set(left.rows).intersection(set(right.rows)))
+        elif issubclass(step.op, exp.Except):
+            rows = list(set(left.rows).difference(set(right.rows)))
+        elif issubclass(step.op, exp.Union) and step.distinct:
+            rows = list(set(left.rows).union(set(right.rows)))
+        else:
+            rows = left.rows + right.rows
+
+        return self.context({step.name: ColumnarTable.from_rows(left.columns, rows)})
@@ -1,5 +1,7 @@
+import abc
 import datetime
 import inspect
+import math
 import re
 import statistics
 from functools import wraps
@@ -124,6 +126,138 @@ def interval(this, unit):
     raise NotImplementedError
 
 
+class Accumulator(abc.ABC):
+    """
+    Incrementally computes an aggregate function, one value at a time.
+
+    Null values are ignored, like in the corresponding functions of `ENV`.
+    """
+
+    def __init__(self):
+        self.value = None
+
+    @abc.abstractmethod
+    def update(self, value):
+        """Adds a value to the aggregate."""
+
+    @abc.abstractmethod
+    def combine(self, other):
+        """Adds the values of another accumulator of the same kind, e.g. for other rows."""
+
+    def result(self):
+        return self.value
+
+
+class SumAccumulator(Accumulator):
+    def update(self, value):
+        if value is not None:
+            self.value = value if self.value is None else self.value + value
+
+    def combine(self, other):
+        self.update(other.value)
+
+
+class MinAccumulator(Accumulator):
+    def update(self, value):
+        if value is not None and (self.value is None or value < self.value):
+            self.value = value
+
+    def combine(self, other):
+        self.update(other.value)
+
+
+class MaxAccumulator(Accumulator):
+    def update(self, value):
+        if value is not None and (self.value is None or value > self.value):
+            self.value = value
+
+    def combine(self, other):
+        self.update(other.value)
+
+
+class CountAccumulator(Accumulator):
+    def __init__(self):
+        self.value = 0
+
+    def update(self, value):
+        if value is not None:
+            self.value += 1
+
+    def combine(self, other):
+        self.value += other.value
+
+
+class AvgAccumulator(Accumulator):
+    """
+    Computes the same result as `statistics.fmean`, i.e. the correctly rounded sum of the values
+    divided by their count, by keeping the sum without any rounding error.
+    """
+
+    def __init__(self):
+        # small integers are summed exactly as they are, other values as non-overlapping floats,
+        # except for infinities and NaNs
+        self.integers = 0
+        self.partials = []
+        self.special = 0.0
+        self.count = 0
+
+    def update(self, value):
+        if value is None:
+            return
+        if type(value) is int and -MAX_EXACT_INT <= value <= MAX_EXACT_INT:
+            self.integers += value
+        else:
+            value = float(value)
+            if math.isfinite(value):
+                _add_exact(self.partials, value)
+            else:
+                self.special += value
+        self.count += 1
+
+    def combine(self, other):
+        self.integers += other.integers
+        for partial in other.partials:
+            _add_exact(self.partials, partial)
+        self.special += other.special
+        self.count += other.count
+
+    def result(self):
+        if not self.count:
+            return None
+        if self.special:
+            return self.special / self.count
+
+        partials = list(self.partials)
+        integers = self.integers
+        while integers:
+            partial = float(integers)
+            partials.append(partial)
+            integers -= int(partial)
+        return math.fsum(partials) / self.count
+
+
+# the largest integer whose magnitude can be converted to a float without rounding
+MAX_EXACT_INT = 2**53
+
+
+def _add_exact(partials, x):
+    """
+    Adds a finite float to a sum that's kept as a list of non-overlapping floats, without rounding.
+    This is the algorithm that `math.fsum` is based on, by Shewchuk.
+    """
+    i = 0
+    for y in partials:
+        if abs(x) < abs(y):
+            x, y = y, x
+        hi = x + y
+        lo = y - (hi - x)
+        if lo:
+            partials[i] = lo
+            i += 1
+        x = hi
+    partials[i:] = [x]
+
+
 ENV = {
     "exp": exp,
     # aggs
@@ -173,3 +307,11 @@ ENV = {
     "SUBSTRING": substring,
     "UPPER": null_if_any(lambda arg: arg.upper()),
 }
+
+ACCUMULATORS = {
+    "AVG": AvgAccumulator,
+    "COUNT": CountAccumulator,
+    "MAX": MaxAccumulator,
+    "MIN": MinAccumulator,
+    "SUM": SumAccumulator,
+}
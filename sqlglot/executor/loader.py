@@ -0,0 +1,323 @@
+"""
+Bulk loading of tables for the executor.
+
+`load_csv` reads a whole CSV file into a `Table`. Plain files are memory-mapped and split into
+chunks at line boundaries, which can be parsed by multiple worker processes. Column types are
+inferred once per file from its first row and converted a column at a time.
+
+`save_table` and `load_table` persist a `Table` to a compact binary columnar file, so that re-runs
+over the same data can skip parsing entirely:
+
+Example:
+    >>> import os, tempfile
+    >>> from sqlglot.executor.table import Table
+    >>> path = os.path.join(tempfile.mkdtemp(), "t.bin")
+    >>> save_table(Table(["a", "b"], [(1, "x"), (2, "y")]), path)
+    >>> table = load_table(path)
+    >>> table.columns, table.rows
+    (('a', 'b'), [(1, 'x'), (2, 'y')])
+"""
+
+from __future__ import annotations
+
+import ast
+import csv
+import gc
+import gzip
+import io
+import itertools
+import json
+import mmap
+import os
+import struct
+import sys
+import typing as t
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from sqlglot.errors import ExecuteError
+from sqlglot.executor.table import Table
+
+MAGIC = b"SQLGLOT\x01"
+HEADER_SIZE = struct.Struct("<I")
+
+# the types of the values that are stored as JSON, which are loaded back with the same types
+JSON_TYPES = {type(None), bool, int, float, str}
+
+# the default number of bytes parsed at a time
+CHUNK_SIZE = 1 << 22
+
+# the inferred column types of each file, keyed on its path, size, modification time and delimiter
+TYPES: t.Dict[t.Tuple, t.Tuple[type, ...]] = {}
+
+
+def load_csv(
+    file_name: str,
+    delimiter: str = ",",
+    workers: t.Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+    binary_file: t.Optional[str] = None,
+) -> Table:
+    """
+    Loads a CSV file, whose first line contains the column names, into a `Table`.
+
+    Args:
+        file_name: the path of the file, which may be compressed as gzip.
+        delimiter: the field delimiter.
+        workers: the number of worker processes used to parse the chunks of the file.
+            By default, the chunks are parsed in the current process.
+        chunk_size: the approximate number of bytes in each chunk.
+        binary_file: if set, the table is loaded from this binary file when it was saved from the
+            same version of the CSV file with the same options. Otherwise, the CSV file is parsed
+            and the result is saved to it.
+
+    Returns:
+        The loaded table.
+    """
+    if binary_file:
+        stat = os.stat(file_name)
+        key = [os.path.abspath(file_name), stat.st_size, stat.st_mtime_ns, delimiter]
+
+        if os.path.exists(binary_file):
+            table = _load_table(binary_file, key)
+            if table is not None:
+                return table
+
+        table = load_csv(file_name, delimiter=delimiter, workers=workers, chunk_size=chunk_size)
+        _save_table(table, binary_file, key)
+        return table
+
+    with open(file_name, "rb") as f:
+        gzipped = f.read(2) == b"\x1f\x8b"
+        f.seek(0)
+
+        if gzipped:
+            with gzip.open(f) as g:
+                return _load_csv(file_name, g.read(), delimiter, workers, chunk_size)
+
+        if not os.fstat(f.fileno()).st_size:
+            return Table(())
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return _load_csv(file_name, data, delimiter, workers, chunk_size)
+
+
+def _load_csv(
+    file_name: str,
+    data: bytes | mmap.mmap,
+    delimiter: str,
+    workers: t.Optional[int],
+    chunk_size: int,
+) -> Table:
+    header_end = _line_end(data, 0)
+    columns = next(csv.reader([_decode(data[0:header_end])], delimiter=delimiter), [])
+    first_row_end = _line_end(data, header_end)
+    first_row = next(csv.reader([_decode(data[header_end:first_row_end])], delimiter=delimiter), [])
+
+    if not first_row:
+        return Table(columns)
+
+    stat = os.stat(file_name)
+    key = (os.path.abspath(file_name), stat.st_size, stat.st_mtime_ns, delimiter)
+    if key not in TYPES:
+        TYPES[key] = infer_types(first_row)
+    types = TYPES[key]
+
+    if len(types) != len(columns):
+        raise ExecuteError(f"Expected {len(columns)} values in the first row of '{file_name}'")
+
+    # quoted values may contain line breaks, so files with quotes can't be split at any line
+    quoted = data.find(b'"', header_end) >= 0
+    bounds = [header_end, len(data)]
+    if not quoted:
+        bounds = [header_end]
+        while bounds[-1] < len(data):
+            bounds.append(_line_end(data, min(bounds[-1] + chunk_size, len(data)) - 1))
+
+    chunks = [data[start:end] for start, end in zip(bounds, bounds[1:])]
+    args = (itertools.repeat(delimiter), itertools.repeat(types), itertools.repeat(quoted))
+
+    # the collector would repeatedly traverse the millions of objects that are created here
+    gc_enabled = gc.isenabled()
+    gc.disable()
+
+    try:
+        if workers and workers > 1 and len(chunks) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                parsed = list(pool.map(_parse_chunk, chunks, *args))
+        else:
+            parsed = list(map(_parse_chunk, chunks, *args))
+
+        vectors = [list(itertools.chain.from_iterable(v)) for v in zip(*parsed)]
+        return Table(columns, list(zip(*vectors)))
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def _line_end(data: bytes | mmap.mmap, start: int) -> int:
+    end = data.find(b"\n", start)
+    return len(data) if end < 0 else end + 1
+
+
+def _decode(data: bytes) -> str:
+    return data.decode("utf-8").rstrip("\r\n")
+
+
+def _parse_chunk(
+    data: bytes, delimiter: str, types: t.Tuple[type, ...], quoted: bool
+) -> t.List[t.List]:
+    text = data.decode("utf-8")
+
+    if quoted or "\r" in text:
+        rows = [
+            row for row in csv.reader(io.StringIO(text, newline=""), delimiter=delimiter) if row
+        ]
+    else:
+        rows = [line.split(delimiter) for line in text.split("\n") if line]
+
+    if not rows:
+        return [[] for _ in types]
+
+    for row in rows:
+        if len(row) != len(types):
+            raise ExecuteError(
+                f"Expected {len(types)} values but got {len(row)} in row {delimiter.join(row)!r}"
+            )
+    return [
+        list(values) if type_ is str else list(map(type_, values))
+        for type_, values in zip(types, zip(*rows))
+    ]
+
+
+def infer_types(row: t.Sequence[str]) -> t.Tuple[type, ...]:
+    """Infers the type of each value of a CSV row, falling back to `str`."""
+    types = []
+    for v in row:
+        try:
+            types.append(type(ast.literal_eval(v)))
+        except (ValueError, SyntaxError):
+            types.append(str)
+    return tuple(types)
+
+
+def save_table(table: Table, file_name: str) -> None:
+    """
+    Saves a table to a binary columnar file.
+
+    Integer and float columns are stored as packed arrays, string columns as their UTF-8 encoded
+    values, separated by NUL characters. Columns with mixed types, including NULLs, or booleans are
+    stored as JSON arrays, so only these types of values are supported.
+
+    Args:
+        table: the table to save.
+        file_name: the path of the file.
+    """
+    _save_table(table, file_name)
+
+
+def _save_table(table: Table, file_name: str, key: t.Optional[t.List] = None) -> None:
+    vectors = []
+    buffers: t.List[bytes] = []
+
+    for values in zip(*table.rows) if table.rows else [() for _ in table.columns]:
+        kind, column_buffers = _encode(values)
+        vectors.append([kind, [len(buffer) for buffer in column_buffers]])
+        buffers.extend(column_buffers)
+
+    header = json.dumps(
+        {
+            "columns": table.columns,
+            "length": len(table.rows),
+            "byteorder": sys.byteorder,
+            "vectors": vectors,
+            "key": key,
+        }
+    ).encode("utf-8")
+
+    with open(file_name, "wb") as f:
+        f.write(MAGIC)
+        f.write(HEADER_SIZE.pack(len(header)))
+        f.write(header)
+        for buffer in buffers:
+            f.write(buffer)
+
+
+def load_table(file_name: str) -> Table:
+    """
+    Loads a table that was saved with `save_table`.
+
+    Args:
+        file_name: the path of the file.
+
+    Returns:
+        The loaded table.
+    """
+    return t.cast(Table, _load_table(file_name))
+
+
+def _load_table(file_name: str, key: t.Optional[t.List] = None) -> t.Optional[Table]:
+    """Loads a table like `load_table`, unless it was saved with a different key."""
+    with open(file_name, "rb") as f:
+        data = f.read()
+
+    if not data.startswith(MAGIC):
+        raise ExecuteError(f"'{file_name}' is not a table file")
+
+    offset = len(MAGIC) + HEADER_SIZE.size
+    (size,) = HEADER_SIZE.unpack_from(data, len(MAGIC))
+    header = json.loads(data[offset : offset + size])
+    offset += size
+
+    if key is not None and header.get("key") != key:
+        return None
+
+    swap = header["byteorder"] != sys.byteorder
+    columns = header["columns"]
+    length = header["length"]
+    vectors = []
+
+    for kind, sizes in header["vectors"]:
+        buffers = []
+        for buffer_size in sizes:
+            buffers.append(data[offset : offset + buffer_size])
+            offset += buffer_size
+        vectors.append(_decode_vector(kind, buffers, swap, length))
+
+    return Table(columns, list(zip(*vectors)) if columns else [() for _ in range(length)])
+
+
+def _encode(values: t.Sequence) -> t.Tuple[str, t.List[bytes]]:
+    types = set(map(type, values))
+
+    if types == {int}:
+        try:
+            return "q", [array("q", values).tobytes()]
+        except OverflowError:
+            pass
+    elif types == {float}:
+        return "d", [array("d", values).tobytes()]
+    elif types == {str}:
+        joined = "\0".join(values)
+        # the values are separated by NUL characters, unless they contain some themselves
+        if joined.count("\0") == len(values) - 1:
+            return "s", [joined.encode("utf-8")]
+
+    unsupported = types - JSON_TYPES
+    if unsupported:
+        names = ", ".join(sorted(type_.__name__ for type_ in unsupported))
+        raise ExecuteError(f"Can't save values of type {names}")
+    return "j", [json.dumps(list(values)).encode("utf-8")]
+
+
+def _decode_vector(kind: str, buffers: t.List[bytes], swap: bool, length: int) -> t.List:
+    if kind == "j":
+        return json.loads(buffers[0])
+    if kind == "s":
+        return buffers[0].decode("utf-8").split("\0") if length else []
+
+    vector = array(kind)
+    vector.frombytes(buffers[0])
+    if swap:
+        vector.byteswap()
+    return vector.tolist()
@@ -1,24 +1,63 @@
-import ast
+import bisect
 import collections
-import itertools
+import heapq
+import logging
 import math
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 from sqlglot import exp, generator, planner, tokens
 from sqlglot.dialects.dialect import Dialect, inline_array_sql
 from sqlglot.errors import ExecuteError
 from sqlglot.executor.context import Context
-from sqlglot.executor.env import ENV
+from sqlglot.executor.env import ACCUMULATORS, ENV
+from sqlglot.executor.loader import infer_types
 from sqlglot.executor.table import RowReader, Table
 from sqlglot.helper import csv_reader, subclasses
 
+logger = logging.getLogger("sqlglot")
+
 
 class PythonExecutor:
-    def __init__(self, env=None, tables=None):
+    # the minimum number of rows for which grouped aggregations use a hash table instead of sorting
+    HASH_AGGREGATE_THRESHOLD = 1000
+    # the size ratio between the sides of a range join above which the smaller side is indexed
+    # and probed with binary searches, instead of sorting and merging both sides
+    INDEX_JOIN_RATIO = 8
+
+    def __init__(self, env=None, tables=None, workers=None):
         self.generator = Python().generator(identify=True, comments=False)
         self.env = {**ENV, **(env or {})}
         self.tables = tables or {}
+        self.workers = workers
+        self.timings = {}
+        self._lock = threading.Lock()
 
     def execute(self, plan):
+        """
+        Execute the steps of a plan, starting from its leaves.
+
+        If `workers` is set, independent steps (e.g. the two sides of a join) run concurrently on
+        a thread pool of that size. The wall time of each step is recorded in `timings`.
+
+        Only one thread runs Python code at a time because of the GIL, so the steps that are
+        CPU-bound, like most of them, don't finish any sooner. The pool helps with the steps that
+        wait, e.g. on reading files in `scan_csv` or on functions of `env` that do I/O or release
+        the GIL. Processes aren't used instead because the tables would have to be pickled between
+        the steps, and the functions of `env` may not be picklable at all.
+        """
+        self.timings = {}
+
+        if self.workers:
+            contexts = self._execute_parallel(plan)
+        else:
+            contexts = self._execute_serial(plan)
+
+        root = plan.root
+        return contexts[root].tables[root.name]
+
+    def _execute_serial(self, plan):
         running = set()
         finished = set()
         queue = set(plan.leaves)
@@ -26,51 +65,121 @@ class PythonExecutor:
 
         while queue:
             node = queue.pop()
-            try:
-                context = self.context(
-                    {
-                        name: table
-                        for dep in node.dependencies
-                        for name, table in contexts[dep].tables.items()
-                    }
-                )
-                running.add(node)
-
-                if isinstance(node, planner.Scan):
-                    contexts[node] = self.scan(node, context)
-                elif isinstance(node, planner.Aggregate):
-                    contexts[node] = self.aggregate(node, context)
-                elif isinstance(node, planner.Join):
-                    contexts[node] = self.join(node, context)
-                elif isinstance(node, planner.Sort):
-                    contexts[node] = self.sort(node, context)
-                elif isinstance(node, planner.SetOperation):
-                    contexts[node] = self.set_operation(node, context)
-                else:
-                    raise NotImplementedError
+            running.add(node)
+            contexts[node] = self.run_step(node, self.step_context(node, contexts))
+            running.remove(node)
+            finished.add(node)
 
-                running.remove(node)
-                finished.add(node)
+            for dep in node.dependents:
+                if dep not in running and all(d in contexts for d in dep.dependencies):
+                    queue.add(dep)
 
-                for dep in node.dependents:
-                    if dep not in running and all(d in contexts for d in dep.dependencies):
-                        queue.add(dep)
+            self._free(node, contexts, finished)
 
-                for dep in node.dependencies:
-                    if all(d in finished for d in dep.dependents):
-                        contexts.pop(dep)
-            except Exception as e:
-                raise ExecuteError(f"Step '{node.id}' failed: {e}") from e
+        return contexts
 
-        root = plan.root
-        return contexts[root].tables[root.name]
+    def _execute_parallel(self, plan):
+        scheduled = set()
+        finished = set()
+        contexts = {}
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = {}
+
+            def schedule(node):
+                context = self.step_context(node, contexts, shared=True)
+                futures[pool.submit(self.run_step, node, context)] = node
+                scheduled.add(node)
+
+            for node in plan.leaves:
+                schedule(node)
+
+            try:
+                while futures:
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+
+                    for future in done:
+                        node = futures.pop(future)
+                        contexts[node] = future.result()
+                        finished.add(node)
+
+                        for dep in node.dependents:
+                            if dep not in scheduled and all(
+                                d in contexts for d in dep.dependencies
+                            ):
+                                schedule(dep)
+
+                        self._free(node, contexts, finished)
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
+
+        return contexts
+
+    def _free(self, node, contexts, finished):
+        for dep in node.dependencies:
+            if dep in contexts and all(d in finished for d in dep.dependents):
+                contexts.pop(dep)
+
+    def step_context(self, node, contexts, shared=False):
+        """
+        Create the context of a step out of the tables produced by its dependencies.
+
+        If `shared` is set, the tables of dependencies with multiple dependents are copied, so
+        that the dependents can safely consume them at the same time.
+        """
+        tables = {}
+
+        for dep in node.dependencies:
+            if shared and len(dep.dependents) > 1:
+                tables.update(self.copy_tables(contexts[dep].tables))
+            else:
+                tables.update(contexts[dep].tables)
+
+        return self.context(tables)
+
+    def copy_tables(self, tables):
+        rows = {}
+        copies = {}
+
+        for name, table in tables.items():
+            if id(table.rows) not in rows:
+                rows[id(table.rows)] = list(table.rows)
+            copies[name] = Table(table.columns, rows[id(table.rows)], table.column_range)
+
+        return copies
+
+    def run_step(self, node, context):
+        start = time.perf_counter()
+
+        try:
+            if isinstance(node, planner.Scan):
+                result = self.scan(node, context)
+            elif isinstance(node, planner.Aggregate):
+                result = self.aggregate(node, context)
+            elif isinstance(node, planner.Join):
+                result = self.join(node, context)
+            elif isinstance(node, planner.Sort):
+                result = self.sort(node, context)
+            elif isinstance(node, planner.SetOperation):
+                result = self.set_operation(node, context)
+            else:
+                raise NotImplementedError
+        except Exception as e:
+            raise ExecuteError(f"Step '{node.id}' failed: {e}") from e
+
+        self.timings[node] = time.perf_counter() - start
+        logger.debug("Step '%s' finished: %f", node.id, self.timings[node])
+        return result
 
     def generate(self, expression):
         """Convert a SQL expression into literal Python code and compile it into bytecode."""
         if not expression:
             return None
 
-        sql = self.generator.generate(expression)
+        with self._lock:
+            sql = self.generator.generate(expression)
         return compile(sql, sql, "eval", optimize=2)
 
     def generate_tuple(self, expressions):
@@ -79,6 +188,64 @@ class PythonExecutor:
             return tuple()
         return tuple(self.generate(expression) for expression in expressions)
 
+    def compile_select(self, step, tables):
+        """
+        Compile the condition and the projections of a step into a single Python function, which
+        takes an iterable of rows and a limit and returns the selected (projected) rows.
+
+        The column references are resolved to row indices once, using the readers of `tables`,
+        so the rows are evaluated inline instead of through a `Context`. Returns None if some
+        column can't be resolved that way.
+        """
+        expressions = [step.condition, *step.projections]
+
+        if any(expression and expression.find(exp.Lambda) for expression in expressions):
+            return None
+
+        indices = {name: table.reader.columns for name, table in tables.items()}
+        unresolved = []
+
+        def resolve(node):
+            if isinstance(node, exp.Column):
+                index = indices.get(node.table, {}).get(node.name)
+                if index is None:
+                    unresolved.append(node)
+                    return node
+                return exp.Var(this=f"row[{index}]")
+            return node
+
+        with self._lock:
+            condition, *projections = [
+                self.generator.generate(expression.transform(resolve)) if expression else None
+                for expression in expressions
+            ]
+
+        if unresolved:
+            return None
+
+        lines = [
+            "def select(rows, limit):",
+            "    sink = []",
+            "    if limit <= 0:",
+            "        return sink",
+            "    append = sink.append",
+            "    for row in rows:",
+        ]
+        if condition:
+            lines.append(f"        if not ({condition}):")
+            lines.append("            continue")
+        lines.append(
+            f"        append(({', '.join(projections)},))" if projections else "        append(row)"
+        )
+        lines.append("        if len(sink) >= limit:")
+        lines.append("            break")
+        lines.append("    return sink")
+
+        source = "\n".join(lines)
+        env = dict(self.env)
+        exec(compile(source, f"<step {step.id}>", "exec", optimize=2), env)
+        return env["select"]
+
     def context(self, tables):
         return Context(tables, env=self.env)
 
@@ -99,21 +266,35 @@ class PythonExecutor:
 
         if source is None:
             context, table_iter = self.static()
+            tables, rows = {}, [()]
         elif source in context:
             if not projections and not condition:
                 return self.context({step.name: context.tables[source]})
             table_iter = context.table_iter(source)
+            tables = {source: context.tables[source]}
+            rows = tables[source].rows
         elif isinstance(step.source, exp.Table) and isinstance(step.source.this, exp.ReadCSV):
             table_iter = self.scan_csv(step)
             context = next(table_iter)
+            tables = context.tables
+            # the rows of the file are read lazily
+            rows = (reader.row for reader in table_iter)
         else:
             context, table_iter = self.scan_table(step)
+            tables = context.tables
+            rows = context.table.rows
 
         if projections:
             sink = self.table(step.projections)
         else:
             sink = self.table(context.columns)
 
+        select = self.compile_select(step, tables)
+
+        if select:
+            sink.rows = select(rows, step.limit)
+            return self.context({step.name: sink})
+
         for reader in table_iter:
             if len(sink) >= step.limit:
                 break
@@ -133,6 +314,8 @@ class PythonExecutor:
 
     def scan_table(self, step):
         table = self.tables.find(step.source)
+        # use a separate reader, the same table can be scanned by multiple steps at the same time
+        table = Table(table.columns, table.rows, table.column_range)
         context = self.context({step.source.alias_or_name: table})
         return context, iter(table)
 
@@ -145,15 +328,11 @@ class PythonExecutor:
             table = Table(columns)
             context = self.context({alias: table})
             yield context
-            types = []
+            types = None
 
             for row in reader:
-                if not types:
-                    for v in row:
-                        try:
-                            types.append(type(ast.literal_eval(v)))
-                        except (ValueError, SyntaxError):
-                            types.append(str)
+                if types is None:
+                    types = infer_types(row)
                 context.set_row(tuple(t(v) for t, v in zip(types, row)))
                 yield context.table.reader
 
@@ -170,8 +349,16 @@ class PythonExecutor:
             column_ranges[name] = range(start, len(table.columns) + start)
             join_context = self.context({name: table})
 
+            range_key = not join.get("side") and _range_key(name, join["condition"])
+
             if join.get("source_key"):
                 table = self.hash_join(join, source_context, join_context)
+            elif range_key:
+                sizes = sorted((len(source_context.table), len(table)))
+                if sizes[0] * self.INDEX_JOIN_RATIO <= sizes[1]:
+                    table = self.index_join(range_key, source_context, join_context)
+                else:
+                    table = self.merge_join(range_key, source_context, join_context)
             else:
                 table = self.nested_loop_join(join, source_context, join_context)
 
@@ -192,18 +379,22 @@ class PythonExecutor:
             return source_context
 
         sink = self.table(step.projections if projections else source_context.columns)
+        select = self.compile_select(step, source_context.tables)
 
-        for reader, ctx in source_context:
-            if condition and not ctx.eval(condition):
-                continue
+        if select:
+            sink.rows = select(source_context.table.rows, step.limit)
+        else:
+            for reader, ctx in source_context:
+                if condition and not ctx.eval(condition):
+                    continue
 
-            if projections:
-                sink.append(ctx.eval_tuple(projections))
-            else:
-                sink.append(reader.row)
+                if projections:
+                    sink.append(ctx.eval_tuple(projections))
+                else:
+                    sink.append(reader.row)
 
-            if len(sink) >= step.limit:
-                break
+                if len(sink) >= step.limit:
+                    break
 
         if projections:
             return self.context({step.name: sink})
@@ -229,27 +420,121 @@ class PythonExecutor:
         join_key = self.generate_tuple(join["join_key"])
         left = join.get("side") == "LEFT"
         right = join.get("side") == "RIGHT"
+        source_nulls = (None,) * len(source_context.columns)
+        join_nulls = (None,) * len(join_context.columns)
+        rows = []
+
+        # build the hash table on the smaller side and probe it with the rows of the larger one
+        if len(join_context.table) <= len(source_context.table):
+            index = self._hash_index(join_context, join_key)
+            matched = set()
+
+            for reader, ctx in source_context:
+                key = ctx.eval_tuple(source_key)
+                if key in index:
+                    a_row = reader.row
+                    rows.extend(a_row + b_row for b_row in index[key])
+                    matched.add(key)
+                elif left:
+                    rows.append(reader.row + join_nulls)
+
+            if right:
+                for key, b_rows in index.items():
+                    if key not in matched:
+                        rows.extend(source_nulls + b_row for b_row in b_rows)
+        else:
+            index = self._hash_index(source_context, source_key)
+            matched = set()
+
+            for reader, ctx in join_context:
+                key = ctx.eval_tuple(join_key)
+                if key in index:
+                    b_row = reader.row
+                    rows.extend(a_row + b_row for a_row in index[key])
+                    matched.add(key)
+                elif right:
+                    rows.append(source_nulls + reader.row)
 
-        results = collections.defaultdict(lambda: ([], []))
+            if left:
+                for key, a_rows in index.items():
+                    if key not in matched:
+                        rows.extend(a_row + join_nulls for a_row in a_rows)
 
-        for reader, ctx in source_context:
-            results[ctx.eval_tuple(source_key)][0].append(reader.row)
-        for reader, ctx in join_context:
-            results[ctx.eval_tuple(join_key)][1].append(reader.row)
+        return Table(source_context.columns + join_context.columns, rows)
 
-        table = Table(source_context.columns + join_context.columns)
-        nulls = [(None,) * len(join_context.columns if left else source_context.columns)]
+    def _hash_index(self, context, key):
+        index = collections.defaultdict(list)
+        for reader, ctx in context:
+            index[ctx.eval_tuple(key)].append(reader.row)
+        return index
+
+    def index_join(self, range_key, source_context, join_context):
+        """
+        Join the rows that satisfy the comparison `range_key` by looking them up in a sorted index,
+        which is built once on the smaller side and probed with a binary search for each row of the
+        larger side.
+        """
+        source_key, op, join_key = range_key
+        rows = []
+
+        if len(join_context.table) <= len(source_context.table):
+            index = self._sorted_index(join_context, join_key)
+            keys = [key for key, _ in index]
+            b_rows = [row for _, row in index]
+
+            for key, a_row in self._keyed_rows(source_context, source_key):
+                start, end = _range_bounds(keys, key, op)
+                rows.extend(a_row + b_row for b_row in b_rows[start:end])
+        else:
+            index = self._sorted_index(source_context, source_key)
+            keys = [key for key, _ in index]
+            a_rows = [row for _, row in index]
+
+            for key, b_row in self._keyed_rows(join_context, join_key):
+                start, end = _range_bounds(keys, key, FLIPPED_RANGE_OPS[op])
+                rows.extend(a_row + b_row for a_row in a_rows[start:end])
+
+        return Table(source_context.columns + join_context.columns, rows)
+
+    def merge_join(self, range_key, source_context, join_context):
+        """
+        Join the rows that satisfy the comparison `range_key` by sorting both sides on their keys
+        and merging them. As the source keys increase, the matching join rows are a prefix or a
+        suffix of the sorted join rows whose bound only moves forward.
+        """
+        source_key, op, join_key = range_key
+        a_rows = self._sorted_index(source_context, source_key)
+        b_rows = self._sorted_index(join_context, join_key)
+        b_keys = [key for key, _ in b_rows]
+        inclusive = op in (">=", "<=")
+        prefix = op in (">", ">=")
+        rows = []
+        i = 0
+
+        for key, a_row in a_rows:
+            if prefix:
+                while i < len(b_keys) and (b_keys[i] <= key if inclusive else b_keys[i] < key):
+                    i += 1
+                matches = b_rows[:i]
+            else:
+                while i < len(b_keys) and (b_keys[i] < key if inclusive else b_keys[i] <= key):
+                    i += 1
+                matches = b_rows[i:]
 
-        for a_group, b_group in results.values():
-            if left:
-                b_group = b_group or nulls
-            elif right:
-                a_group = a_group or nulls
+            rows.extend(a_row + b_row for _, b_row in matches)
 
-            for a_row, b_row in itertools.product(a_group, b_group):
-                table.append(a_row + b_row)
+        return Table(source_context.columns + join_context.columns, rows)
 
-        return table
+    def _keyed_rows(self, context, key):
+        code = self.generate(key)
+        for reader, ctx in context:
+            value = ctx.eval(code)
+            # comparisons with NULL are never true
+            if value is not None:
+                yield value, reader.row
+
+    def _sorted_index(self, context, key):
+        return sorted(self._keyed_rows(context, key), key=lambda item: item[0])
 
     def aggregate(self, step, context):
         group_by = self.generate_tuple(step.group.values())
@@ -281,6 +566,12 @@ class PythonExecutor:
                 }
             )
 
+        if group_by and len(context.table) >= self.HASH_AGGREGATE_THRESHOLD:
+            accumulators = self._accumulators(step)
+            if accumulators is not None:
+                table = self.hash_aggregate(step, context, group_by, accumulators)
+                return self._aggregated(step, context, table)
+
         context.sort(group_by)
 
         group = None
@@ -314,37 +605,139 @@ class PythonExecutor:
             context.set_range(0, 0)
             table.append(context.eval_tuple(aggregations))
 
+        return self._aggregated(step, context, table)
+
+    def _aggregated(self, step, context, table):
         context = self.context({step.name: table, **{name: table for name in context.tables}})
 
         if step.projections:
             return self.scan(step, context)
         return context
 
+    def _accumulators(self, step):
+        """
+        Map each aggregate function of an Aggregate step to the accumulator that computes it.
+
+        Returns None if some aggregation can't be computed incrementally, e.g. because it uses a
+        function without an accumulator or references a column outside of an aggregate function.
+        """
+        accumulators = {}
+
+        for expression in [*step.aggregations, step.condition]:
+            if not expression:
+                continue
+
+            for node in expression.find_all(exp.AggFunc, exp.Column):
+                if isinstance(node, exp.Column):
+                    if not isinstance(node.parent, exp.AggFunc):
+                        return None
+                    continue
+
+                name = node.key.upper()
+                if (
+                    name not in ACCUMULATORS
+                    or self.env.get(name) is not ENV[name]
+                    or not isinstance(node.this, exp.Column)
+                ):
+                    return None
+                accumulators.setdefault(node, ACCUMULATORS[name])
+
+        return accumulators
+
+    def hash_aggregate(self, step, context, group_by, accumulators):
+        """
+        Aggregate the rows of a context in a single pass, by updating the accumulators of the
+        group each row belongs to in a hash table. The groups are emitted in key order, so the
+        result is the same as the one of the sort-based aggregation.
+        """
+        names = {agg: f"_h{i}" for i, agg in enumerate(accumulators)}
+        factories = tuple(accumulators.values())
+        groups = {}
+
+        # evaluate the group key and the arguments of all the accumulators with a single eval
+        with self._lock:
+            key_sql = "".join(f"{self.generator.generate(e)}, " for e in step.group.values())
+            args_sql = "".join(f"{self.generator.generate(agg.this)}, " for agg in accumulators)
+        sql = f"(({key_sql}), ({args_sql}))"
+        code = compile(sql, sql, "eval", optimize=2)
+
+        for _, ctx in context:
+            key, arguments = ctx.eval(code)
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = tuple(factory() for factory in factories)
+            for accumulator, value in zip(group, arguments):
+                accumulator.update(value)
+
+        def replace_aggs(node):
+            if node in names:
+                return exp.column(names[node], quoted=True)
+            return node
+
+        aggregations = self.generate_tuple(
+            [expression.transform(replace_aggs) for expression in step.aggregations]
+        )
+        condition = step.condition and self.generate(step.condition.transform(replace_aggs))
+
+        results = self.table([*step.group, *names.values()])
+        for key in sorted(groups) if len(groups) > 1 else groups:
+            results.append(key + tuple(accumulator.result() for accumulator in groups[key]))
+
+        table = self.table(list(step.group) + step.aggregations)
+        results_context = self.context({None: results})
+
+        for reader, ctx in results_context:
+            if len(table) >= step.limit:
+                break
+            if condition and not ctx.eval(condition):
+                continue
+            table.append(reader.row[: len(group_by)] + ctx.eval_tuple(aggregations))
+
+        return table
+
     def sort(self, step, context):
         projections = self.generate_tuple(step.projections)
         projection_columns = [p.alias_or_name for p in step.projections]
         all_columns = list(context.columns) + projection_columns
         sink = self.table(all_columns)
-        for reader, ctx in context:
-            sink.append(reader.row + ctx.eval_tuple(projections))
-
         sort_ctx = self.context(
             {
                 None: sink,
                 **{table: sink for table in context.tables},
             }
         )
-        sort_ctx.sort(self.generate_tuple(step.key))
+        key = self.generate_tuple(step.key)
 
-        if not math.isinf(step.limit):
-            sort_ctx.table.rows = sort_ctx.table.rows[0 : step.limit]
+        if math.isinf(step.limit):
+            for reader, ctx in context:
+                sink.append(reader.row + ctx.eval_tuple(projections))
+            sort_ctx.sort(key)
+            rows = sort_ctx.table.rows
+        else:
+            rows = self.top_n(context, projections, sort_ctx, key, step.limit)
 
         output = Table(
             projection_columns,
-            rows=[r[len(context.columns) : len(all_columns)] for r in sort_ctx.table.rows],
+            rows=[r[len(context.columns) : len(all_columns)] for r in rows],
         )
         return self.context({step.name: output})
 
+    def top_n(self, context, projections, sort_ctx, key, n):
+        """
+        Returns the first `n` rows of `context` in the order given by `key`, only keeping `n`
+        rows and their projections in memory at any time. DESC keys are wrapped in `reverse_key`
+        by the generated code, so the rows can always be selected in ascending key order.
+        """
+
+        def keyed_rows():
+            for reader, ctx in context:
+                row = reader.row + ctx.eval_tuple(projections)
+                sort_ctx.set_row(row)
+                yield sort_ctx.eval_tuple(key), row
+
+        # nsmallest is stable, so ties keep their input order just like a full sort
+        return [row for _, row in heapq.nsmallest(n, keyed_rows(), key=lambda item: item[0])]
+
     def set_operation(self, step, context):
         left = context.tables[step.left]
         right = context.tables[step.right]
@@ -363,6 +756,47 @@ class PythonExecutor:
         return self.context({step.name: sink})
 
 
+RANGE_OPS = {exp.GT: ">", exp.GTE: ">=", exp.LT: "<", exp.LTE: "<="}
+FLIPPED_RANGE_OPS = {">": "<", ">=": "<=", "<": ">", "<=": ">="}
+
+
+def _range_key(name, condition):
+    """
+    Find a comparison in a join condition between an expression of the joined table `name` and an
+    expression of the source tables. Returns a tuple of (source expression, op, join expression).
+    """
+    if not condition:
+        return None
+
+    for predicate in condition.flatten() if isinstance(condition, exp.And) else (condition,):
+        op = RANGE_OPS.get(type(predicate))
+        if not op:
+            continue
+
+        left_tables = set(exp.column_table_names(predicate.this))
+        right_tables = set(exp.column_table_names(predicate.expression))
+        if not left_tables or not right_tables:
+            continue
+
+        # each side must be evaluable on its own, so the join side can only reference `name`
+        if right_tables == {name} and name not in left_tables:
+            return predicate.this, op, predicate.expression
+        if left_tables == {name} and name not in right_tables:
+            return predicate.expression, FLIPPED_RANGE_OPS[op], predicate.this
+    return None
+
+
+def _range_bounds(keys, key, op):
+    """Return the slice of the sorted `keys` k for which `key op k` holds."""
+    if op == ">":
+        return 0, bisect.bisect_left(keys, key)
+    if op == ">=":
+        return 0, bisect.bisect_right(keys, key)
+    if op == "<":
+        return bisect.bisect_right(keys, key), len(keys)
+    return bisect.bisect_left(keys, key), len(keys)
+
+
 def _ordered_py(self, expression):
     this = self.sql(expression, "this")
     desc = "True" if expression.args.get("desc") else "False"
@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import collections
+import itertools
+
+from sqlglot import exp, planner
+from sqlglot.errors import ExecuteError
+from sqlglot.executor.python import PythonExecutor
+from sqlglot.executor.table import Table
+
+
+class StreamingExecutor(PythonExecutor):
+    """
+    A pull-based executor that streams batches of rows between steps.
+
+    Scans, filters, projections and join probes are chained generators, so rows flow from the
+    sources to the root of the plan as they are needed. This means that a limit stops reading
+    its sources early and that memory stays bounded for large inputs. Only pipeline breakers,
+    i.e. aggregations, sorts, set operations other than UNION ALL and steps that feed multiple
+    dependents, materialize their results.
+
+    A stream is a pair of templates, which are empty tables describing the columns of each table
+    name in scope, and an iterator over batches of full-width rows.
+    """
+
+    def __init__(self, env=None, tables=None, workers=None, batch_size=1024):
+        super().__init__(env=env, tables=tables, workers=workers)
+        self.batch_size = batch_size
+        self._materialized = {}
+
+    def execute(self, plan):
+        self.timings = {}
+        self._materialized = {}
+        root = plan.root
+        return self.materialize(root).tables[root.name]
+
+    def materialize(self, step):
+        """Run `step` to completion and return its context."""
+        if step in self._materialized:
+            entry = self._materialized[step]
+            entry[1] -= 1
+            if not entry[1]:
+                self._materialized.pop(step)
+            return self.context(self.copy_tables(entry[0].tables))
+
+        if self._is_streamable(step):
+            templates, batches = self._stream(step)
+            rows = [row for batch in batches for row in batch]
+            context = self.context(
+                {
+                    name: Table(template.columns, rows, template.column_range)
+                    for name, template in templates.items()
+                }
+            )
+        else:
+            context = self.run_step(
+                step,
+                self.context(
+                    {
+                        name: table
+                        for dep in step.dependencies
+                        for name, table in self.materialize(dep).tables.items()
+                    }
+                ),
+            )
+
+        if len(step.dependents) > 1:
+            self._materialized[step] = [context, len(step.dependents) - 1]
+            return self.context(self.copy_tables(context.tables))
+        return context
+
+    def stream(self, step):
+        """Return a stream over the output of `step`, materializing it if it can't be streamed."""
+        if len(step.dependents) > 1 or not self._is_streamable(step):
+            context = self.materialize(step)
+            templates = {
+                name: Table(table.columns, None, table.column_range)
+                for name, table in context.tables.items()
+            }
+            rows = context.table.rows
+            return templates, (
+                rows[i : i + self.batch_size] for i in range(0, len(rows), self.batch_size)
+            )
+        return self._stream(step)
+
+    def _is_streamable(self, step):
+        if isinstance(step, planner.SetOperation):
+            return issubclass(step.op, exp.Union) and not step.distinct
+        return isinstance(step, (planner.Scan, planner.Join))
+
+    def _stream(self, step):
+        if isinstance(step, planner.Scan):
+            templates, batches = self.stream_scan(step)
+        elif isinstance(step, planner.Join):
+            templates, batches = self.stream_join(step)
+        else:
+            templates, batches = self.stream_union_all(step)
+        return templates, self._guard(step, batches)
+
+    def _guard(self, step, batches):
+        try:
+            yield from batches
+        except ExecuteError:
+            raise
+        except Exception as e:
+            raise ExecuteError(f"Step '{step.id}' failed: {e}") from e
+
+    def batch_context(self, templates, rows):
+        return self.context(
+            {
+                name: Table(template.columns, rows, template.column_range)
+                for name, template in templates.items()
+            }
+        )
+
+    def batches(self, rows):
+        rows = iter(rows)
+        batch = list(itertools.islice(rows, self.batch_size))
+        while batch:
+            yield batch
+            batch = list(itertools.islice(rows, self.batch_size))
+
+    def stream_scan(self, step):
+        source = step.source
+
+        if source and isinstance(source, exp.Expression):
+            source = source.name or source.alias
+
+        dependency = next((dep for dep in step.dependencies if dep.name == source), None)
+
+        if source is None:
+            templates, batches = {None: Table(())}, iter([[()]])
+        elif dependency:
+            templates, batches = self.stream(dependency)
+            if not step.projections and not step.condition:
+                return {step.name: templates[source]}, batches
+        elif isinstance(step.source, exp.Table) and isinstance(step.source.this, exp.ReadCSV):
+            table_iter = self.scan_csv(step)
+            templates = next(table_iter).tables
+            batches = self.batches(reader.row for reader in table_iter)
+        else:
+            table = self.tables.find(step.source)
+            templates = {step.source.alias_or_name: Table(table.columns, None, table.column_range)}
+            batches = self.batches(table.rows)
+
+        return self._select(step, templates, batches)
+
+    def stream_join(self, step):
+        dependencies = {dep.name: dep for dep in step.dependencies}
+        source = step.name
+        templates, batches = self.stream(dependencies[source])
+        templates = {source: templates[source]}
+        columns = templates[source].columns
+        column_ranges = {source: range(0, len(columns))}
+
+        for name, join in step.joins.items():
+            table = self.materialize(dependencies[name]).tables[name]
+            start = max(r.stop for r in column_ranges.values())
+            column_ranges[name] = range(start, len(table.columns) + start)
+
+            batches = self._probe(join, templates, batches, name, table)
+            columns = columns + table.columns
+            templates = {
+                name: Table(columns, None, column_range)
+                for name, column_range in column_ranges.items()
+            }
+
+            condition = self.generate(join["condition"])
+            if condition:
+                batches = self._filter(templates, batches, condition)
+
+        return self._select(step, templates, batches, passthrough=True)
+
+    def _probe(self, join, templates, batches, name, table):
+        """Join each batch with `table`, which is the build side of the join."""
+        source_key = self.generate_tuple(join.get("source_key"))
+        join_key = self.generate_tuple(join.get("join_key"))
+        left = join.get("side") == "LEFT"
+        right = join.get("side") == "RIGHT"
+
+        if not source_key:
+            for batch in batches:
+                yield [a + b for a in batch for b in table.rows]
+            return
+
+        index = collections.defaultdict(list)
+        for reader, ctx in self.context({name: table}):
+            index[ctx.eval_tuple(join_key)].append(reader.row)
+
+        matched = set()
+        nulls = (None,) * len(table.columns)
+
+        for batch in batches:
+            rows = []
+            ctx = self.batch_context(templates, batch)
+
+            for reader, _ in ctx:
+                key = ctx.eval_tuple(source_key)
+                if key in index:
+                    rows.extend(reader.row + b for b in index[key])
+                    matched.add(key)
+                elif left:
+                    rows.append(reader.row + nulls)
+
+            yield rows
+
+        if right:
+            nulls = (None,) * len(next(iter(templates.values())).columns)
+            yield [nulls + b for key, group in index.items() if key not in matched for b in group]
+
+    def _filter(self, templates, batches, condition):
+        for batch in batches:
+            ctx = self.batch_context(templates, batch)
+            yield [reader.row for reader, _ in ctx if ctx.eval(condition)]
+
+    def _select(self, step, templates, batches, passthrough=False):
+        """Apply the condition, the projections and the limit of a step to a stream."""
+        condition = self.generate(step.condition)
+        projections = self.generate_tuple(step.projections)
+
+        if passthrough and not condition and not projections:
+            return templates, batches
+
+        if projections:
+            output = {step.name: self.table(step.projections)}
+        elif passthrough:
+            output = templates
+        else:
+            output = {step.name: Table(next(iter(templates.values())).columns)}
+
+        compiled = self.compile_select(step, templates)
+
+        def select():
+            if step.limit <= 0:
+                return
+
+            count = 0
+
+            for batch in batches:
+                if compiled:
+                    rows = compiled(batch, step.limit - count)
+                    count += len(rows)
+                    if rows:
+                        yield rows
+                    if count >= step.limit:
+                        return
+                    continue
+
+                rows = []
+                ctx = self.batch_context(templates, batch)
+
+                for reader, _ in ctx:
+                    if count >= step.limit:
+                        break
+                    if condition and not ctx.eval(condition):
+                        continue
+                    rows.append(ctx.eval_tuple(projections) if projections else reader.row)
+                    count += 1
+
+                if rows:
+                    yield rows
+                if count >= step.limit:
+                    return
+
+        return output, select()
+
+    def stream_union_all(self, step):
+        dependencies = {dep.name: dep for dep in step.dependencies}
+        left_templates, left = self.stream(dependencies[step.left])
+        _, right = self.stream(dependencies[step.right])
+        templates = {step.name: Table(left_templates[step.left].columns)}
+        return templates, itertools.chain(left, right)
@@ -5,13 +5,15 @@
 from __future__ import annotations
 
 import datetime
+import heapq
 import math
 import numbers
 import re
 import typing as t
+import weakref
 from collections import deque
 from copy import deepcopy
-from enum import auto
+from enum import Enum, auto
 
 from sqlglot.errors import ParseError
 from sqlglot.helper import (
@@ -26,6 +28,9 @@ from sqlglot.helper import (
 if t.TYPE_CHECKING:
     from sqlglot.dialects.dialect import Dialect
 
+# The values of args that don't need to be copied along with their expression
+_IMMUTABLE = (str, bool, int, float, tuple, Enum, type(None))
+
 
 class _Expression(type):
     def __new__(cls, clsname, bases, attrs):
@@ -48,7 +53,7 @@ class Expression(metaclass=_Expression):
 
     key = "Expression"
     arg_types = {"this": True}
-    __slots__ = ("args", "parent", "arg_key", "comments", "_type")
+    __slots__ = ("args", "parent", "arg_key", "comments", "_type", "_hash", "_frozen", "_index")
 
     def __init__(self, **args):
         self.args = args
@@ -56,15 +61,37 @@ class Expression(metaclass=_Expression):
         self.arg_key = None
         self.comments = None
         self._type: t.Optional[DataType] = None
+        self._hash: t.Optional[int] = None
+        self._frozen = False
+        self._index: t.Optional[_TypeIndex] = None
 
         for arg_key, value in self.args.items():
             self._set_parent(arg_key, value)
 
+    # The structural hash of a node is cached the first time it's computed, which also caches the
+    # hashes of all of its descendants, and it's cleared along with its ancestors' hashes whenever
+    # the node is modified through `set`, `append` or `replace_children`. A hash is only cached if
+    # the node owns its children, i.e. they're frozen, or their hashes are cached too and their
+    # parent is the node, or they're shared with another version of the tree, which copies them
+    # before they're modified, see `replaced`, so that the modifications of its descendants always
+    # reach it. This means that a node without a cached hash can't have an ancestor with one, so
+    # the clearing can stop early. A node that's moved to another parent while its old parent
+    # still refers to it, e.g. by `alias_(node, copy=False)`, clears the hashes of the old one.
+
     def __eq__(self, other) -> bool:
-        return type(self) is type(other) and _norm_args(self) == _norm_args(other)
+        if self is other:
+            return True
+        if type(self) is not type(other):
+            return False
+        if self._hash is not None and other._hash is not None and self._hash != other._hash:
+            return False
+        return _norm_args(self) == _norm_args(other)
 
     def __hash__(self) -> int:
-        return hash(
+        if self._hash is not None:
+            return self._hash
+
+        result = hash(
             (
                 self.key,
                 tuple(
@@ -72,6 +99,37 @@ class Expression(metaclass=_Expression):
                 ),
             )
         )
+        if _owns_children(self):
+            self._hash = result
+        return result
+
+    def _invalidate(self) -> None:
+        if self._index:
+            self._index.clear()
+
+        self._hash = None
+        self._invalidate_parents()
+
+    def _invalidate_parents(self) -> None:
+        node = self.parent
+
+        while node is not None and node._hash is not None:
+            node._hash = None
+            node = node.parent
+
+    @property
+    def frozen(self) -> bool:
+        """
+        Whether this node was interned, see `sqlglot.intern`. Interned nodes are shared between
+        trees, so they can't be modified; their copies can.
+        """
+        return self._frozen
+
+    def _ensure_mutable(self) -> None:
+        if self._frozen:
+            raise ValueError(f"{self.key} is interned and can't be modified, copy it first")
+        if _SHARED:
+            _fork(self)
 
     @property
     def this(self):
@@ -133,22 +191,53 @@ class Expression(metaclass=_Expression):
 
     @type.setter
     def type(self, dtype: t.Optional[DataType | DataType.Type | str]) -> None:
+        self._ensure_mutable()
         if dtype and not isinstance(dtype, DataType):
             dtype = DataType.build(dtype)
         self._type = dtype  # type: ignore
 
     def __deepcopy__(self, memo):
-        copy = self.__class__(**deepcopy(self.args))
-        copy.comments = self.comments
-        copy.type = self.type
-        return copy
+        return self.copy()
 
     def copy(self):
-        new = deepcopy(self)
-        for item, parent, _ in new.bfs():
-            if isinstance(item, Expression) and parent:
-                item.parent = parent
-        return new
+        """
+        Returns a deep copy of the expression.
+
+        The tree is cloned in a single, non-recursive pass, so it can be arbitrarily deep. The
+        parent and arg_key of each new node are set as it's created, while the comments and the
+        type are shared with the original node, like the other immutable values of the args.
+        """
+        root = _empty(self.__class__)
+        stack = [(self, root)]
+
+        while stack:
+            node, new = stack.pop()
+            args = new.args
+            new.comments = node.comments
+            new._type = node._type
+
+            for k, value in node.args.items():
+                if isinstance(value, Expression):
+                    child = _empty(value.__class__)
+                    child.parent = new
+                    child.arg_key = k
+                    stack.append((value, child))
+                    args[k] = child
+                elif isinstance(value, list):
+                    args[k] = values = []
+                    for v in value:
+                        if isinstance(v, Expression):
+                            child = _empty(v.__class__)
+                            child.parent = new
+                            child.arg_key = k
+                            stack.append((v, child))
+                            values.append(child)
+                        else:
+                            values.append(v if isinstance(v, _IMMUTABLE) else deepcopy(v))
+                else:
+                    args[k] = value if isinstance(value, _IMMUTABLE) else deepcopy(value)
+
+        return root
 
     def append(self, arg_key, value):
         """
@@ -158,10 +247,12 @@ class Expression(metaclass=_Expression):
             arg_key (str): name of the list expression arg
             value (Any): value to append to the list
         """
+        self._ensure_mutable()
         if not isinstance(self.args.get(arg_key), list):
             self.args[arg_key] = []
         self.args[arg_key].append(value)
         self._set_parent(arg_key, value)
+        self._invalidate()
 
     def set(self, arg_key, value):
         """
@@ -171,16 +262,29 @@ class Expression(metaclass=_Expression):
             arg_key (str): name of the expression arg
             value: value to set the arg to.
         """
+        self._ensure_mutable()
+        old = self.args.get(arg_key)
         self.args[arg_key] = value
         self._set_parent(arg_key, value)
+        self._invalidate()
+
+        if old is not None and old is not value:
+            kept = {id(v) for v in value} if isinstance(value, list) else {id(value)}
+            for node in old if isinstance(old, list) else (old,):
+                if isinstance(node, Expression) and node.parent is self and id(node) not in kept:
+                    node._unindex()
 
     def _set_parent(self, arg_key, value):
         if isinstance(value, Expression):
+            if value.parent is not self and value.parent is not None:
+                value._invalidate_parents()
             value.parent = self
             value.arg_key = arg_key
         elif isinstance(value, list):
             for v in value:
                 if isinstance(v, Expression):
+                    if v.parent is not self and v.parent is not None:
+                        v._invalidate_parents()
                     v.parent = self
                     v.arg_key = arg_key
 
@@ -212,15 +316,61 @@ class Expression(metaclass=_Expression):
         Returns a generator object which visits all nodes in this tree and only
         yields those that match at least one of the specified expression types.
 
+        The BFS searches from the root of a tree index its nodes by type while they're visited, so
+        that the following searches only visit the matching nodes, until the tree is modified. Like
+        the cached hashes, the index relies on the tree being modified through `set`, `append`,
+        `replace` and `pop`, rather than by changing `args` directly. The nodes that are shared
+        with other trees, i.e. interned or borrowed from another version, see `replaced`, don't
+        refer to the index, and frozen trees aren't indexed at all.
+
         Args:
             expression_types (type): the expression type(s) to match.
 
         Returns:
             the generator object.
         """
-        for expression, _, _ in self.walk(bfs=bfs):
+        if not bfs or self.parent or self._frozen:
+            for expression, _, _ in self.walk(bfs=bfs):
+                if isinstance(expression, expression_types):
+                    yield expression
+            return
+
+        index = self._index
+        if index and index.root is self and index.valid and index.complete:
+            yield from index.find_all(expression_types)
+            return
+
+        index = _TypeIndex(self)
+        shared = set()
+        for expression, parent, _ in self.bfs():
+            if not index.valid:
+                pass
+            elif expression._frozen or id(parent) in shared:
+                shared.add(id(expression))
+                index.add(expression)
+            elif expression.parent is parent:
+                expression._index = index
+                index.add(expression)
+            elif id(expression) in _SHARED:
+                shared.add(id(expression))
+                index.add(expression)
+            else:
+                # the node was moved to another tree, so its changes would only reach that one's index
+                index.clear()
             if isinstance(expression, expression_types):
                 yield expression
+        index.complete = index.valid
+
+    def _unindex(self):
+        # a detached subtree doesn't refer to the index of the tree it was removed from; the nodes
+        # that were added to the tree after it was indexed don't refer to it either, so they stop
+        # the walk
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node._index is not None:
+                node._index = None
+                stack.extend(child for child, _ in node._iter_children())
 
     def find_ancestor(self, *expression_types):
         """
@@ -275,10 +425,25 @@ class Expression(metaclass=_Expression):
         if prune and prune(self, parent, key):
             return
 
+        # a stack of the children iterators of the nodes being visited, instead of nested generators
+        stack = [(self, self._iter_children())]
+
+        while stack:
+            parent, children = stack[-1]
+
+            for node, k in children:
+                yield node, parent, k
+                if not (prune and prune(node, parent, k)):
+                    stack.append((node, node._iter_children()))
+                break
+            else:
+                stack.pop()
+
+    def _iter_children(self):
         for k, v in self.args.items():
             for node in ensure_collection(v):
                 if isinstance(node, Expression):
-                    yield from node.dfs(self, k, prune)
+                    yield node, k
 
     def bfs(self, prune=None):
         """
@@ -429,7 +594,9 @@ class Expression(metaclass=_Expression):
             return expression
 
         parent = self.parent
+        parent._ensure_mutable()
         self.parent = None
+        self._unindex()
 
         replace_children(parent, lambda child: expression if child is self else child)
         return expression
@@ -440,6 +607,117 @@ class Expression(metaclass=_Expression):
         """
         self.replace(None)
 
+    def replaced(self, node, expression):
+        """
+        Returns a new version of this tree, in which `node` is replaced with `expression`, without
+        modifying this tree. Only the ancestors of `node` are copied, while all the other subtrees
+        are shared between the two versions, so keeping many versions of a large tree, e.g. one per
+        edit, costs memory proportional to the edits.
+
+        The shared nodes are left alone, so they still belong to this tree: their parents are
+        in it, and they can be modified in place like any of its nodes. The versions are copied
+        on write, i.e. right before a shared node or one of its descendants is modified, the
+        other versions that share it are given a copy of it, so the change doesn't leak into
+        them. The new version's own nodes can be modified in place too, while its shared nodes,
+        which are reached from it but belong to this tree, are edited with `replaced` and
+        `updated`.
+
+        For example::
+
+            >>> tree = Select().select("x").from_("tbl")
+            >>> new_tree = tree.replaced(tree.find(Column), Column(this="y"))
+            >>> tree.sql(), new_tree.sql()
+            ('SELECT x FROM tbl', 'SELECT y FROM tbl')
+            >>> tree.args["from"] is new_tree.args["from"]
+            True
+
+        Args:
+            node (Expression): a node of this tree.
+            expression (Expression|None): the new node, or None to remove `node`.
+
+        Returns:
+            The root of the new version.
+        """
+        for parent, _ in reversed(self._path(node)):
+            node, expression = parent, _shallow_copy(parent, node, expression)
+
+        return expression
+
+    def updated(self, node, arg_key, value):
+        """
+        Returns a new version of this tree, in which `arg_key` of `node` is set to `value`, without
+        modifying this tree. Like with `replaced`, only `node` and its ancestors are copied.
+
+        Args:
+            node (Expression): a node of this tree.
+            arg_key (str): name of the expression arg.
+            value: value to set the arg to.
+
+        Returns:
+            The root of the new version.
+        """
+        new_node = _shallow_copy(node)
+        new_node.set(arg_key, value)
+        return self.replaced(node, new_node)
+
+    def _unshare(self, node):
+        # the node may have been replaced since it was shared, or even collected, in which case its
+        # id may belong to one of this node's own children, which are left alone
+        if node.parent is self:
+            return
+
+        for k, value in self.args.items():
+            values = value if isinstance(value, list) else [value]
+            for i, child in enumerate(values):
+                if child is node:
+                    copy = node.copy()
+                    copy.parent = self
+                    copy.arg_key = k
+                    if isinstance(value, list):
+                        value[i] = copy
+                    else:
+                        self.args[k] = copy
+                    self._invalidate()
+
+    def _path(self, node):
+        """
+        Returns the (parent, arg_key) pairs from this expression down to `node`. The parents are
+        followed upwards when they lead to this expression, otherwise `node` is searched for, since
+        the parents of shared nodes may belong to another version of the tree.
+        """
+        path = []
+        child = node
+
+        while child is not self:
+            parent = child.parent
+            if parent is None or not any(
+                value is child for value in ensure_collection(parent.args.get(child.arg_key))
+            ):
+                break
+            path.append((parent, child.arg_key))
+            child = parent
+        else:
+            return path[::-1]
+
+        parents = {}
+        stack = [self]
+        while stack:
+            current = stack.pop()
+            if current is node:
+                path = []
+                while current is not self:
+                    parent, arg_key = parents[id(current)]
+                    path.append((parent, arg_key))
+                    current = parent
+                return path[::-1]
+            for k, value in current.args.items():
+                for child in ensure_collection(value):
+                    if isinstance(child, Expression):
+                        parents[id(child)] = (current, k)
+                        stack.append(child)
+
+        raise ValueError(f"{node.__class__.__name__} is not a node of this tree")
+
     def assert_is(self, type_):
         """
         Assert that this `Expression` is an instance of `type_`.
@@ -893,7 +1171,9 @@ class Identifier(Expression):
         return isinstance(other, self.__class__) and _norm_arg(self.this) == _norm_arg(other.this)
 
     def __hash__(self):
-        return hash((self.key, self.this.lower()))
+        if self._hash is None:
+            self._hash = hash((self.key, self.this.lower()))
+        return self._hash
 
 
 class Index(Expression):
@@ -969,7 +1249,9 @@ class Literal(Condition):
         )
 
     def __hash__(self):
-        return hash((self.key, self.this, self.args["is_string"]))
+        if self._hash is None:
+            self._hash = hash((self.key, self.this, self.args["is_string"]))
+        return self._hash
 
     @classmethod
     def number(cls, number) -> Literal:
@@ -1469,6 +1751,26 @@ class Values(UDTF):
     }
 
 
+class Rows(Expression):
+    """
+    A compact representation of the rows of a large VALUES list whose values are all literals.
+
+    Each row is a tuple of Python values: the text of a string or number literal, None for NULL,
+    or a bool for TRUE / FALSE. Negative numbers are stored with their sign, e.g. "-5". The
+    `strings` flags tell, for each column, whether its texts are strings or numbers.
+    """
+
+    arg_types = {"rows": True, "strings": True}
+
+    def tuples(self) -> t.List[Tuple]:
+        """Returns the rows as the `Tuple` expressions that the parser builds for small lists."""
+        strings = self.args["strings"]
+        return [
+            Tuple(expressions=[_row_value(value, string) for value, string in zip(row, strings)])
+            for row in self.args["rows"]
+        ]
+
+
 class Var(Expression):
     pass
 
@@ -2254,6 +2556,49 @@ class AlterTable(Expression):
 class Binary(Expression):
     arg_types = {"this": True, "expression": True}
 
+    # Chains of binary expressions, e.g. 1 + 2 + ... + n, are nested in their left operands and can
+    # be arbitrarily deep, so these methods walk down the left operands iteratively.
+
+    def __eq__(self, other) -> bool:
+        left, right = self, other
+
+        while type(left) is type(right):
+            if left is right:
+                return True
+            if left._hash is not None and right._hash is not None and left._hash != right._hash:
+                return False
+
+            left_args, right_args = _norm_args(left), _norm_args(right)
+            left, right = left_args.pop("this", None), right_args.pop("this", None)
+
+            if left_args != right_args:
+                return False
+            if not isinstance(left, Binary):
+                return left == right
+
+        return False
+
+    def __hash__(self) -> int:
+        if self._hash is not None:
+            return self._hash
+
+        chain = []
+        node: t.Any = self
+
+        while isinstance(node, Binary) and node._hash is None:
+            args = _norm_args(node)
+            chain.append((node, args))
+            node = args.pop("this", None)
+
+        result = hash(tuple(node) if isinstance(node, list) else node)
+        for node, args in reversed(chain):
+            items = tuple((k, tuple(v) if isinstance(v, list) else v) for k, v in args.items())
+            result = hash((node.key, result, items))
+            if _owns_children(node):
+                node._hash = result
+
+        return result
+
     @property
     def left(self):
         return self.this
@@ -3160,10 +3505,144 @@ def _norm_args(expression):
     return args
 
 
+def _owns_children(expression):
+    for value in expression.args.values():
+        for child in value if isinstance(value, list) else (value,):
+            if (
+                isinstance(child, Expression)
+                and not child._frozen
+                and (
+                    child._hash is None
+                    or (child.parent is not expression and id(child) not in _SHARED)
+                )
+            ):
+                return False
+    return True
+
+
 def _norm_arg(arg):
     return arg.lower() if isinstance(arg, str) else arg
 
 
+def _empty(klass):
+    # The nodes of the functions that build whole trees, e.g. `Expression.copy`, are initialized by
+    # the base constructor, so that all of their attributes are set in one place, but without the
+    # hooks of the subclasses' constructors, which expect their actual args.
+    node = klass.__new__(klass)
+    Expression.__init__(node)
+    return node
+
+
+def _shallow_copy(expression, node=None, new_node=None):
+    """
+    Returns a copy of `expression` that shares its children with it, except for `node`, which is
+    replaced with `new_node`, or removed if that's None.
+    """
+    copy = _empty(expression.__class__)
+    copy.comments = expression.comments
+    copy._type = expression._type
+
+    def share(k, child):
+        if node is not None and child is node:
+            copy._set_parent(k, new_node)
+            return new_node
+        if isinstance(child, Expression):
+            _share(child, copy)
+        return child
+
+    for k, value in expression.args.items():
+        if isinstance(value, list):
+            copy.args[k] = [
+                share(k, child) for child in value if new_node is not None or child is not node
+            ]
+        else:
+            copy.args[k] = share(k, value)
+
+    return copy
+
+
+# The nodes that are shared between versions of a tree, see `Expression.replaced`, by id, with weak
+# references to the nodes of the other versions that share them. A shared node is kept alive by
+# its sharers, so its id can't be reused while it has an entry, and the entry is removed once all
+# of them are collected.
+_SHARED: t.Dict[int, t.List[weakref.ref]] = {}
+
+
+def _share(node, sharer):
+    key = id(node)
+
+    def remove(ref):
+        refs = _SHARED.get(key)
+        if refs is not None and ref in refs:
+            refs.remove(ref)
+            if not refs:
+                del _SHARED[key]
+
+    _SHARED.setdefault(key, []).append(weakref.ref(sharer, remove))
+
+
+def _fork(expression):
+    """
+    Gives the versions that share `expression` or one of its ancestors copies of the shared nodes,
+    before `expression` is modified.
+    """
+    node = expression
+    while node is not None:
+        for ref in _SHARED.pop(id(node), ()):
+            sharer = ref()
+            if sharer is not None:
+                sharer._unshare(node)
+        node = node.parent
+
+
+class _TypeIndex:
+    """The nodes of a tree, in BFS order and by type."""
+
+    def __init__(self, root: Expression) -> None:
+        self.root: t.Optional[Expression] = root
+        self.valid = True
+        self.complete = False
+        self.nodes: t.List[Expression] = []
+        self.positions: t.Dict[t.Type[Expression], t.List[int]] = {}
+
+    def clear(self) -> None:
+        # the nodes are released, so that the detached subtrees that still refer to the index don't
+        # keep the rest of the tree alive
+        self.valid = False
+        self.root = None
+        self.nodes = []
+        self.positions = {}
+
+    def add(self, node: Expression) -> None:
+        self.positions.setdefault(node.__class__, []).append(len(self.nodes))
+        self.nodes.append(node)
+
+    def find_all(
+        self, expression_types: t.Tuple[t.Type[Expression], ...]
+    ) -> t.Iterator[Expression]:
+        positions = [
+            positions
+            for klass, positions in self.positions.items()
+            if issubclass(klass, expression_types)
+        ]
+
+        nodes = self.nodes
+        for i in positions[0] if len(positions) == 1 else heapq.merge(*positions):
+            yield nodes[i]
+
+
+def _row_value(value: t.Optional[str | bool], string: bool) -> Expression:
+    if value is None:
+        return Null()
+    if isinstance(value, bool):
+        return Boolean(this=value)
+    if string:
+        return Literal(this=value, is_string=True)
+    if value.startswith("-"):
+        return Neg(this=Literal(this=value[1:], is_string=False))
+    return Literal(this=value, is_string=False)
+
+
 ALL_FUNCTIONS = subclasses(__name__, Func, (AggFunc, Anonymous, Func))
 
 
@@ -3867,6 +4346,8 @@ def replace_children(expression, fun):
     """
     Replace children of an expression with the result of a lambda fun(child) -> exp.
     """
+    expression._ensure_mutable()
+
     for k, v in expression.args.items():
         is_list_arg = isinstance(v, list)
 
@@ -3877,13 +4358,14 @@ def replace_children(expression, fun):
             if isinstance(cn, Expression):
                 for child_node in ensure_collection(fun(cn)):
                     new_child_nodes.append(child_node)
-                    child_node.parent = expression
-                    child_node.arg_key = k
+                    expression._set_parent(k, child_node)
             else:
                 new_child_nodes.append(cn)
 
         expression.args[k] = new_child_nodes if is_list_arg else seq_get(new_child_nodes, 0)
 
+    expression._invalidate()
+
 
 def column_table_names(expression):
     """
@@ -106,6 +106,9 @@ class Generator:
 
     WITH_SEPARATED_COMMENTS = (exp.Select, exp.From, exp.Where, exp.Binary)
 
+    # The number of nested binary expressions that are generated recursively, see _generate_chain
+    CHAIN_STEP = 100
+
     __slots__ = (
         "time_mapping",
         "time_trie",
@@ -133,6 +136,7 @@ class Generator:
         "_leading_comma",
         "_max_text_width",
         "_comments",
+        "_chain_sql",
     )
 
     def __init__(
@@ -188,6 +192,7 @@ class Generator:
         self._leading_comma = leading_comma
         self._max_text_width = max_text_width
         self._comments = comments
+        self._chain_sql: t.Dict[int, t.Tuple[exp.Expression, str]] = {}
 
     def generate(self, expression: t.Optional[exp.Expression]) -> str:
         """
@@ -303,6 +308,15 @@ class Generator:
         if key:
             return self.sql(expression.args.get(key))
 
+        if self._chain_sql:
+            cached = self._chain_sql.pop(id(expression), None)
+            if cached and cached[0] is expression:
+                sql = cached[1]
+                return self.maybe_comment(sql, expression) if self._comments and comment else sql
+
+        if isinstance(expression, exp.Binary) and isinstance(expression.this, exp.Binary):
+            self._generate_chain(expression)
+
         transform = self.TRANSFORMS.get(expression.__class__)
 
         if callable(transform):
@@ -325,6 +339,25 @@ class Generator:
 
         return self.maybe_comment(sql, expression) if self._comments and comment else sql
 
+    def _generate_chain(self, expression: exp.Binary) -> None:
+        """
+        Generates the left operands of a chain of binary expressions, e.g. `1 + 2 + ... + n`, from the
+        bottom up, one in every CHAIN_STEP, so that generating a long chain doesn't exceed the
+        recursion limit. The results are then picked up by `sql` when the chain is generated.
+        """
+        # the chain was already handled when its topmost expression was generated
+        if isinstance(expression.parent, exp.Binary) and expression.arg_key == "this":
+            return
+
+        chain = []
+        node = expression.this
+        while isinstance(node, exp.Binary):
+            chain.append(node)
+            node = node.this
+
+        for node in chain[-self.CHAIN_STEP :: -self.CHAIN_STEP]:
+            self._chain_sql[id(node)] = (node, self.sql(node, comment=False))
+
     def uncache_sql(self, expression: exp.Uncache) -> str:
         table = self.sql(expression, "this")
         exists_sql = " IF EXISTS" if expression.args.get("exists") else ""
@@ -741,6 +774,49 @@ class Generator:
             return f"(VALUES{self.seg('')}{args}){alias}"
         return f"VALUES{self.seg('')}{args}{alias}"
 
+    def rows_sql(self, expression: exp.Rows) -> str:
+        # The rows are rendered like the Tuple expressions they stand for, which are separated the
+        # way `expressions` separates them, since a Rows expression takes their place in VALUES
+        if not self.pretty:
+            sep = ", "
+        elif self._leading_comma:
+            sep = "\n, "
+        else:
+            sep = ",\n"
+
+        klass = self.__class__
+        if any(
+            node in self.TRANSFORMS
+            or getattr(klass, f"{node.key}_sql") is not getattr(Generator, f"{node.key}_sql")
+            for node in (exp.Tuple, exp.Literal, exp.Neg, exp.Null, exp.Boolean)
+        ):
+            return sep.join(self.sql(row) for row in expression.tuples())
+
+        quote_start = self.quote_start
+        quote_end = self.quote_end
+        escaped_quote_end = self._escaped_quote_end
+        replace_backslash = self._replace_backslash
+        strings = expression.args["strings"]
+        sqls = []
+
+        for row in expression.args["rows"]:
+            values = []
+            for value, string in zip(row, strings):
+                if value is None:
+                    value = "NULL"
+                elif value is True:
+                    value = "TRUE"
+                elif value is False:
+                    value = "FALSE"
+                elif string:
+                    if replace_backslash:
+                        value = value.replace("\\", "\\\\")
+                    value = f"{quote_start}{value.replace(quote_end, escaped_quote_end)}{quote_end}"
+                values.append(value)
+            sqls.append(f"({', '.join(values)})")
+
+        return sep.join(sqls)
+
     def var_sql(self, expression: exp.Var) -> str:
         return self.sql(expression, "this")
 
@@ -151,7 +151,7 @@ def apply_index_offset(expressions: t.List[t.Optional[E]], offset: int) -> t.Lis
     if expression and expression.is_int:
         expression = expression.copy()
         logger.warning("Applying array index offset (%s)", offset)
-        expression.args["this"] = str(int(expression.this) + offset)  # type: ignore
+        expression.set("this", str(int(expression.this) + offset))
         return [expression]
 
     return expressions
@@ -0,0 +1,289 @@
+"""
+Incremental tokenizing and parsing of a SQL buffer that is being edited, e.g. in an editor.
+
+A `Session` keeps the tokens and the syntax tree of each statement of the buffer. After an edit,
+only the statements that overlap it are tokenized again, starting from the state the tokenizer was
+in at the end of the previous statement, until the tokenizer reaches the start of a statement that
+follows the edit in the same state as before. The following statements keep their tokens, whose
+lines are shifted if needed, and their syntax trees. The statements whose tokens changed are parsed
+again the next time `Session.expressions` is accessed, so typing in a large worksheet only costs
+time proportional to the edited statement.
+
+The tokens and the syntax trees are always the same as those that `Tokenizer.tokenize` and
+`Parser.parse` would produce for the whole buffer:
+
+Example:
+    >>> from sqlglot.incremental import Session
+    >>> session = Session("SELECT a FROM x; SELECT b FROM y")
+    >>> session.edit(7, 8, "c")
+    >>> session.sql
+    'SELECT c FROM x; SELECT b FROM y'
+    >>> [expression.sql() for expression in session.expressions]
+    ['SELECT c FROM x', 'SELECT b FROM y']
+"""
+
+from __future__ import annotations
+
+import typing as t
+
+from sqlglot.dialects.dialect import Dialect
+from sqlglot.expressions import Expression
+from sqlglot.tokens import Token, TokenType
+
+_UNPARSED = object()
+
+
+class _Statement:
+    """
+    The text of a statement, from `start` to `end`, which includes its semicolon if it has one.
+
+    Args:
+        start: the offset of the statement in the buffer, i.e. the end of the previous one.
+        end: the offset right after the statement's semicolon, or the size of the buffer for the
+            last statement.
+        line: the line of the tokenizer at `start`.
+        col: the column of the tokenizer at `start`.
+        trailing: the comments that tokenizing the statement attached to the previous semicolon.
+        tokens: the tokens of the statement, or None if it needs to be tokenized again.
+        shift: the number of lines by which the tokens need to be shifted.
+    """
+
+    __slots__ = ("start", "end", "line", "col", "trailing", "tokens", "shift", "expression")
+
+    def __init__(
+        self,
+        start: int,
+        end: int,
+        line: int = 1,
+        col: int = 1,
+        trailing: t.Optional[t.List[str]] = None,
+        tokens: t.Optional[t.List[Token]] = None,
+    ) -> None:
+        self.start = start
+        self.end = end
+        self.line = line
+        self.col = col
+        self.trailing = trailing or []
+        self.tokens = tokens
+        self.shift = 0
+        self.expression: t.Any = _UNPARSED
+
+    def materialize(self) -> t.List[Token]:
+        assert self.tokens is not None
+        if self.shift:
+            for token in self.tokens:
+                token.line += self.shift
+            self.shift = 0
+        return self.tokens
+
+
+class Session:
+    """
+    The tokens and syntax trees of a SQL buffer, which are kept up to date incrementally as the
+    buffer is edited.
+
+    Args:
+        sql: the initial content of the buffer.
+        read: the SQL dialect to apply during tokenizing and parsing.
+        **opts: other options, which are passed to the parser.
+    """
+
+    def __init__(self, sql: str = "", read: t.Optional[str | Dialect] = None, **opts) -> None:
+        dialect = Dialect.get_or_raise(read)()
+        self.sql = sql
+        self.tokenizer = dialect.tokenizer_class()
+        self.parser = dialect.parser(**opts)
+        self._statements = [_Statement(0, len(sql))]
+        self._dirty = True
+
+    def edit(self, start: int, end: int, text: str) -> None:
+        """
+        Replaces the text of the buffer from offset `start` up to `end` with `text`. The statements
+        that overlap it are tokenized and parsed again lazily, when they're next accessed.
+        """
+        if not 0 <= start <= end <= len(self.sql):
+            raise ValueError(f"Invalid edit range {start}:{end} for a buffer of {len(self.sql)}")
+
+        delta = len(text) - (end - start)
+        self.sql = self.sql[:start] + text + self.sql[end:]
+
+        # The statement that ends right before the edit is included, since its last token may
+        # change too, e.g. if the edit is right after a semicolon
+        statements = self._statements
+        i = self._find(start)
+        j = max(self._find(end + 1), i)
+
+        first = statements[i]
+        statements[i : j + 1] = [
+            _Statement(
+                first.start, statements[j].end + delta, first.line, first.col, first.trailing
+            )
+        ]
+        for statement in statements[i + 1 :]:
+            statement.start += delta
+            statement.end += delta
+
+        self._dirty = True
+
+    def update(self, sql: str) -> None:
+        """Sets the content of the buffer to `sql`, editing only the part that's changed."""
+        old = self.sql
+        size = min(len(old), len(sql))
+        start = 0
+        while start < size and old[start] == sql[start]:
+            start += 1
+        end = 0
+        while end < size - start and old[-end - 1] == sql[-end - 1]:
+            end += 1
+        if start < len(old) - end or start < len(sql) - end:
+            self.edit(start, len(old) - end, sql[start : len(sql) - end])
+
+    @property
+    def tokens(self) -> t.List[Token]:
+        """The tokens of the buffer, as returned by `Tokenizer.tokenize`."""
+        self._sync()
+        return [token for statement in self._statements for token in statement.materialize()]
+
+    @property
+    def expressions(self) -> t.List[t.Optional[Expression]]:
+        """
+        The syntax trees of the buffer, one per statement, as returned by `Parser.parse`. The trees
+        of the statements whose tokens haven't changed are the same objects as before.
+        """
+        self._sync()
+        statements = self._statements
+
+        for statement in statements:
+            if statement.expression is _UNPARSED:
+                statement.expression = self.parser.parse(statement.materialize(), self.sql)[0]
+
+        # like the parser, we ignore the empty statement that follows the last semicolon
+        if len(statements) > 1 and not statements[-1].tokens:
+            statements = statements[:-1]
+        return [statement.expression for statement in statements]
+
+    def _find(self, offset: int) -> int:
+        """Returns the index of the first statement that ends at or after `offset`."""
+        statements = self._statements
+        lo, hi = 0, len(statements) - 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if statements[mid].end < offset:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _sync(self) -> None:
+        """Tokenizes the statements that were edited, until the tokenizer is back in sync."""
+        if not self._dirty:
+            return
+
+        statements = self._statements
+        size = len(statements)
+        result: t.List[_Statement] = []
+        # the line shift of the statements that follow the last point where we got back in sync
+        shift = 0
+        # the state of the tokenizer after the last statement that was tokenized again, if we're
+        # not back in sync yet
+        fresh = False
+        boundary = line = col = 0
+        k = 0
+
+        while k < size:
+            statement = statements[k]
+
+            if fresh:
+                if statement.start < boundary and statement.end <= boundary and k < size - 1:
+                    k += 1
+                    continue
+                if (
+                    statement.start == boundary
+                    and statement.col == col
+                    and statement.tokens is not None
+                ):
+                    # The tokenizer is in the same state as it was at the start of this statement
+                    shift = line - statement.line
+                    result[-1].materialize()[-1].comments.extend(statement.trailing)
+                    fresh = False
+                    continue
+                start, trailing = boundary, []
+            else:
+                statement.line += shift
+                if statement.tokens is not None:
+                    statement.shift += shift
+                    result.append(statement)
+                    k += 1
+                    continue
+                start, line, col, trailing = (
+                    statement.start,
+                    statement.line,
+                    statement.col,
+                    statement.trailing,
+                )
+
+            previous = result[-1].materialize()[-1] if result else None
+            comments = list(previous.comments) if previous else []
+
+            try:
+                new = self._tokenize(start, line, col, previous, len(trailing))
+            except Exception:
+                if previous:
+                    previous.comments[:] = comments
+                dirty = _Statement(start, statement.end, line, col, trailing)
+                self._statements = result + [dirty] + statements[k + 1 :]
+                raise
+
+            result.append(new)
+            boundary, line, col = new.end, self.tokenizer._line, self.tokenizer._col
+            tokens = new.tokens or []
+            fresh = bool(tokens) and tokens[-1].token_type == TokenType.SEMICOLON
+            if not fresh:
+                break
+
+        self._statements = result
+        self._dirty = False
+
+    def _tokenize(
+        self, start: int, line: int, col: int, previous: t.Optional[Token], trailing: int
+    ) -> _Statement:
+        """
+        Tokenizes the statement at `start` in the given tokenizer state, until its semicolon.
+        The `trailing` comments that were attached to the `previous` semicolon are removed first.
+        """
+        tokenizer = self.tokenizer
+        tokenizer.reset()
+        tokenizer.sql = self.sql
+        tokenizer.size = len(self.sql)
+        tokenizer._current = start
+        tokenizer._line = line
+        tokenizer._col = col
+        tokenizer._end = start >= tokenizer.size  # type: ignore
+
+        if previous:
+            if trailing:
+                del previous.comments[-trailing:]
+            comments = len(previous.comments)
+            tokenizer.tokens = [previous]
+            tokenizer._prev_token_line = previous.line
+            tokenizer._prev_token_comments = previous.comments
+            tokenizer._prev_token_type = previous.token_type  # type: ignore
+
+        tokenizer._scan(
+            until=lambda: len(tokenizer.tokens) > bool(previous)
+            and tokenizer.tokens[-1].token_type == TokenType.SEMICOLON
+        )
+
+        tokens = tokenizer.tokens[1:] if previous else tokenizer.tokens
+        end = tokenizer._current
+        if not tokens or tokens[-1].token_type != TokenType.SEMICOLON:
+            end = tokenizer.size
+
+        return _Statement(
+            start,
+            end,
+            line,
+            col,
+            previous.comments[comments:] if previous else [],
+            tokens,
+        )
@@ -0,0 +1,153 @@
+"""
+Interning of expression trees, for applications that keep many parsed statements in memory.
+
+The statements of a large query corpus share most of their subtrees: the same columns, tables,
+types and often whole CTE bodies come up again and again. An `InternPool` deduplicates the
+subtrees that are exactly equal into shared instances, so each of them is stored only once.
+
+Example:
+    >>> import sqlglot
+    >>> from sqlglot.intern import InternPool
+    >>> pool = InternPool()
+    >>> first = pool.intern(sqlglot.parse_one("SELECT a FROM x WHERE b > 1"))
+    >>> second = pool.intern(sqlglot.parse_one("SELECT a FROM x WHERE b > 2"))
+    >>> first.args["from"] is second.args["from"]
+    True
+    >>> first.sql(), second.sql()
+    ('SELECT a FROM x WHERE b > 1', 'SELECT a FROM x WHERE b > 2')
+
+Interned nodes are frozen: `set`, `append`, `replace`, `pop` and in-place transformations raise a
+`ValueError` for them, since the change would leak into every tree that shares them. A mutable
+tree can be obtained with `copy`, which is what the builders and the optimizer do by default.
+
+A shared node's `parent` is the node of one of the trees that contain it. The subtrees are only
+shared between nodes of the same class under the same arg, so the generated SQL doesn't depend
+on the tree, but navigating upwards from a shared node may end up in a different tree.
+"""
+
+from __future__ import annotations
+
+import typing as t
+
+from sqlglot import expressions as exp
+
+
+class InternPool:
+    """
+    A pool of interned, structurally unique expression nodes.
+
+    Two nodes are unified only if they're exactly equal, i.e. they have the same class, args,
+    comments and type, and they're under the same class of parent and arg. Unlike `==`, this
+    doesn't ignore differences that change the generated SQL, like the case of identifiers.
+    """
+
+    def __init__(self) -> None:
+        # the nodes are keyed on the hashes of their keys, which are recomputed for the candidates
+        # instead of being stored, since they'd take up about as much memory as the nodes
+        self._nodes: t.Dict[int, exp.Expression] = {}
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def intern(self, expression: exp.Expression) -> exp.Expression:
+        """
+        Interns a tree, which is consumed: its nodes are either frozen and added to the pool, or
+        replaced with equal nodes that were already in it.
+
+        Args:
+            expression: the root of the tree.
+
+        Returns:
+            The interned tree, which is `expression` unless the whole tree was already pooled.
+        """
+        interned: t.Dict[int, exp.Expression] = {}
+
+        # children are visited before their parents, so a node's children are already interned
+        nodes = list(expression.bfs(prune=lambda node, *_: node._frozen))
+
+        for node, parent, arg_key in reversed(nodes):
+            if node is expression:
+                parent = arg_key = None
+
+            if node._frozen:
+                interned[id(node)] = node
+                continue
+
+            if node._index:
+                # the args are rewritten in place, so the tree's index of types goes stale
+                node._index.clear()
+                node._index = None
+
+            for k, value in node.args.items():
+                if isinstance(value, exp.Expression):
+                    node.args[k] = interned[id(value)]
+                elif isinstance(value, list):
+                    node.args[k] = [
+                        interned[id(v)] if isinstance(v, exp.Expression) else v for v in value
+                    ]
+
+            if node._type:
+                node._type = self.intern(node._type)
+
+            key = self._key(node, parent, arg_key)
+            try:
+                digest: t.Optional[int] = hash(key)
+            except TypeError:
+                # the args contain an unhashable value, so the node can't be shared
+                digest = None
+
+            existing = self._nodes.get(digest) if digest is not None else None
+            if existing and self._key(existing, existing.parent, existing.arg_key) != key:
+                # a hash collision, the node is frozen but it isn't shared
+                existing = digest = None
+
+            if existing is None:
+                for k, value in node.args.items():
+                    for child in value if isinstance(value, list) else (value,):
+                        if isinstance(child, exp.Expression):
+                            child.parent = node
+                            child.arg_key = k
+
+                node._frozen = True
+                if digest is not None:
+                    self._nodes.setdefault(digest, node)
+                existing = node
+
+            interned[id(node)] = existing
+
+        return interned[id(expression)]
+
+    def _key(
+        self,
+        node: exp.Expression,
+        parent: t.Optional[exp.Expression],
+        arg_key: t.Optional[str],
+    ) -> t.Tuple[t.Any, ...]:
+        # interned children are identified by their id, which is stable because the pool keeps
+        # them alive; the flags tell them apart from the other values of the args
+        args: t.List[t.Tuple[t.Any, ...]] = []
+        for k, value in node.args.items():
+            if isinstance(value, exp.Expression):
+                args.append((k, True, id(value)))
+            elif isinstance(value, list):
+                args.append(
+                    (
+                        k,
+                        False,
+                        tuple(
+                            (True, id(v)) if isinstance(v, exp.Expression) else (False, v)
+                            for v in value
+                        ),
+                    )
+                )
+            else:
+                args.append((k, False, value))
+
+        return (
+            node.__class__,
+            parent.__class__ if parent else None,
+            arg_key,
+            tuple(args),
+            tuple(node.comments) if node.comments else None,
+            id(node._type) if node._type else None,
+        )
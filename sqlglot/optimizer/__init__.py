@@ -1 +1 @@
-from sqlglot.optimizer.optimizer import RULES, optimize
+from sqlglot.optimizer.optimizer import RULES, OptimizerSession, optimize
@@ -6,11 +6,11 @@ def expand_multi_table_selects(expression):
         parent = from_.parent
 
         for query in from_.expressions[1:]:
+            query.pop()
             parent.join(
                 query,
                 join_type="CROSS",
                 copy=False,
             )
-            from_.expressions.remove(query)
 
     return expression
@@ -1,4 +1,6 @@
 import sqlglot
+from sqlglot import exp
+from sqlglot.cache import LRUCache
 from sqlglot.optimizer.annotate_types import annotate_types
 from sqlglot.optimizer.canonicalize import canonicalize
 from sqlglot.optimizer.eliminate_ctes import eliminate_ctes
@@ -61,11 +63,142 @@ def optimize(expression, schema=None, db=None, catalog=None, rules=RULES, **kwar
     possible_kwargs = {"db": db, "catalog": catalog, "schema": schema, **kwargs}
     expression = expression.copy()
     for rule in rules:
+        expression = _apply(rule, expression, possible_kwargs)
+    return expression
+
+
+def _apply(rule, expression, possible_kwargs):
+    # Find any additional rule parameters, beyond `expression`
+    rule_params = rule.__code__.co_varnames
+    rule_kwargs = {
+        param: possible_kwargs[param] for param in rule_params if param in possible_kwargs
+    }
+    return rule(expression, **rule_kwargs)
+
+
+class OptimizerSession:
+    """
+    Optimizes successive versions of queries, e.g. as they're being edited, reusing the work that
+    was done for the previous versions.
+
+    The optimized version of every query is cached on its fingerprint, i.e. its exact structure. The
+    rules in `LOCAL_RULES` only rewrite each node or each scope on its own, so they are applied to
+    every CTE and to the outermost query separately and their output is cached on the fingerprint
+    of each part. When a single CTE changes, only that CTE goes through them again. The other rules
+    need the whole query, e.g. to resolve the columns of CTEs, to merge subqueries, to push down
+    predicates or to generate names that are unique across scopes, so they always run over all of
+    it.
+
+    The schema is expected to stay the same for the lifetime of a session, call `clear` if it
+    changes.
+
+    Example:
+        >>> import sqlglot
+        >>> session = OptimizerSession(schema={"x": {"a": "INT"}})
+        >>> expression = sqlglot.parse_one("SELECT a FROM x WHERE a = 1 OR (a = 1 AND a > 0)")
+        >>> session.optimize(expression).sql()
+        'SELECT "x"."a" AS "a" FROM "x" AS "x" WHERE "x"."a" = 1'
+        >>> session.optimize(expression).sql()
+        'SELECT "x"."a" AS "a" FROM "x" AS "x" WHERE "x"."a" = 1'
+        >>> session.cache.hits
+        1
 
-        # Find any additional rule parameters, beyond `expression`
-        rule_params = rule.__code__.co_varnames
-        rule_kwargs = {
-            param: possible_kwargs[param] for param in rule_params if param in possible_kwargs
+    Args:
+        schema (dict|sqlglot.optimizer.Schema): database schema, see `optimize`.
+        db (str): the default database.
+        catalog (str): the default catalog.
+        rules (list): sequence of optimizer rules to use.
+        size (int): the maximum number of cached queries and parts of queries.
+        **kwargs: passed to the rules that have a keyword argument with the same name.
+    """
+
+    LOCAL_RULES = {normalize, expand_multi_table_selects, optimize_joins, canonicalize}
+
+    def __init__(self, schema=None, db=None, catalog=None, rules=RULES, size=1024, **kwargs):
+        self.rules = rules
+        self.possible_kwargs = {
+            "db": db,
+            "catalog": catalog,
+            "schema": ensure_schema(schema or sqlglot.schema),
+            **kwargs,
         }
-        expression = rule(expression, **rule_kwargs)
-    return expression
+        self.cache = LRUCache(size)
+
+    def optimize(self, expression):
+        """
+        Same as `optimize`, except that cached results are reused.
+
+        Args:
+            expression (sqlglot.Expression): expression to optimize
+        Returns:
+            sqlglot.Expression: optimized expression
+        """
+        key = (None, _fingerprint(expression))
+        optimized = self.cache.get(key)
+
+        if optimized is None:
+            optimized = expression.copy()
+            for rule in self.rules:
+                if rule in self.LOCAL_RULES:
+                    optimized = self._apply_local(rule, optimized)
+                else:
+                    optimized = _apply(rule, optimized, self.possible_kwargs)
+            self.cache.set(key, optimized.copy())
+            return optimized
+
+        return optimized.copy()
+
+    def clear(self):
+        """Removes all cached results."""
+        self.cache.clear()
+
+    def _apply_local(self, rule, expression):
+        with_ = expression.args.get("with")
+
+        if not with_:
+            return self._apply_cached(rule, expression)
+
+        for cte in with_.expressions:
+            cte.replace(self._apply_cached(rule, cte))
+
+        expression.set("with", None)
+        expression = self._apply_cached(rule, expression)
+        expression.set("with", with_)
+        return expression
+
+    def _apply_cached(self, rule, expression):
+        key = (rule, _fingerprint(expression))
+        result = self.cache.get(key)
+
+        if result is None:
+            result = _apply(rule, expression, self.possible_kwargs)
+            self.cache.set(key, result.copy())
+            return result
+
+        return result.copy()
+
+
+def _fingerprint(expression):
+    """
+    Flattens the exact structure of an expression into a tuple of its nodes, lists and values in
+    pre-order. It's built iteratively, so deep expressions don't exceed the recursion limit.
+    """
+    fingerprint = []
+    stack = [expression]
+
+    while stack:
+        value = stack.pop()
+
+        if isinstance(value, exp.Expression):
+            fingerprint.append(
+                (exp.Expression, value.__class__, tuple(value.args), tuple(value.comments or ()))
+            )
+            stack.append(value.type)
+            stack.extend(reversed(value.args.values()))
+        elif isinstance(value, list):
+            fingerprint.append((list, len(value)))
+            stack.extend(reversed(value))
+        else:
+            fingerprint.append((None, value))
+
+    return tuple(fingerprint)
@@ -52,7 +52,7 @@ def _pop_table_column_aliases(derived_tables):
             continue
         table_alias = derived_table.args.get("alias")
         if table_alias:
-            table_alias.args.pop("columns", None)
+            table_alias.set("columns", None)
 
 
 def _expand_using(scope, resolver):
@@ -105,7 +105,7 @@ def _expand_using(scope, resolver):
             if join_table not in tables:
                 tables.append(join_table)
 
-        join.args.pop("using")
+        join.set("using", None)
         join.set("on", exp.and_(*conditions))
 
     if column_tables:
@@ -0,0 +1,259 @@
+"""
+Parsing and transpiling of multi-statement SQL on a pool of worker processes.
+
+The input is cut into statements with `Tokenizer.split`, a cheap scanner that only recognizes
+strings, identifiers, comments and semicolons. The statements are then tokenized, parsed and
+optionally generated by worker processes, each of which keeps warm `Dialect`, `Tokenizer` and
+`Parser` instances, and the results are returned in input order.
+
+Every worker checks that its statement tokenizes into a single statement. If that's not the case
+for any of them, e.g. because of a command that contains a semicolon within a string, the whole
+input is processed sequentially instead, so the results are always the same as those of
+`sqlglot.parse` and `sqlglot.transpile`. The positions of the parse errors, which the workers find
+within their statements, are moved to the whole input by the main process, which also cuts their
+context out of it.
+
+Starting the worker processes takes a while, so inputs shorter than `MIN_PARALLEL_SIZE` characters
+are processed sequentially too.
+
+These functions are used by `sqlglot.parse` and `sqlglot.transpile` when `workers` is set:
+
+Example:
+    >>> import sqlglot
+    >>> sqlglot.transpile("SELECT 1; SELECT 'a;b'", workers=2)
+    ['SELECT 1', "SELECT 'a;b'"]
+"""
+
+from __future__ import annotations
+
+import logging
+import typing as t
+from concurrent.futures import ProcessPoolExecutor
+
+from sqlglot import expressions as exp
+from sqlglot.dialects.dialect import Dialect
+from sqlglot.errors import ErrorLevel, ParseError
+from sqlglot.parser import Parser
+from sqlglot.tokens import Token, TokenType
+
+logger = logging.getLogger("sqlglot")
+
+# the size of the smallest input, in characters, that's worth starting the worker processes for
+MIN_PARALLEL_SIZE = 100_000
+
+# the warm instances of each worker process, set by _init
+_WORKER: t.Dict[str, t.Any] = {}
+
+
+def parse(
+    sql: str, read: t.Optional[str | Dialect] = None, workers: int = 2, **opts
+) -> t.List[t.Optional[exp.Expression]]:
+    """
+    Parses the given SQL string into a collection of syntax trees, one per parsed SQL statement,
+    using `workers` processes.
+
+    Args:
+        sql: the SQL code string to parse.
+        read: the SQL dialect to apply during parsing (eg. "spark", "hive", "presto", "mysql").
+        workers: the number of worker processes.
+        **opts: other options.
+
+    Returns:
+        The resulting syntax tree collection.
+    """
+    results = _run(sql, read, None, workers, opts, None)
+    if results is None:
+        return Dialect.get_or_raise(read)().parse(sql, **opts)
+    return [_load(nodes) for nodes in results]
+
+
+def transpile(
+    sql: str,
+    read: t.Optional[str | Dialect] = None,
+    write: t.Optional[str | Dialect] = None,
+    workers: int = 2,
+    error_level: t.Optional[ErrorLevel] = None,
+    **opts,
+) -> t.List[str]:
+    """
+    Parses the given SQL string in accordance with the source dialect and returns a list of SQL
+    strings transformed to conform to the target dialect, using `workers` processes.
+
+    Args:
+        sql: the SQL code string to transpile.
+        read: the source dialect used to parse the input string.
+        write: the target dialect into which the input should be transformed.
+        workers: the number of worker processes.
+        error_level: the desired error level of the parser.
+        **opts: other options.
+
+    Returns:
+        The list of transpiled SQL statements.
+    """
+    results = _run(sql, read, write, workers, {"error_level": error_level}, opts)
+    if results is None:
+        dialect = Dialect.get_or_raise(write)()
+        return [
+            dialect.generate(expression, **opts)
+            for expression in Dialect.get_or_raise(read)().parse(sql, error_level=error_level)
+        ]
+    return results
+
+
+def _run(
+    sql: str,
+    read: t.Optional[str | Dialect],
+    write: t.Optional[str | Dialect],
+    workers: int,
+    parse_opts: t.Dict[str, t.Any],
+    generate_opts: t.Optional[t.Dict[str, t.Any]],
+) -> t.Optional[t.List]:
+    if len(sql) < MIN_PARALLEL_SIZE:
+        return None
+
+    dialect = Dialect.get_or_raise(read)()
+    statements = dialect.tokenizer.split(sql)
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init,
+        initargs=(read, write, parse_opts, generate_opts),
+    ) as pool:
+        chunksize = max(1, len(statements) // (workers * 4))
+        results = list(pool.map(_process, statements, chunksize=chunksize))
+
+    processed = [result for result in results if result is not None]
+    if len(processed) < len(results):
+        return None
+
+    # the errors are raised or logged again by a parser of the whole input, as they would have been
+    # by a sequential parse, at the position of each statement's first token within the input
+    parser = dialect.parser(**parse_opts)
+    parser.sql = sql
+    line = col = 1
+
+    output: t.List = []
+    for values, errors, message, (end_line, end_col) in processed:
+        if errors and all(error.get("line") for error in errors):
+            _raise_errors(parser, errors, line, col)
+            if message is None:
+                for error in parser.errors:
+                    logger.error(str(error))
+                parser.errors = []
+            else:
+                parser.check_errors()
+        elif message is not None:
+            raise ParseError(message, errors=errors)
+
+        output.extend(values)
+        line, col = (line, col + end_col - 1) if end_line == 1 else (line + end_line - 1, end_col)
+    return output
+
+
+def _raise_errors(parser: Parser, errors: t.List[t.Dict[str, t.Any]], line: int, col: int) -> None:
+    """Raises the errors of the statement that starts at `line` and `col` again, with `parser`."""
+    for error in errors:
+        highlight = error["highlight"] or ""
+        error_line = line + error["line"] - 1
+        error_col = error["col"] + col - 1 if error["line"] == 1 else error["col"]
+        # the token's column is that of its end, which the constructor moves to its start
+        token = Token(TokenType.VAR, highlight, error_line, error_col + len(highlight))
+        parser.raise_error(error["description"], token)
+
+
+def _init(
+    read: t.Optional[str | Dialect],
+    write: t.Optional[str | Dialect],
+    parse_opts: t.Dict[str, t.Any],
+    generate_opts: t.Optional[t.Dict[str, t.Any]],
+) -> None:
+    dialect = Dialect.get_or_raise(read)()
+    warn = parse_opts.get("error_level") == ErrorLevel.WARN
+
+    _WORKER["tokenizer"] = dialect.tokenizer
+    _WORKER["parser"] = dialect.parser(**parse_opts)
+    _WORKER["warn"] = warn
+    _WORKER["generator"] = (
+        None if generate_opts is None else Dialect.get_or_raise(write)().generator(**generate_opts)
+    )
+
+
+def _process(
+    sql: str,
+) -> t.Optional[t.Tuple[t.List, t.List[t.Dict[str, t.Any]], t.Optional[str], t.Tuple[int, int]]]:
+    tokenizer = _WORKER["tokenizer"]
+    try:
+        tokens = tokenizer.tokenize(sql)
+    except Exception:
+        return None
+
+    # the line and column at which the tokenizer stopped, from which the next statement starts
+    end = (tokenizer._line, tokenizer._col)
+
+    # the statement was split differently by the tokenizer
+    if any(token.token_type == TokenType.SEMICOLON for token in tokens[:-1]):
+        return None
+
+    parser = _WORKER["parser"]
+    # warnings are logged by the main process, in the order of the statements
+    logger.disabled = _WORKER["warn"]
+    try:
+        expressions = parser.parse(tokens, sql)
+    except ParseError as e:
+        return [], e.errors, str(e), end
+    finally:
+        logger.disabled = False
+
+    warnings = [e.errors[0] for e in parser.errors] if _WORKER["warn"] else []
+    generator = _WORKER["generator"]
+
+    if generator:
+        return [generator.generate(expression) for expression in expressions], warnings, None, end
+    return [_dump(expression) for expression in expressions], warnings, None, end
+
+
+def _dump(expression: t.Optional[exp.Expression]) -> t.Optional[t.List[t.Tuple]]:
+    """
+    Flattens `expression` into a list of nodes, in which the children come before their parents.
+    Unlike the expression itself, it can be pickled regardless of how deep the tree is.
+    """
+    if expression is None:
+        return None
+
+    nodes = [node for node, _, _ in expression.bfs()][::-1]
+    index = {id(node): i for i, node in enumerate(nodes)}
+
+    def encode(value: t.Any) -> t.Tuple:
+        if isinstance(value, exp.Expression):
+            return (1, index[id(value)])
+        if isinstance(value, list):
+            return (2, [encode(v) for v in value])
+        return (0, value)
+
+    return [
+        (type(node), [(k, encode(v)) for k, v in node.args.items()], node.comments)
+        for node in nodes
+    ]
+
+
+def _load(nodes: t.Optional[t.List[t.Tuple]]) -> t.Optional[exp.Expression]:
+    if nodes is None:
+        return None
+
+    built: t.List[exp.Expression] = []
+
+    for klass, encoded, comments in nodes:
+        args = {}
+        for key, (kind, value) in encoded:
+            if kind == 1:
+                value = built[value]
+            elif kind == 2:
+                value = [built[v] if k == 1 else v for k, v in value]
+            args[key] = value
+
+        # the constructor sets the parents of the children
+        node = klass(**args)
+        node.comments = comments
+        built.append(node)
+
+    return built[-1]
@@ -4,7 +4,13 @@ import logging
 import typing as t
 
 from sqlglot import exp
-from sqlglot.errors import ErrorLevel, ParseError, concat_messages, merge_errors
+from sqlglot.errors import (
+    ErrorLevel,
+    ErrorRecord,
+    ParseError,
+    concat_messages,
+    merge_errors,
+)
 from sqlglot.helper import (
     apply_index_offset,
     count_params,
@@ -12,11 +18,84 @@ from sqlglot.helper import (
     ensure_list,
     seq_get,
 )
-from sqlglot.tokens import Token, Tokenizer, TokenType
+from sqlglot.tokens import Token, TokenBuffer, Tokenizer, TokenType
 from sqlglot.trie import in_trie, new_trie
 
 logger = logging.getLogger("sqlglot")
 
+# the precedence levels of the binary operators, see Parser._parse_binary
+CONJUNCTION_LEVEL = 0
+EQUALITY_LEVEL = 1
+COMPARISON_LEVEL = 2
+RANGE_LEVEL = 3
+BITWISE_LEVEL = 4
+TERM_LEVEL = 5
+FACTOR_LEVEL = 6
+
+# the token types, other than the keys of RANGE_PARSERS, that start a range operator
+RANGE_OPERATORS = {TokenType.NOT, TokenType.ISNULL, TokenType.NOTNULL, TokenType.IS}
+
+# the token types that start a bitwise shift, i.e. << and >>
+SHIFTS = {
+    TokenType.LT: exp.BitwiseLeftShift,
+    TokenType.GT: exp.BitwiseRightShift,
+}
+
+# the tables of parsers that `_Parser` compiles into dispatch tables, e.g. STATEMENT_PARSERS into
+# _statement_parsers, in which the `ParserMethod`s are replaced by the methods they call
+DISPATCH_TABLES = (
+    "STATEMENT_PARSERS",
+    "UNARY_PARSERS",
+    "PRIMARY_PARSERS",
+    "RANGE_PARSERS",
+    "PROPERTY_PARSERS",
+    "CONSTRAINT_PARSERS",
+    "NO_PAREN_FUNCTION_PARSERS",
+    "FUNCTION_PARSERS",
+    "QUERY_MODIFIER_PARSERS",
+)
+
+# the class attributes that `_Parser` compiles into other tables, which are compiled again when
+# one of them is assigned
+COMPILED_ATTRIBUTES = {
+    *DISPATCH_TABLES,
+    "SHOW_PARSERS",
+    "SET_PARSERS",
+    "CONJUNCTION",
+    "EQUALITY",
+    "COMPARISON",
+    "BITWISE",
+    "TERM",
+    "FACTOR",
+}
+
+
+class ParserMethod:
+    """
+    A parser in one of the `DISPATCH_TABLES` that calls a method of the parser with the same
+    arguments, e.g. `ParserMethod("_parse_where")` instead of `lambda self: self._parse_where()`.
+    The dispatch tables contain the method itself, which saves a call.
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __call__(self, parser: Parser, *args: t.Any) -> t.Any:
+        return getattr(parser, self.name)(*args)
+
+    def __repr__(self) -> str:
+        return f"ParserMethod({self.name!r})"
+
+
+def _bind(klass: t.Type[Parser], parser: t.Callable) -> t.Callable:
+    """Returns the method of `klass` that `parser` calls if it's a `ParserMethod`, or `parser`."""
+    if isinstance(parser, ParserMethod):
+        # the method may not be defined yet, in which case it's looked up when it's called
+        return getattr(klass, parser.name, parser)
+    return parser
+
 
 def parse_var_map(args):
     keys = []
@@ -33,10 +112,58 @@ def parse_var_map(args):
 class _Parser(type):
     def __new__(cls, clsname, bases, attrs):
         klass = super().__new__(cls, clsname, bases, attrs)
-        klass._show_trie = new_trie(key.split(" ") for key in klass.SHOW_PARSERS)
-        klass._set_trie = new_trie(key.split(" ") for key in klass.SET_PARSERS)
+        klass._compile()
         return klass
 
+    def __setattr__(cls, name, value):
+        super().__setattr__(name, value)
+
+        # the compiled tables of the class and of the subclasses that inherit the attribute, or the
+        # method that a `ParserMethod` calls, are out of date
+        if name in COMPILED_ATTRIBUTES or name.startswith("_parse"):
+            classes = [cls]
+            while classes:
+                klass = classes.pop()
+                klass._compile()
+                classes.extend(klass.__subclasses__())
+
+    def _compile(cls):
+        cls._show_trie = new_trie(key.split(" ") for key in cls.SHOW_PARSERS)
+        cls._set_trie = new_trie(key.split(" ") for key in cls.SET_PARSERS)
+
+        for name in DISPATCH_TABLES:
+            setattr(
+                cls,
+                f"_{name.lower()}",
+                {key: _bind(cls, parser) for key, parser in getattr(cls, name).items()},
+            )
+        cls._query_modifier_parsers = tuple(cls._query_modifier_parsers.items())
+
+        cls._binary_levels = (
+            cls.CONJUNCTION,
+            cls.EQUALITY,
+            cls.COMPARISON,
+            {},
+            cls.BITWISE,
+            cls.TERM,
+            cls.FACTOR,
+        )
+
+        # maps each token type to the levels it can be an operator of, from the highest down
+        levels: t.Dict[TokenType, t.Set[int]] = {}
+        for level, operators in enumerate(cls._binary_levels):
+            for token_type in operators:
+                levels.setdefault(token_type, set()).add(level)
+        for token_type in {*cls.RANGE_PARSERS, *RANGE_OPERATORS}:
+            levels.setdefault(token_type, set()).add(RANGE_LEVEL)
+        for token_type in SHIFTS:
+            levels.setdefault(token_type, set()).add(BITWISE_LEVEL)
+
+        cls._binary_tokens = {
+            token_type: tuple(sorted(token_levels, reverse=True))
+            for token_type, token_levels in levels.items()
+        }
+
 
 class Parser(metaclass=_Parser):
     """
@@ -422,27 +549,27 @@ class Parser(metaclass=_Parser):
     }
 
     STATEMENT_PARSERS = {
-        TokenType.ALTER: lambda self: self._parse_alter(),
-        TokenType.BEGIN: lambda self: self._parse_transaction(),
-        TokenType.CACHE: lambda self: self._parse_cache(),
-        TokenType.COMMIT: lambda self: self._parse_commit_or_rollback(),
-        TokenType.CREATE: lambda self: self._parse_create(),
-        TokenType.DELETE: lambda self: self._parse_delete(),
-        TokenType.DESC: lambda self: self._parse_describe(),
-        TokenType.DESCRIBE: lambda self: self._parse_describe(),
-        TokenType.DROP: lambda self: self._parse_drop(),
-        TokenType.END: lambda self: self._parse_commit_or_rollback(),
-        TokenType.INSERT: lambda self: self._parse_insert(),
-        TokenType.LOAD_DATA: lambda self: self._parse_load_data(),
-        TokenType.MERGE: lambda self: self._parse_merge(),
-        TokenType.ROLLBACK: lambda self: self._parse_commit_or_rollback(),
-        TokenType.UNCACHE: lambda self: self._parse_uncache(),
-        TokenType.UPDATE: lambda self: self._parse_update(),
+        TokenType.ALTER: ParserMethod("_parse_alter"),
+        TokenType.BEGIN: ParserMethod("_parse_transaction"),
+        TokenType.CACHE: ParserMethod("_parse_cache"),
+        TokenType.COMMIT: ParserMethod("_parse_commit_or_rollback"),
+        TokenType.CREATE: ParserMethod("_parse_create"),
+        TokenType.DELETE: ParserMethod("_parse_delete"),
+        TokenType.DESC: ParserMethod("_parse_describe"),
+        TokenType.DESCRIBE: ParserMethod("_parse_describe"),
+        TokenType.DROP: ParserMethod("_parse_drop"),
+        TokenType.END: ParserMethod("_parse_commit_or_rollback"),
+        TokenType.INSERT: ParserMethod("_parse_insert"),
+        TokenType.LOAD_DATA: ParserMethod("_parse_load_data"),
+        TokenType.MERGE: ParserMethod("_parse_merge"),
+        TokenType.ROLLBACK: ParserMethod("_parse_commit_or_rollback"),
+        TokenType.UNCACHE: ParserMethod("_parse_uncache"),
+        TokenType.UPDATE: ParserMethod("_parse_update"),
         TokenType.USE: lambda self: self.expression(exp.Use, this=self._parse_id_var()),
     }
 
     UNARY_PARSERS = {
-        TokenType.PLUS: lambda self: self._parse_unary(),  # Unary + is handled as a no-op
+        TokenType.PLUS: ParserMethod("_parse_unary"),  # Unary + is handled as a no-op
         TokenType.NOT: lambda self: self.expression(exp.Not, this=self._parse_equality()),
         TokenType.TILDA: lambda self: self.expression(exp.BitwiseNot, this=self._parse_unary()),
         TokenType.DASH: lambda self: self.expression(exp.Neg, this=self._parse_unary()),
@@ -468,15 +595,15 @@ class Parser(metaclass=_Parser):
         TokenType.BIT_STRING: lambda self, token: self.expression(exp.BitString, this=token.text),
         TokenType.HEX_STRING: lambda self, token: self.expression(exp.HexString, this=token.text),
         TokenType.BYTE_STRING: lambda self, token: self.expression(exp.ByteString, this=token.text),
-        TokenType.INTRODUCER: lambda self, token: self._parse_introducer(token),
-        TokenType.NATIONAL: lambda self, token: self._parse_national(token),
+        TokenType.INTRODUCER: ParserMethod("_parse_introducer"),
+        TokenType.NATIONAL: ParserMethod("_parse_national"),
         TokenType.SESSION_PARAMETER: lambda self, _: self._parse_session_parameter(),
     }
 
     RANGE_PARSERS = {
-        TokenType.BETWEEN: lambda self, this: self._parse_between(this),
-        TokenType.IN: lambda self, this: self._parse_in(this),
-        TokenType.IS: lambda self, this: self._parse_is(this),
+        TokenType.BETWEEN: ParserMethod("_parse_between"),
+        TokenType.IN: ParserMethod("_parse_in"),
+        TokenType.IS: ParserMethod("_parse_is"),
         TokenType.LIKE: lambda self, this: self._parse_escape(
             self.expression(exp.Like, this=this, expression=self._parse_bitwise())
         ),
@@ -498,19 +625,19 @@ class Parser(metaclass=_Parser):
         TokenType.AUTO_INCREMENT: lambda self: self._parse_property_assignment(
             exp.AutoIncrementProperty
         ),
-        TokenType.CHARACTER_SET: lambda self: self._parse_character_set(),
+        TokenType.CHARACTER_SET: ParserMethod("_parse_character_set"),
         TokenType.LOCATION: lambda self: self._parse_property_assignment(exp.LocationProperty),
-        TokenType.PARTITIONED_BY: lambda self: self._parse_partitioned_by(),
+        TokenType.PARTITIONED_BY: ParserMethod("_parse_partitioned_by"),
         TokenType.SCHEMA_COMMENT: lambda self: self._parse_property_assignment(
             exp.SchemaCommentProperty
         ),
         TokenType.STORED: lambda self: self._parse_property_assignment(exp.FileFormatProperty),
-        TokenType.DISTKEY: lambda self: self._parse_distkey(),
+        TokenType.DISTKEY: ParserMethod("_parse_distkey"),
         TokenType.DISTSTYLE: lambda self: self._parse_property_assignment(exp.DistStyleProperty),
-        TokenType.SORTKEY: lambda self: self._parse_sortkey(),
-        TokenType.LIKE: lambda self: self._parse_create_like(),
-        TokenType.RETURNS: lambda self: self._parse_returns(),
-        TokenType.ROW: lambda self: self._parse_row(),
+        TokenType.SORTKEY: ParserMethod("_parse_sortkey"),
+        TokenType.LIKE: ParserMethod("_parse_create_like"),
+        TokenType.RETURNS: ParserMethod("_parse_returns"),
+        TokenType.ROW: ParserMethod("_parse_row"),
         TokenType.COLLATE: lambda self: self._parse_property_assignment(exp.CollateProperty),
         TokenType.COMMENT: lambda self: self._parse_property_assignment(exp.SchemaCommentProperty),
         TokenType.FORMAT: lambda self: self._parse_property_assignment(exp.FileFormatProperty),
@@ -540,40 +667,40 @@ class Parser(metaclass=_Parser):
         TokenType.CHECK: lambda self: self.expression(
             exp.Check, this=self._parse_wrapped(self._parse_conjunction)
         ),
-        TokenType.FOREIGN_KEY: lambda self: self._parse_foreign_key(),
-        TokenType.UNIQUE: lambda self: self._parse_unique(),
-        TokenType.LIKE: lambda self: self._parse_create_like(),
+        TokenType.FOREIGN_KEY: ParserMethod("_parse_foreign_key"),
+        TokenType.UNIQUE: ParserMethod("_parse_unique"),
+        TokenType.LIKE: ParserMethod("_parse_create_like"),
     }
 
     NO_PAREN_FUNCTION_PARSERS = {
-        TokenType.CASE: lambda self: self._parse_case(),
-        TokenType.IF: lambda self: self._parse_if(),
+        TokenType.CASE: ParserMethod("_parse_case"),
+        TokenType.IF: ParserMethod("_parse_if"),
     }
 
     FUNCTION_PARSERS = {
         "CONVERT": lambda self: self._parse_convert(self.STRICT_CAST),
         "TRY_CONVERT": lambda self: self._parse_convert(False),
-        "EXTRACT": lambda self: self._parse_extract(),
-        "POSITION": lambda self: self._parse_position(),
-        "SUBSTRING": lambda self: self._parse_substring(),
-        "TRIM": lambda self: self._parse_trim(),
+        "EXTRACT": ParserMethod("_parse_extract"),
+        "POSITION": ParserMethod("_parse_position"),
+        "SUBSTRING": ParserMethod("_parse_substring"),
+        "TRIM": ParserMethod("_parse_trim"),
         "CAST": lambda self: self._parse_cast(self.STRICT_CAST),
         "TRY_CAST": lambda self: self._parse_cast(False),
-        "STRING_AGG": lambda self: self._parse_string_agg(),
+        "STRING_AGG": ParserMethod("_parse_string_agg"),
     }
 
     QUERY_MODIFIER_PARSERS = {
-        "where": lambda self: self._parse_where(),
-        "group": lambda self: self._parse_group(),
-        "having": lambda self: self._parse_having(),
-        "qualify": lambda self: self._parse_qualify(),
-        "windows": lambda self: self._parse_window_clause(),
+        "where": ParserMethod("_parse_where"),
+        "group": ParserMethod("_parse_group"),
+        "having": ParserMethod("_parse_having"),
+        "qualify": ParserMethod("_parse_qualify"),
+        "windows": ParserMethod("_parse_window_clause"),
         "distribute": lambda self: self._parse_sort(TokenType.DISTRIBUTE_BY, exp.Distribute),
         "sort": lambda self: self._parse_sort(TokenType.SORT_BY, exp.Sort),
         "cluster": lambda self: self._parse_sort(TokenType.CLUSTER_BY, exp.Cluster),
-        "order": lambda self: self._parse_order(),
-        "limit": lambda self: self._parse_limit(),
-        "offset": lambda self: self._parse_offset(),
+        "order": ParserMethod("_parse_order"),
+        "limit": ParserMethod("_parse_limit"),
+        "offset": ParserMethod("_parse_offset"),
     }
 
     SHOW_PARSERS: t.Dict[str, t.Callable] = {}
@@ -581,6 +708,35 @@ class Parser(metaclass=_Parser):
 
     MODIFIABLES = (exp.Subquery, exp.Subqueryable, exp.Table)
 
+    # With ErrorLevel.RECOVER, parsing resumes after an error at the next of these tokens. The
+    # clauses are added to the last statement, while the other tokens start a new one
+    RECOVERY_CLAUSES = {
+        TokenType.WHERE,
+        TokenType.GROUP_BY,
+        TokenType.HAVING,
+        TokenType.QUALIFY,
+        TokenType.WINDOW,
+        TokenType.DISTRIBUTE_BY,
+        TokenType.SORT_BY,
+        TokenType.CLUSTER_BY,
+        TokenType.ORDER_BY,
+        TokenType.LIMIT,
+        TokenType.OFFSET,
+    }
+    RECOVERY_STATEMENTS = {
+        TokenType.ALTER,
+        TokenType.CACHE,
+        TokenType.CREATE,
+        TokenType.DELETE,
+        TokenType.DROP,
+        TokenType.INSERT,
+        TokenType.MERGE,
+        TokenType.SELECT,
+        TokenType.UNCACHE,
+        TokenType.UPDATE,
+        TokenType.WITH,
+    }
+
     CREATABLES = {
         TokenType.COLUMN,
         TokenType.FUNCTION,
@@ -598,6 +754,9 @@ class Parser(metaclass=_Parser):
 
     STRICT_CAST = True
 
+    # VALUES lists of literals with at least this many rows are parsed into a compact Rows node
+    BULK_VALUES_MIN_ROWS = 100
+
     __slots__ = (
         "error_level",
         "error_message_context",
@@ -610,11 +769,14 @@ class Parser(metaclass=_Parser):
         "null_ordering",
         "_tokens",
         "_chunks",
+        "_chunk_index",
+        "_sql_start",
         "_index",
         "_curr",
         "_next",
         "_prev",
         "_prev_comments",
+        "_broken",
         "_show_trie",
         "_set_trie",
     )
@@ -643,34 +805,45 @@ class Parser(metaclass=_Parser):
         self.errors = []
         self._tokens = []
         self._chunks = [[]]
+        self._chunk_index = 0
+        self._sql_start = (1, 1)
         self._index = 0
         self._curr = None
         self._next = None
         self._prev = None
         self._prev_comments = None
+        self._broken = []
 
     def parse(
-        self, raw_tokens: t.List[Token], sql: t.Optional[str] = None
+        self,
+        raw_tokens: t.List[Token] | TokenBuffer,
+        sql: t.Optional[str] = None,
+        sql_start: t.Tuple[int, int] = (1, 1),
     ) -> t.List[t.Optional[exp.Expression]]:
         """
         Parses a list of tokens and returns a list of syntax trees, one tree
         per parsed SQL statement.
 
         Args:
-            raw_tokens: the list of tokens.
+            raw_tokens: the list of tokens, or a `TokenBuffer`.
             sql: the original SQL string, used to produce helpful debug messages.
+            sql_start: the line and column at which `sql` starts, when it's only the part of the
+                input that the tokens were read from, e.g. a statement of a script.
 
         Returns:
             The list of syntax trees.
         """
         return self._parse(
-            parse_method=self.__class__._parse_statement, raw_tokens=raw_tokens, sql=sql
+            parse_method=self.__class__._parse_statement,
+            raw_tokens=raw_tokens,
+            sql=sql,
+            sql_start=sql_start,
         )
 
     def parse_into(
         self,
         expression_types: str | exp.Expression | t.Collection[exp.Expression | str],
-        raw_tokens: t.List[Token],
+        raw_tokens: t.List[Token] | TokenBuffer,
         sql: t.Optional[str] = None,
     ) -> t.List[t.Optional[exp.Expression]]:
         """
@@ -680,7 +853,7 @@ class Parser(metaclass=_Parser):
 
         Args:
             expression_types: the expression type(s) to try and parse the token list into.
-            raw_tokens: the list of tokens.
+            raw_tokens: the list of tokens, or a `TokenBuffer`.
             sql: the original SQL string, used to produce helpful debug messages.
 
         Returns:
@@ -704,26 +877,39 @@ class Parser(metaclass=_Parser):
     def _parse(
         self,
         parse_method: t.Callable[[Parser], t.Optional[exp.Expression]],
-        raw_tokens: t.List[Token],
+        raw_tokens: t.List[Token] | TokenBuffer,
         sql: t.Optional[str] = None,
+        sql_start: t.Tuple[int, int] = (1, 1),
     ) -> t.List[t.Optional[exp.Expression]]:
         self.reset()
         self.sql = sql or ""
+        self._sql_start = sql_start
         total = len(raw_tokens)
 
-        for i, token in enumerate(raw_tokens):
-            if token.token_type == TokenType.SEMICOLON:
-                if i < total - 1:
-                    self._chunks.append([])
-            else:
-                self._chunks[-1].append(token)
+        if isinstance(raw_tokens, TokenBuffer):
+            self._chunks = raw_tokens.split(TokenType.SEMICOLON)  # type: ignore
+        else:
+            for i, token in enumerate(raw_tokens):
+                if token.token_type == TokenType.SEMICOLON:
+                    if i < total - 1:
+                        self._chunks.append([])
+                else:
+                    self._chunks[-1].append(token)
 
         expressions = []
 
-        for tokens in self._chunks:
+        for i, tokens in enumerate(self._chunks):
+            self._chunk_index = i
             self._index = -1
+            # the tokens of a buffer are created one at a time as the parser advances, so that they
+            # aren't all held in memory, even for a huge statement
             self._tokens = tokens
             self._advance()
+
+            if self.error_level == ErrorLevel.RECOVER:
+                expressions.extend(self._parse_recovering(parse_method))
+                continue
+
             expressions.append(parse_method(self))
 
             if self._index < len(self._tokens):
@@ -733,6 +919,80 @@ class Parser(metaclass=_Parser):
 
         return expressions
 
+    def _parse_recovering(
+        self, parse_method: t.Callable[[Parser], t.Optional[exp.Expression]]
+    ) -> t.List[t.Optional[exp.Expression]]:
+        """
+        Parses the current chunk of tokens with ErrorLevel.RECOVER. When tokens are left over, or
+        when the parser fails with an exception, the error is recorded and parsing resumes at the
+        next token of RECOVERY_CLAUSES or RECOVERY_STATEMENTS. The trees that were parsed so far,
+        including any partial ones, are kept, so a chunk can result in several trees.
+        """
+        expressions: t.List[t.Optional[exp.Expression]] = []
+        tokens = self._tokens
+
+        while True:
+            start = self._index
+            last = expressions[-1] if expressions else None
+
+            try:
+                if (
+                    self._curr
+                    and self._curr.token_type in self.RECOVERY_CLAUSES
+                    and isinstance(last, self.MODIFIABLES)
+                ):
+                    self._parse_query_modifiers(last)
+                else:
+                    expressions.append(parse_method(self))
+
+                self._prune(expressions)
+                if self._index >= len(tokens):
+                    break
+                self.raise_error("Invalid expression / Unexpected token")
+            except ParseError as e:
+                self._prune(expressions)
+                self.raise_error(str(e))
+
+            index = max(self._index, start + 1)
+            while index < len(tokens) and not (
+                tokens[index].token_type in self.RECOVERY_CLAUSES
+                or tokens[index].token_type in self.RECOVERY_STATEMENTS
+            ):
+                index += 1
+
+            if index >= len(tokens):
+                break
+            self._retreat(index)
+
+        return [expression for expression in expressions if expression] or [None]
+
+    def _prune(self, expressions: t.List[t.Optional[exp.Expression]]) -> None:
+        """
+        Removes the clauses that contain an expression which is missing a required arg from the
+        trees parsed with ErrorLevel.RECOVER, since they can't be generated into valid SQL. A tree
+        that's missing one itself, or that's left without any `expressions`, is dropped.
+        """
+        broken, self._broken = self._broken, []
+
+        for node in broken:
+            clause = node
+            while clause.parent and clause.parent.parent:
+                clause = clause.parent
+            root = clause.parent or clause
+
+            # the node may have been discarded, e.g. when the parser backtracked
+            i = next((i for i, e in enumerate(expressions) if e is root), None)
+            if i is None:
+                continue
+
+            if clause is root:
+                expressions[i] = None
+            else:
+                arg_key = clause.arg_key
+                clause.pop()
+                if arg_key == "expressions" and not root.expressions:
+                    expressions[i] = None
+
     def check_errors(self) -> None:
         """
         Logs or raises any found errors, depending on the chosen error level setting.
@@ -745,12 +1005,30 @@ class Parser(metaclass=_Parser):
                 concat_messages(self.errors, self.max_errors),
                 errors=merge_errors(self.errors),
             )
+        elif self.error_level == ErrorLevel.RECOVER:
+            # the records are kept in `errors` for the caller, see `sqlglot.parse_recovering`
+            return
 
     def raise_error(self, message: str, token: t.Optional[Token] = None) -> None:
         """
         Appends an error in the list of recorded errors or raises it, depending on the chosen
         error level setting.
         """
+        if self.error_level == ErrorLevel.RECOVER:
+            index = self._index - 1 if token is not None and token is self._prev else self._index
+            token = token or self._curr or self._prev or Token.string("")
+
+            # an error usually leads to others at the same token, e.g. an expression that's missing
+            # its operand and the unexpected token that follows it, so only the first is recorded
+            last = self.errors[-1] if self.errors else None
+            if last and last.statement == self._chunk_index and last.index == index:
+                return
+
+            self.errors.append(
+                ErrorRecord(message, self._chunk_index, index, token.line, token.col)
+            )
+            return
+
         token = token or self._curr or self._prev or Token.string("")
         start = self._find_token(token, self.sql)
         end = start + len(token.text)
@@ -818,6 +1096,8 @@ class Parser(metaclass=_Parser):
             v = expression.args.get(k)
             if mandatory and (v is None or (isinstance(v, list) and not v)):
                 self.raise_error(f"Required keyword: '{k}' missing for {expression.__class__}")
+                if self.error_level == ErrorLevel.RECOVER:
+                    self._broken.append(expression)
 
         if (
             args
@@ -831,8 +1111,7 @@ class Parser(metaclass=_Parser):
             )
 
     def _find_token(self, token: Token, sql: str) -> int:
-        line = 1
-        col = 1
+        line, col = self._sql_start
         index = 0
 
         while line < token.line or col < token.col:
@@ -847,14 +1126,17 @@ class Parser(metaclass=_Parser):
 
     def _advance(self, times: int = 1) -> None:
         self._index += times
-        self._curr = seq_get(self._tokens, self._index)
-        self._next = seq_get(self._tokens, self._index + 1)
-        if self._index > 0:
-            self._prev = self._tokens[self._index - 1]
-            self._prev_comments = self._prev.comments
+
+        # when moving to the next token, the current and next tokens are reused, which matters for
+        # a `TokenBuffer` that creates a new token every time it's indexed
+        if times == 1 and self._index > 0:
+            self._prev = self._curr
+            self._curr = self._next
         else:
-            self._prev = None
-            self._prev_comments = None
+            self._curr = seq_get(self._tokens, self._index)
+            self._prev = self._tokens[self._index - 1] if self._index > 0 else None
+        self._next = seq_get(self._tokens, self._index + 1)
+        self._prev_comments = self._prev.comments if self._prev else None
 
     def _retreat(self, index: int) -> None:
         self._advance(index - self._index)
@@ -863,8 +1145,9 @@ class Parser(metaclass=_Parser):
         if self._curr is None:
             return None
 
-        if self._match_set(self.STATEMENT_PARSERS):
-            return self.STATEMENT_PARSERS[self._prev.token_type](self)
+        parser = self._match_parser(self._statement_parsers)  # type: ignore
+        if parser:
+            return parser(self)
 
         if self._match_set(Tokenizer.COMMANDS):
             return self.expression(
@@ -970,8 +1253,9 @@ class Parser(metaclass=_Parser):
         )
 
     def _parse_property(self) -> t.Optional[exp.Expression]:
-        if self._match_set(self.PROPERTY_PARSERS):
-            return self.PROPERTY_PARSERS[self._prev.token_type](self)
+        parser = self._match_parser(self._property_parsers)  # type: ignore
+        if parser:
+            return parser(self)
 
         if self._match_pair(TokenType.DEFAULT, TokenType.CHARACTER_SET):
             return self._parse_character_set(True)
@@ -1223,6 +1507,88 @@ class Parser(metaclass=_Parser):
         expressions = self._parse_wrapped_csv(self._parse_conjunction)
         return self.expression(exp.Tuple, expressions=expressions)
 
+    def _parse_rows(self) -> t.Optional[exp.Expression]:
+        """
+        Parses a list of rows that only contain literals, e.g. those of a large INSERT statement,
+        into a single Rows expression, without creating an expression for each value.
+
+        Returns None without consuming any token if the list has fewer than BULK_VALUES_MIN_ROWS
+        rows, or if it contains anything else, e.g. comments or columns whose values are both
+        strings and numbers. The list is then parsed into Tuple expressions as usual.
+        """
+        tokens = self._tokens
+        size = len(tokens)
+        index = self._index
+        rows: t.List[t.Tuple[t.Optional[str | bool], ...]] = []
+        strings: t.List[t.Optional[bool]] = []
+
+        while True:
+            if index >= size or tokens[index].token_type != TokenType.L_PAREN:
+                return None
+
+            row: t.List[t.Optional[str | bool]] = []
+
+            while True:
+                if tokens[index].comments or index + 2 >= size:
+                    return None
+
+                token = tokens[index + 1]
+                token_type = token.token_type
+                index += 2
+
+                if token.comments:
+                    return None
+                if token_type == TokenType.STRING or token_type == TokenType.NUMBER:
+                    value: t.Optional[str | bool] = token.text
+                    string: t.Optional[bool] = token_type == TokenType.STRING
+                elif token_type == TokenType.DASH:
+                    token = tokens[index]
+                    if token.token_type != TokenType.NUMBER or token.comments:
+                        return None
+                    value, string = f"-{token.text}", False
+                    index += 1
+                elif token_type == TokenType.NULL:
+                    value, string = None, None
+                elif token_type == TokenType.TRUE or token_type == TokenType.FALSE:
+                    value, string = token_type == TokenType.TRUE, None
+                else:
+                    return None
+
+                column = len(row)
+                if column == len(strings):
+                    if rows:
+                        return None
+                    strings.append(string)
+                elif string is not None and strings[column] != string:
+                    if strings[column] is not None:
+                        return None
+                    strings[column] = string
+
+                row.append(value)
+
+                if index >= size or tokens[index].token_type != TokenType.COMMA:
+                    break
+
+            if index >= size or tokens[index].token_type != TokenType.R_PAREN:
+                return None
+            if tokens[index].comments or (rows and len(row) != len(strings)):
+                return None
+
+            rows.append(tuple(row))
+            index += 1
+
+            if index >= size or tokens[index].token_type != TokenType.COMMA:
+                break
+            if tokens[index].comments:
+                return None
+            index += 1
+
+        if len(rows) < self.BULK_VALUES_MIN_ROWS:
+            return None
+
+        self._advance(index - self._index)
+        return self.expression(exp.Rows, rows=rows, strings=[bool(string) for string in strings])
+
     def _parse_select(
         self, nested: bool = False, table: bool = False
     ) -> t.Optional[exp.Expression]:
@@ -1288,8 +1654,9 @@ class Parser(metaclass=_Parser):
             return self._parse_subquery(this)
         elif self._match(TokenType.VALUES):
             if self._curr.token_type == TokenType.L_PAREN:
+                rows = self._parse_rows()
                 # We don't consume the left paren because it's consumed in _parse_value
-                expressions = self._parse_csv(self._parse_value)
+                expressions = [rows] if rows else self._parse_csv(self._parse_value)
             else:
                 # In presto we can have VALUES 1, 2 which results in 1 column & 2 rows.
                 # Source: https://prestodb.io/docs/current/sql/values.html
@@ -1386,7 +1753,7 @@ class Parser(metaclass=_Parser):
             if not (lateral or join or comma):
                 break
 
-        for key, parser in self.QUERY_MODIFIER_PARSERS.items():
+        for key, parser in self._query_modifier_parsers:  # type: ignore
             expression = parser(self)
 
             if expression:
@@ -1838,20 +2205,23 @@ class Parser(metaclass=_Parser):
         return self._parse_alias(self._parse_conjunction())
 
     def _parse_conjunction(self) -> t.Optional[exp.Expression]:
-        return self._parse_tokens(self._parse_equality, self.CONJUNCTION)
+        return self._parse_binary(CONJUNCTION_LEVEL)
 
     def _parse_equality(self) -> t.Optional[exp.Expression]:
-        return self._parse_tokens(self._parse_comparison, self.EQUALITY)
+        return self._parse_binary(EQUALITY_LEVEL)
 
     def _parse_comparison(self) -> t.Optional[exp.Expression]:
-        return self._parse_tokens(self._parse_range, self.COMPARISON)
+        return self._parse_binary(COMPARISON_LEVEL)
 
     def _parse_range(self) -> t.Optional[exp.Expression]:
-        this = self._parse_bitwise()
+        return self._parse_binary(RANGE_LEVEL)
+
+    def _parse_range_operator(self, this: t.Optional[exp.Expression]) -> t.Optional[exp.Expression]:
         negate = self._match(TokenType.NOT)
 
-        if self._match_set(self.RANGE_PARSERS):
-            this = self.RANGE_PARSERS[self._prev.token_type](self, this)
+        parser = self._match_parser(self._range_parsers)  # type: ignore
+        if parser:
+            this = parser(self, this)
         elif self._match(TokenType.ISNULL):
             this = self.expression(exp.Is, this=this, expression=exp.Null())
 
@@ -1912,37 +2282,82 @@ class Parser(metaclass=_Parser):
         return self.expression(exp.Escape, this=this, expression=self._parse_string())
 
     def _parse_bitwise(self) -> t.Optional[exp.Expression]:
-        this = self._parse_term()
+        return self._parse_binary(BITWISE_LEVEL)
 
-        while True:
-            if self._match_set(self.BITWISE):
-                this = self.expression(
-                    self.BITWISE[self._prev.token_type],
-                    this=this,
-                    expression=self._parse_term(),
-                )
-            elif self._match_pair(TokenType.LT, TokenType.LT):
-                this = self.expression(
-                    exp.BitwiseLeftShift, this=this, expression=self._parse_term()
-                )
-            elif self._match_pair(TokenType.GT, TokenType.GT):
-                this = self.expression(
-                    exp.BitwiseRightShift, this=this, expression=self._parse_term()
-                )
+    def _parse_term(self) -> t.Optional[exp.Expression]:
+        return self._parse_binary(TERM_LEVEL)
+
+    def _parse_factor(self) -> t.Optional[exp.Expression]:
+        return self._parse_binary(FACTOR_LEVEL)
+
+    def _parse_binary(self, min_level: int) -> t.Optional[exp.Expression]:
+        """
+        Parses a chain of binary operators, whose levels in `_binary_levels` are at least `min_level`,
+        with precedence climbing. The result is the same as that of a recursive descent method per
+        level, but the operators that are waiting for their right operand are kept on a stack, so
+        that each operand costs a single `_parse_unary` call instead of a call for every level.
+
+        The range operators, e.g. BETWEEN or IS NULL, are applied at most once to an operand, after
+        which only operators of a lower level can follow.
+        """
+        stack: t.List[t.Tuple[int, t.Any, t.Type[exp.Expression], t.Optional[t.List[str]]]] = []
+        this = self._parse_unary()
+        max_level = FACTOR_LEVEL
+
+        while self._curr:
+            token_type = self._curr.token_type
+
+            for level in self._binary_tokens.get(token_type, ()):  # type: ignore
+                if level < min_level:
+                    break
+                if level > max_level:
+                    continue
+                if level == BITWISE_LEVEL and token_type in SHIFTS:
+                    if self._next and self._next.token_type == token_type:
+                        break
+                    continue
+                break
             else:
+                level = -1
+
+            if level < min_level or level > max_level:
                 break
 
-        return this
+            while stack and stack[-1][0] >= level:
+                this = self._reduce_binary(stack.pop(), this)
 
-    def _parse_term(self) -> t.Optional[exp.Expression]:
-        return self._parse_tokens(self._parse_factor, self.TERM)
+            if level == RANGE_LEVEL:
+                this = self._parse_range_operator(this)
+                max_level = COMPARISON_LEVEL
+                continue
 
-    def _parse_factor(self) -> t.Optional[exp.Expression]:
-        return self._parse_tokens(self._parse_unary, self.FACTOR)
+            if level == BITWISE_LEVEL and token_type in SHIFTS:
+                self._advance(2)
+                stack.append((level, this, SHIFTS[token_type], None))
+            else:
+                self._advance()
+                comments = None if level == BITWISE_LEVEL else self._prev_comments
+                operator = self._binary_levels[level][token_type]  # type: ignore
+                stack.append((level, this, operator, comments))
+
+            this = self._parse_unary()
+            max_level = FACTOR_LEVEL
+
+        while stack:
+            this = self._reduce_binary(stack.pop(), this)
+
+        return this
+
+    def _reduce_binary(
+        self, operator: t.Tuple, expression: t.Optional[exp.Expression]
+    ) -> exp.Expression:
+        _, this, exp_class, comments = operator
+        return self.expression(exp_class, this=this, comments=comments, expression=expression)
 
     def _parse_unary(self) -> t.Optional[exp.Expression]:
-        if self._match_set(self.UNARY_PARSERS):
-            return self.UNARY_PARSERS[self._prev.token_type](self)
+        parser = self._match_parser(self._unary_parsers)  # type: ignore
+        if parser:
+            return parser(self)
         return self._parse_at_time_zone(self._parse_type())
 
     def _parse_type(self) -> t.Optional[exp.Expression]:
@@ -2107,9 +2522,10 @@ class Parser(metaclass=_Parser):
         return this
 
     def _parse_primary(self) -> t.Optional[exp.Expression]:
-        if self._match_set(self.PRIMARY_PARSERS):
+        parser = self._match_parser(self._primary_parsers)  # type: ignore
+        if parser:
             token_type = self._prev.token_type
-            primary = self.PRIMARY_PARSERS[token_type](self, self._prev)
+            primary = parser(self, self._prev)
 
             if token_type == TokenType.STRING:
                 expressions = [primary]
@@ -2164,8 +2580,9 @@ class Parser(metaclass=_Parser):
 
         token_type = self._curr.token_type
 
-        if self._match_set(self.NO_PAREN_FUNCTION_PARSERS):
-            return self.NO_PAREN_FUNCTION_PARSERS[token_type](self)
+        parser = self._match_parser(self._no_paren_function_parsers)  # type: ignore
+        if parser:
+            return parser(self)
 
         if not self._next or self._next.token_type != TokenType.L_PAREN:
             if token_type in self.NO_PAREN_FUNCTIONS:
@@ -2181,7 +2598,7 @@ class Parser(metaclass=_Parser):
         upper = this.upper()
         self._advance(2)
 
-        parser = self.FUNCTION_PARSERS.get(upper)
+        parser = self._function_parsers.get(upper)  # type: ignore
 
         if parser:
             this = parser(self)
@@ -2388,9 +2805,10 @@ class Parser(metaclass=_Parser):
         return self.expression(exp.Constraint, this=this, expressions=expressions)
 
     def _parse_unnamed_constraint(self) -> t.Optional[exp.Expression]:
-        if not self._match_set(self.CONSTRAINT_PARSERS):
+        parser = self._match_parser(self._constraint_parsers)  # type: ignore
+        if not parser:
             return None
-        return self.CONSTRAINT_PARSERS[self._prev.token_type](self)
+        return parser(self)
 
     def _parse_unique(self) -> exp.Expression:
         return self.expression(exp.Unique, expressions=self._parse_wrapped_id_vars())
@@ -2770,12 +3188,12 @@ class Parser(metaclass=_Parser):
 
     def _parse_string(self) -> t.Optional[exp.Expression]:
         if self._match(TokenType.STRING):
-            return self.PRIMARY_PARSERS[TokenType.STRING](self, self._prev)
+            return self._primary_parsers[TokenType.STRING](self, self._prev)  # type: ignore
         return self._parse_placeholder()
 
     def _parse_number(self) -> t.Optional[exp.Expression]:
         if self._match(TokenType.NUMBER):
-            return self.PRIMARY_PARSERS[TokenType.NUMBER](self, self._prev)
+            return self._primary_parsers[TokenType.NUMBER](self, self._prev)  # type: ignore
         return self._parse_placeholder()
 
     def _parse_identifier(self) -> t.Optional[exp.Expression]:
@@ -2799,19 +3217,19 @@ class Parser(metaclass=_Parser):
 
     def _parse_null(self) -> t.Optional[exp.Expression]:
         if self._match(TokenType.NULL):
-            return self.PRIMARY_PARSERS[TokenType.NULL](self, self._prev)
+            return self._primary_parsers[TokenType.NULL](self, self._prev)  # type: ignore
         return None
 
     def _parse_boolean(self) -> t.Optional[exp.Expression]:
         if self._match(TokenType.TRUE):
-            return self.PRIMARY_PARSERS[TokenType.TRUE](self, self._prev)
+            return self._primary_parsers[TokenType.TRUE](self, self._prev)  # type: ignore
         if self._match(TokenType.FALSE):
-            return self.PRIMARY_PARSERS[TokenType.FALSE](self, self._prev)
+            return self._primary_parsers[TokenType.FALSE](self, self._prev)  # type: ignore
         return None
 
     def _parse_star(self) -> t.Optional[exp.Expression]:
         if self._match(TokenType.STAR):
-            return self.PRIMARY_PARSERS[TokenType.STAR](self, self._prev)
+            return self._primary_parsers[TokenType.STAR](self, self._prev)  # type: ignore
         return None
 
     def _parse_placeholder(self) -> t.Optional[exp.Expression]:
@@ -3080,6 +3498,13 @@ class Parser(metaclass=_Parser):
 
         return None
 
+    def _match_parser(self, parsers: t.Dict) -> t.Optional[t.Callable]:
+        """Returns the parser of the current token type, if any, and advances past the token."""
+        parser = parsers.get(self._curr.token_type) if self._curr else None
+        if parser:
+            self._advance()
+        return parser
+
     def _match_pair(self, token_type_a, token_type_b, advance=True):
         if not self._curr or not self._next:
             return None
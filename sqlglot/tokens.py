@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import codecs
+import re
 import typing as t
+from array import array
 from enum import auto
 
 from sqlglot.helper import AutoName
@@ -8,6 +11,10 @@ from sqlglot.trie import in_trie, new_trie
 
 
 class TokenType(AutoName):
+    # The members are singletons, so they can be hashed by identity, which is much faster than the
+    # default `Enum.__hash__` that's written in Python. They're hashed on every set or dict lookup.
+    __hash__ = object.__hash__
+
     L_PAREN = auto()
     R_PAREN = auto()
     L_BRACKET = auto()
@@ -348,6 +355,156 @@ class Token:
         return f"<Token {attributes}>"
 
 
+TOKEN_TYPES = list(TokenType)
+TOKEN_TYPE_INDEX = {token_type: i for i, token_type in enumerate(TOKEN_TYPES)}
+
+
+class TokenBuffer:
+    """
+    A compact, struct-of-arrays alternative to a list of tokens, produced by
+    `Tokenizer.tokenize_compact` and accepted by `Parser.parse`.
+
+    The token types, lines and columns are stored in arrays of integers, and the text of each token
+    as offsets into the SQL string. The texts that aren't a slice of it, e.g. unescaped strings, and
+    the non-empty comment lists are kept in side tables. `Token` objects are only created on demand,
+    when the buffer is indexed.
+
+    Slicing a buffer returns a view, which shares the arrays of the buffer.
+    """
+
+    __slots__ = (
+        "sql",
+        "types",
+        "starts",
+        "ends",
+        "lines",
+        "cols",
+        "texts",
+        "comments",
+        "_offset",
+        "_stop",
+    )
+
+    def __init__(self, sql: str) -> None:
+        self.sql = sql
+        self.types = array("H")
+        self.starts = array("L")
+        self.ends = array("L")
+        self.lines = array("L")
+        self.cols = array("L")
+        self.texts: t.Dict[int, str] = {}
+        self.comments: t.Dict[int, t.List[str]] = {}
+        self._offset = 0
+        self._stop: t.Optional[int] = None
+
+    def add(
+        self,
+        token_type: TokenType,
+        start: int,
+        end: int,
+        line: int,
+        col: int,
+        comments: t.List[str],
+        text: t.Optional[str] = None,
+    ) -> None:
+        """Appends a token, whose text is `sql[start:end]` unless `text` is set."""
+        index = len(self.types)
+
+        if text is not None and self.sql[start:end] != text:
+            if self.sql[start + 1 : end - 1] == text:
+                start += 1
+                end -= 1
+            else:
+                self.texts[index] = text
+        if comments:
+            self.comments[index] = comments
+
+        self.types.append(TOKEN_TYPE_INDEX[token_type])
+        self.starts.append(start)
+        self.ends.append(end)
+        self.lines.append(line)
+        self.cols.append(col)
+
+    def token_type(self, index: int) -> TokenType:
+        """Returns the type of the token at position `index`, without creating a `Token`."""
+        return TOKEN_TYPES[self.types[self._position(index)]]
+
+    def text(self, index: int) -> str:
+        """Returns the text of the token at position `index`, without creating a `Token`."""
+        i = self._position(index)
+        text = self.texts.get(i)
+        return self.sql[self.starts[i] : self.ends[i]] if text is None else text
+
+    def extend_comments(self, comments: t.List[str]) -> None:
+        """Attaches `comments` to the last token."""
+        self.comments.setdefault(self._position(-1), []).extend(comments)
+
+    def split(self, token_type: TokenType) -> t.List[TokenBuffer]:
+        """Splits the buffer into views at the tokens of type `token_type`, as `Parser.parse` does."""
+        separator = TOKEN_TYPE_INDEX[token_type]
+        types = self.types
+        offset = self._offset
+        stop = offset + len(self)
+        views = []
+        start = offset
+
+        for i in range(offset, stop):
+            if types[i] == separator:
+                views.append(self._view(start, i))
+                start = i + 1
+        if start < stop or not views:
+            views.append(self._view(start, stop))
+        return views
+
+    def _view(self, start: int, stop: int) -> TokenBuffer:
+        view = self.__class__.__new__(self.__class__)
+        for attribute in self.__slots__:
+            setattr(view, attribute, getattr(self, attribute))
+        view._offset = start
+        view._stop = stop
+        return view
+
+    def _position(self, index: int) -> int:
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("token index out of range")
+        return self._offset + index
+
+    def __len__(self) -> int:
+        return (len(self.types) if self._stop is None else self._stop) - self._offset
+
+    @t.overload
+    def __getitem__(self, index: int) -> Token:
+        ...
+
+    @t.overload
+    def __getitem__(self, index: slice) -> TokenBuffer:
+        ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, _ = index.indices(len(self))
+            return self._view(self._offset + start, self._offset + max(start, stop))
+
+        i = self._position(index)
+        text = self.texts.get(i)
+        return Token(
+            TOKEN_TYPES[self.types[i]],
+            self.sql[self.starts[i] : self.ends[i]] if text is None else text,
+            self.lines[i],
+            self.cols[i],
+            self.comments.get(i) or [],
+        )
+
+    def __iter__(self) -> t.Iterator[Token]:
+        return (self[i] for i in range(len(self)))
+
+    def __repr__(self) -> str:
+        return f"<TokenBuffer tokens: {len(self)}>"
+
+
 class _Tokenizer(type):
     def __new__(cls, clsname, bases, attrs):  # type: ignore
         klass = super().__new__(cls, clsname, bases, attrs)
@@ -367,7 +524,7 @@ class _Tokenizer(type):
             for comment in klass.COMMENTS
         )
 
-        klass.KEYWORD_TRIE = new_trie(
+        trie_keys = [
             key.upper()
             for key in {
                 **klass.KEYWORDS,
@@ -378,10 +535,74 @@ class _Tokenizer(type):
                 **{byte_string: TokenType.BYTE_STRING for byte_string in klass._BYTE_STRINGS},
             }
             if " " in key or any(single in key for single in klass.SINGLE_TOKENS)
+        ]
+        klass.KEYWORD_TRIE = new_trie(trie_keys)
+
+        # The fast path of the tokenizer handles the tokens that can't start a key of the trie
+        klass._TRIE_KEYS = set(trie_keys)
+        klass._TRIE_PREFIXES = {key[:i] for key in trie_keys for i in range(1, len(key) + 1)}
+        klass._FAST_STOPS = {delimiter[0] for delimiter in klass._IDENTIFIERS}
+        klass._FAST_SCANNER = cls._fast_scanner(klass)
+
+        # Strings are scanned by jumping to the next character that is an escape or that could
+        # start their delimiter, since everything in between is part of their text
+        klass._STRING_STOPS = {
+            end: re.compile(
+                "|".join(re.escape(char) for char in {*klass._ESCAPES, end[0]} if len(char) == 1)
+            ).search
+            for end in {
+                *klass._QUOTES.values(),
+                *klass._BIT_STRINGS.values(),
+                *klass._HEX_STRINGS.values(),
+                *klass._BYTE_STRINGS.values(),
+            }
+            if end
+        }
+
+        # Prefixed delimiters, like N' or X', end like the unprefixed ones, so `split` can skip them
+        klass._SPLIT_DELIMITERS = {
+            start: end
+            for start, end in {
+                **klass._QUOTES,
+                **klass._BIT_STRINGS,
+                **klass._HEX_STRINGS,
+                **klass._BYTE_STRINGS,
+                **klass._IDENTIFIERS,
+                **klass._COMMENTS,
+            }.items()
+            if end != "" and not start[0].isalnum()
+        }
+        klass._SPLITTER = re.compile(
+            "|".join(
+                re.escape(delimiter)
+                for delimiter in sorted([*klass._SPLIT_DELIMITERS, ";"], key=len, reverse=True)
+            )
         )
 
         return klass
 
+    @staticmethod
+    def _fast_scanner(klass: t.Any) -> t.Optional[t.Callable]:
+        if any(len(single) != 1 for single in klass.SINGLE_TOKENS):
+            return None
+
+        singles = "".join(re.escape(single) for single in klass.SINGLE_TOKENS)
+        spaces = "".join(re.escape(space) for space in klass.WHITE_SPACE if len(space) == 1)
+        identifiers = "|".join(
+            f"{re.escape(start)}[^{re.escape(end)}]*{re.escape(end)}"
+            for start, end in klass._IDENTIFIERS.items()
+            if len(start) == 1 and len(end) == 1
+        )
+
+        patterns = [
+            f"(?P<space>[{spaces}]+)" if spaces else "",
+            "(?P<number>[0-9]+(?:\\.[0-9]*)?)",
+            f"(?P<identifier>{identifiers})" if identifiers else "",
+            f"(?P<var>[^\\s{singles}]+)",
+            f"(?P<single>[{singles}])" if singles else "",
+        ]
+        return re.compile("|".join(pattern for pattern in patterns if pattern)).match
+
     @staticmethod
     def _delimeter_list_to_dict(list: t.List[str | t.Tuple[str, str]]) -> t.Dict[str, str]:
         return dict((item, item) if isinstance(item, str) else (item[0], item[1]) for item in list)
@@ -769,8 +990,228 @@ class Tokenizer(metaclass=_Tokenizer):
         self.reset()
         self.sql = sql
         self.size = len(sql)
+        self._scan()
+        return self.tokens
+
+    def tokenize_compact(self, sql: str) -> TokenBuffer:
+        """
+        Returns a `TokenBuffer` with the tokens of the SQL string `sql`. It holds the same tokens
+        as the list returned by `tokenize`, but takes a fraction of its memory and allocations.
+        """
+        self.reset()
+        self.sql = sql
+        self.size = len(sql)
+        self.tokens = TokenBuffer(sql)  # type: ignore
+        self._scan()
+        return self.tokens  # type: ignore
+
+    def tokenize_iter(
+        self, source: str | t.IO, chunk_size: int = 1 << 20
+    ) -> t.Iterator[t.List[Token]]:
+        """
+        Tokenizes `source` incrementally and yields the tokens of one SQL statement at a time,
+        without the semicolons that separate them.
+
+        Only the part of the input that hasn't been consumed yet is kept in memory, so the peak
+        memory is bounded by the size of the largest statement rather than the whole script.
+
+        Args:
+            source: the SQL string or a file-like object, e.g. a text / binary file or a `mmap`.
+                Bytes are decoded as UTF-8.
+            chunk_size: the number of characters (or bytes) to read from `source` at a time.
+                It's doubled while a statement doesn't fit in the unconsumed input.
+
+        Returns:
+            An iterator over the token lists, one per statement, split as in `Parser.parse`.
+        """
+        for tokens, _, _ in self._tokenize_iter(source, chunk_size):
+            yield tokens
+
+    def _tokenize_iter(
+        self, source: str | t.IO, chunk_size: int = 1 << 20
+    ) -> t.Iterator[t.Tuple[t.List[Token], str, t.Tuple[int, int]]]:
+        """
+        Same as `tokenize_iter`, except that the tokens of each statement are yielded with its SQL
+        text and the line and column at which it starts, which `Parser.parse` takes to build its
+        error messages.
+        """
+        self.reset()
+
+        if isinstance(source, str):
+            read = None
+            self.sql = source
+        else:
+            read = source.read
+            self.sql = ""
+        self.size = len(self.sql)
+        self._end = not self.size  # type: ignore
+
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        eof = read is None
+        size = chunk_size
+        split = False
+
+        while True:
+            start = len(self.tokens)
+            state = (
+                self._current,
+                self._line,
+                self._col,
+                list(self._comments),
+                self._prev_token_line,
+                self._prev_token_comments,
+                self._prev_token_type,
+            )
+
+            try:
+                self._scan(
+                    until=lambda: len(self.tokens) > start
+                    and self.tokens[-1].token_type == TokenType.SEMICOLON
+                )
+                complete = eof or not self._end
+            except Exception:
+                # The input may end in the middle of a token, e.g. a string, so read more of it
+                if eof:
+                    raise
+                complete = False
+
+            sql_start = (state[1], state[2])
+
+            if complete and len(self.tokens) > start:
+                if self.tokens[-1].token_type == TokenType.SEMICOLON:
+                    yield self.tokens[start:-1], self.sql[state[0] : self._current], sql_start
+                    # The semicolon is kept for the trailing comments and the commands that follow it
+                    self.tokens = self.tokens[-1:]
+                    size = chunk_size
+                    split = True
+                    continue
+
+            if complete:
+                if self.tokens[start:] or not split:
+                    yield self.tokens[start:], self.sql[state[0] :], sql_start
+                return
+
+            (
+                current,
+                self._line,
+                self._col,
+                self._comments,
+                self._prev_token_line,
+                self._prev_token_comments,
+                self._prev_token_type,
+            ) = state
+            del self.tokens[start:]
+
+            data = read(size)  # type: ignore
+            eof = not data
+            size *= 2
+
+            if isinstance(data, (bytes, bytearray)):
+                chunk = decoder.decode(data, final=eof)
+            else:
+                chunk = data or ""
+
+            self.sql = self.sql[current:] + chunk
+            self.size = len(self.sql)
+            self._current = 0
+            self._end = self._current >= self.size  # type: ignore
+
+    def split(self, sql: str) -> t.List[str]:
+        """
+        Cheaply splits the SQL string `sql` into statements, one per syntax tree that `Parser.parse`
+        would return for its tokens. Only strings, identifiers, comments and semicolons are
+        recognized, so the split can differ from the tokenizer's for unusual inputs, e.g. commands
+        that contain a semicolon within a string.
+
+        Each statement keeps its semicolon, followed by the comments on the same line, so that the
+        statements add up to `sql`.
+        """
+        search = self._SPLITTER.search  # type: ignore
+        statements = []
+        size = len(sql)
+        start = pos = 0
+
+        while True:
+            match = search(sql, pos)
+            if not match:
+                break
+
+            delimiter = match.group()
+            pos = match.end()
+
+            if delimiter == ";":
+                pos = self._skip_comments(sql, pos, breaks=False)
+                statements.append(sql[start:pos])
+                start = pos
+            elif delimiter in self._COMMENTS:  # type: ignore
+                pos = self._comment_end(sql, match.start(), delimiter)
+            else:
+                pos = self._delimited_end(sql, pos, delimiter)
+
+        if not statements or self._skip_comments(sql, start, breaks=True) < size:
+            statements.append(sql[start:])
+        else:
+            statements[-1] += sql[start:]
+        return statements
+
+    def _skip_comments(self, sql: str, pos: int, breaks: bool) -> int:
+        size = len(sql)
+
+        while pos < size:
+            white_space = self.WHITE_SPACE.get(sql[pos])
+            if white_space and (breaks or white_space != TokenType.BREAK):
+                pos += 1
+                continue
+
+            match = self._SPLITTER.match(sql, pos)  # type: ignore
+            if not match or match.group() not in self._COMMENTS:  # type: ignore
+                break
+            pos = self._comment_end(sql, pos, match.group())
+
+        return pos
+
+    def _comment_end(self, sql: str, start: int, comment_start: str) -> int:
+        comment_end = self._COMMENTS[comment_start]  # type: ignore
 
+        if comment_end:
+            end = sql.find(comment_end, start)
+            return len(sql) if end < 0 else end + len(comment_end)
+
+        end = start
+        while end < len(sql) and self.WHITE_SPACE.get(sql[end]) != TokenType.BREAK:
+            end += 1
+        return end
+
+    def _delimited_end(self, sql: str, pos: int, start: str) -> int:
+        delimiter = self._SPLIT_DELIMITERS[start]  # type: ignore
+
+        if len(delimiter) > 1 or start in self._IDENTIFIERS:  # type: ignore
+            end = sql.find(delimiter, pos)
+            return len(sql) if end < 0 else end + len(delimiter)
+
+        escapes = self._ESCAPES  # type: ignore
+        search = re.compile(f"[{re.escape(''.join(escapes | {delimiter}))}]").search
+
+        while True:
+            match = search(sql, pos)
+            if not match:
+                return len(sql)
+
+            pos = match.start()
+            if sql[pos] in escapes and sql[pos + 1 : pos + 2] == delimiter:
+                pos += 2
+            elif sql[pos] == delimiter:
+                return pos + 1
+            else:
+                pos += 1
+
+    def _scan(self, until: t.Optional[t.Callable[[], bool]] = None) -> None:
         while self.size and not self._end:
+            if self._FAST_SCANNER:  # type: ignore
+                self._scan_fast()
+                if self._end or until and until():
+                    break
+
             self._start = self._current
             self._advance()
 
@@ -790,7 +1231,119 @@ class Tokenizer(metaclass=_Tokenizer):
                 self._scan_identifier(identifier_end)
             else:
                 self._scan_keywords()
-        return self.tokens
+
+            if until and until():
+                break
+
+    def _scan_fast(self) -> None:
+        """
+        Scans whitespace, numbers, identifiers, vars, keywords and single character tokens with a
+        precompiled regex, until reaching something that could start a key of `KEYWORD_TRIE`,
+        e.g. a string, a comment or a multi-word keyword, or a token that needs special handling.
+        These are left to the character-by-character scanner, which produces the same tokens.
+        It also stops after a semicolon, so that `tokenize_iter` can split the statements.
+        """
+        sql = self.sql
+        size = self.size
+        match = self._FAST_SCANNER  # type: ignore
+        white_space = self.WHITE_SPACE
+        single_tokens = self.SINGLE_TOKENS
+        keywords = self.KEYWORDS
+        commands = self.COMMANDS
+        prefixes = self._TRIE_PREFIXES  # type: ignore
+        trie_keys = self._TRIE_KEYS  # type: ignore
+        stops = self._FAST_STOPS  # type: ignore
+        tokens = self.tokens
+        add = tokens.add if type(tokens) is TokenBuffer else None  # type: ignore
+        pos = self._current
+        line = self._line
+        col = self._col
+
+        while pos < size:
+            m = match(sql, pos)
+            if not m:
+                break
+
+            kind = m.lastgroup
+            text = m.group()
+            end = m.end()
+
+            if kind == "space":
+                last_break = -1
+                for i, char in enumerate(text):
+                    if white_space[char] == TokenType.BREAK:
+                        line += 1
+                        last_break = i
+                col = col + len(text) if last_break < 0 else len(text) - last_break
+                pos = end
+                continue
+
+            if kind == "number":
+                # e.g. 1e5, 1.2.3, 0x1F or the numeric literals of some dialects, like 1L
+                if end < size and (sql[end].isalnum() or sql[end] == "."):
+                    break
+                token_type = TokenType.NUMBER
+            elif kind == "identifier":
+                token_type = TokenType.IDENTIFIER
+            elif kind == "var":
+                upper = text.upper()
+                if text[0].isdigit() or text[0] in stops or upper in prefixes:
+                    break
+                if self._prev_token_type == TokenType.PARAMETER:
+                    token_type = TokenType.VAR
+                else:
+                    token_type = keywords.get(upper, TokenType.VAR)
+            else:
+                if text in stops:
+                    break
+                upper = text.upper()
+                if upper in prefixes:
+                    if (
+                        upper in trie_keys
+                        or end < size
+                        and (
+                            upper + (" " if sql[end] in white_space else sql[end].upper())
+                            in prefixes
+                        )
+                    ):
+                        break
+                token_type = single_tokens[text]
+
+            if token_type in commands and (
+                not tokens or tokens[-1].token_type == TokenType.SEMICOLON
+            ):
+                break
+
+            col += end - pos
+
+            self._prev_token_line = line
+            self._prev_token_comments = self._comments
+            self._prev_token_type = token_type  # type: ignore
+            if add:
+                if kind == "identifier":
+                    add(token_type, pos + 1, end - 1, line, col, self._comments)
+                else:
+                    add(token_type, pos, end, line, col, self._comments)
+            else:
+                tokens.append(
+                    Token(
+                        token_type,
+                        text[1:-1] if kind == "identifier" else text,
+                        line,
+                        col,
+                        self._comments,
+                    )
+                )
+            self._comments = []
+            pos = end
+
+            if token_type == TokenType.SEMICOLON:
+                break
+
+        self._current = pos
+        self._line = line
+        self._col = col
+        self._end = pos >= size  # type: ignore
 
     def _chars(self, size: int) -> str:
         if size == 1:
@@ -816,15 +1369,26 @@ class Tokenizer(metaclass=_Tokenizer):
         self._prev_token_line = self._line
         self._prev_token_comments = self._comments
         self._prev_token_type = token_type  # type: ignore
-        self.tokens.append(
-            Token(
+        if type(self.tokens) is TokenBuffer:
+            self.tokens.add(  # type: ignore
                 token_type,
-                self._text if text is None else text,
+                self._start,
+                self._current,
                 self._line,
                 self._col,
                 self._comments,
+                text,
+            )
+        else:
+            self.tokens.append(
+                Token(
+                    token_type,
+                    self._text if text is None else text,
+                    self._line,
+                    self._col,
+                    self._comments,
+                )
             )
-        )
         self._comments = []
 
         if token_type in self.COMMANDS and (
@@ -914,7 +1478,10 @@ class Tokenizer(metaclass=_Tokenizer):
         # Leading comment is attached to the succeeding token, whilst trailing comment to the preceding.
         # Multiple consecutive comments are preserved by appending them to the current comments list.
         if comment_start_line == self._prev_token_line:
-            self.tokens[-1].comments.extend(self._comments)
+            if type(self.tokens) is TokenBuffer:
+                self.tokens.extend_comments(self._comments)  # type: ignore
+            else:
+                self.tokens[-1].comments.extend(self._comments)
             self._comments = []
 
         return True
@@ -1050,22 +1617,31 @@ class Tokenizer(metaclass=_Tokenizer):
         )
 
     def _extract_string(self, delimiter: str) -> str:
-        text = ""
+        sql = self.sql
+        size = self.size
+        escapes = self._ESCAPES  # type: ignore
+        search = self._STRING_STOPS[delimiter]  # type: ignore
         delim_size = len(delimiter)
+        parts = []
+        pos = self._current - 1
 
         while True:
-            if self._char in self._ESCAPES and self._peek == delimiter:  # type: ignore
-                text += delimiter
-                self._advance(2)
+            match = search(sql, pos)
+            if not match:
+                raise RuntimeError(f"Missing {delimiter} from {self._line}:{self._start}")
+
+            stop = match.start()
+            parts.append(sql[pos:stop])
+            char = sql[stop]
+
+            if char in escapes and sql[stop + 1 : stop + 2] == delimiter:
+                parts.append(delimiter)
+                pos = stop + 2
+            elif sql[stop : stop + delim_size] == delimiter:
+                self._advance(stop + delim_size - self._current)
+                return "".join(parts)
+            elif stop + 1 >= size:
+                raise RuntimeError(f"Missing {delimiter} from {self._line}:{self._start}")
             else:
-                if self._chars(delim_size) == delimiter:
-                    if delim_size > 1:
-                        self._advance(delim_size - 1)
-                    break
-
-                if self._end:
-                    raise RuntimeError(f"Missing {delimiter} from {self._line}:{self._start}")
-                text += self._char  # type: ignore
-                self._advance()
-
-        return text
+                parts.append(char)
+                pos = stop + 1
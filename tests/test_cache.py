@@ -0,0 +1,169 @@
+import unittest
+from unittest import mock
+
+import sqlglot
+from sqlglot import cache, exp
+from sqlglot.cache import LRUCache
+
+
+class TestCache(unittest.TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_lru_cache(self):
+        lru = LRUCache(size=2)
+        lru.set("a", 1)
+        lru.set("b", 2)
+        self.assertEqual(lru.get("a"), 1)
+        lru.set("c", 3)
+
+        self.assertIn("a", lru)
+        self.assertNotIn("b", lru)
+        self.assertIn("c", lru)
+        self.assertEqual(len(lru), 2)
+        self.assertIsNone(lru.get("b"))
+        self.assertEqual(lru.get("b", 0), 0)
+        self.assertEqual((lru.hits, lru.misses), (1, 2))
+
+        lru.clear()
+        self.assertEqual(len(lru), 0)
+        self.assertEqual((lru.hits, lru.misses), (0, 0))
+
+        # every access to the shared state holds the lock
+        lru._lock = mock.MagicMock(wraps=lru._lock)
+        "a" in lru
+        len(lru)
+        lru.hit_rate
+        self.assertEqual(lru._lock.__enter__.call_count, 3)
+
+    def test_transpile(self):
+        sql = "SELECT EPOCH_MS(x) FROM y; SELECT 1"
+        expected = ["SELECT FROM_UNIXTIME(x / 1000) FROM y", "SELECT 1"]
+
+        result = cache.transpile(sql, read="duckdb", write="hive")
+        self.assertEqual(result, expected)
+        result.append("mutated")
+        self.assertEqual(cache.transpile(sql, read="duckdb", write="hive"), expected)
+        self.assertEqual((cache.CACHE.hits, cache.CACHE.misses), (1, 1))
+
+        self.assertEqual(
+            cache.transpile(sql, read="duckdb", write="hive", pretty=True),
+            ["SELECT\n  FROM_UNIXTIME(x / 1000)\nFROM y", "SELECT\n  1"],
+        )
+        self.assertEqual(
+            cache.transpile(sql, read="duckdb"),
+            ["SELECT TO_TIMESTAMP(CAST(x / 1000 AS BIGINT)) FROM y", "SELECT 1"],
+        )
+        self.assertEqual(cache.CACHE.misses, 3)
+
+    def test_parse_one(self):
+        expression = cache.parse_one("SELECT a FROM b", read="spark")
+        expression.find(exp.Column).replace(exp.column("c"))
+        self.assertEqual(expression.sql(), "SELECT c FROM b")
+        self.assertEqual(cache.parse_one("SELECT a FROM b", read="spark").sql(), "SELECT a FROM b")
+        self.assertEqual(cache.CACHE.hits, 1)
+
+        self.assertIsInstance(cache.parse_one("a", into=exp.Table), exp.Table)
+        self.assertIsInstance(cache.parse_one("a"), exp.Column)
+
+    def test_unhashable_options(self):
+        self.assertEqual(cache.transpile("SELECT 1", time_mapping={}), ["SELECT 1"])
+        self.assertEqual(len(cache.CACHE), 0)
+
+    def test_transpile_parameterized(self):
+        for i, value in enumerate(("1", "2.5", "'ab'")):
+            self.assertEqual(
+                cache.transpile_parameterized(
+                    f"SELECT EPOCH_MS(x) FROM y WHERE z = {value} AND w = 'c'; SELECT {i}",
+                    read="duckdb",
+                    write="hive",
+                ),
+                [
+                    f"SELECT FROM_UNIXTIME(x / 1000) FROM y WHERE z = {value} AND w = 'c'",
+                    f"SELECT {i}",
+                ],
+            )
+
+        # the literals are part of the key, unlike their values
+        self.assertEqual((cache.TEMPLATES.hits, cache.TEMPLATES.misses), (0, 3))
+        self.assertEqual(
+            cache.transpile_parameterized(
+                "SELECT EPOCH_MS(x) FROM y WHERE z = 3 AND w = 'd'; SELECT 4",
+                read="duckdb",
+                write="hive",
+            ),
+            ["SELECT FROM_UNIXTIME(x / 1000) FROM y WHERE z = 3 AND w = 'd'", "SELECT 4"],
+        )
+        self.assertEqual(cache.TEMPLATES.hits, 1)
+        self.assertEqual(cache.TEMPLATES.hit_rate, 0.25)
+
+        # time formats are converted depending on their value, so they can't be parameterized
+        for value, expected in (("%d", "dd"), ("%Y", "yyyy")):
+            self.assertEqual(
+                cache.transpile_parameterized(
+                    f"SELECT STR_TO_UNIX(a, '{value}')", read="duckdb", write="hive"
+                ),
+                [f"SELECT UNIX_TIMESTAMP(a, '{expected}')"],
+            )
+        self.assertEqual(len(cache.REJECTED), 1)
+
+        self.assertEqual(
+            cache.transpile_parameterized("SELECT a[1]", read="presto", write="spark"),
+            ["SELECT a[0]"],
+        )
+        self.assertEqual(
+            cache.transpile_parameterized("SELECT a[5]", read="presto", write="spark"),
+            ["SELECT a[4]"],
+        )
+
+    def test_custom_function_literals(self):
+        # the literals of functions with custom builders aren't parameterized, since e.g. Snowflake's
+        # TO_TIMESTAMP is parsed differently depending on whether its argument is an integer
+        for value, expected in (
+            ("2020-01-01", "SELECT STRPTIME('2020-01-01', '%Y-%m-%d %H:%M:%S')"),
+            ("12345", "SELECT TO_TIMESTAMP(CAST('12345' AS BIGINT))"),
+        ):
+            sql = f"SELECT TO_TIMESTAMP('{value}')"
+            self.assertEqual(
+                cache.transpile_parameterized(sql, read="snowflake", write="duckdb"), [expected]
+            )
+            self.assertEqual(
+                cache.parse_parameterized(sql, read="snowflake")[0].sql("duckdb"), expected
+            )
+        self.assertEqual(cache.TEMPLATES.hits, 0)
+
+        # the other literals of the statement still are
+        for value in ("1", "2"):
+            self.assertEqual(
+                cache.transpile_parameterized(
+                    f"SELECT TO_TIMESTAMP('12345') FROM t WHERE a = {value}",
+                    read="snowflake",
+                    write="duckdb",
+                ),
+                [f"SELECT TO_TIMESTAMP(CAST('12345' AS BIGINT)) FROM t WHERE a = {value}"],
+            )
+        self.assertEqual(cache.TEMPLATES.hits, 1)
+
+    def test_parse_parameterized(self):
+        for value in ("1", "'x'"):
+            expressions = cache.parse_parameterized(f"SELECT a FROM b WHERE c = {value}")
+            self.assertEqual(len(expressions), 1)
+            self.assertEqual(
+                expressions[0], sqlglot.parse_one(f"SELECT a FROM b WHERE c = {value}")
+            )
+
+        expressions = cache.parse_parameterized("SELECT a FROM b WHERE c = 2")
+        expressions[0].find(exp.Literal).replace(exp.Literal.number(3))
+        self.assertEqual(expressions[0].sql(), "SELECT a FROM b WHERE c = 3")
+        self.assertEqual(
+            cache.parse_parameterized("SELECT a FROM b WHERE c = 4")[0].sql(),
+            "SELECT a FROM b WHERE c = 4",
+        )
+        self.assertEqual((cache.TEMPLATES.hits, cache.TEMPLATES.misses), (2, 2))
+
+        # named placeholders are left alone
+        self.assertEqual(
+            cache.parse_parameterized("SELECT :1 FROM b WHERE c = 1")[0].sql(),
+            "SELECT :1 FROM b WHERE c = 1",
+        )
+        self.assertEqual(len(cache.REJECTED), 1)
@@ -1,5 +1,13 @@
+import gzip
+import itertools
+import math
+import os
+import statistics
+import tempfile
+import time
 import unittest
 from datetime import date
+from unittest import mock
 
 import duckdb
 import pandas as pd
@@ -7,9 +15,15 @@ from pandas.testing import assert_frame_equal
 
 from sqlglot import exp, parse_one
 from sqlglot.errors import ExecuteError
-from sqlglot.executor import execute
-from sqlglot.executor.python import Python
+from sqlglot.executor import ENGINES, execute
+from sqlglot.executor.columnar import ColumnarExecutor
+from sqlglot.executor.env import AvgAccumulator
+from sqlglot.executor.loader import load_csv, load_table, save_table
+from sqlglot.executor.python import Python, PythonExecutor
+from sqlglot.executor.streaming import StreamingExecutor
 from sqlglot.executor.table import Table, ensure_tables
+from sqlglot.optimizer import optimize
+from sqlglot.planner import Plan
 from tests.helpers import (
     FIXTURES_DIR,
     SKIP_INTEGRATION,
@@ -74,13 +88,14 @@ class TestExecutor(unittest.TestCase):
                 )
             return expression
 
-        for i, (sql, _) in enumerate(self.sqls):
-            with self.subTest(f"tpch-h {i + 1}"):
-                a = self.cached_execute(sql)
-                sql = parse_one(sql).transform(to_csv).sql(pretty=True)
-                table = execute(sql, TPCH_SCHEMA)
-                b = pd.DataFrame(table.rows, columns=table.columns)
-                assert_frame_equal(a, b, check_dtype=False, check_index_type=False)
+        for engine in ENGINES:
+            for i, (sql, _) in enumerate(self.sqls):
+                with self.subTest(f"tpch-h {i + 1} ({engine})"):
+                    a = self.cached_execute(sql)
+                    sql = parse_one(sql).transform(to_csv).sql(pretty=True)
+                    table = execute(sql, TPCH_SCHEMA, engine=engine)
+                    b = pd.DataFrame(table.rows, columns=table.columns)
+                    assert_frame_equal(a, b, check_dtype=False, check_index_type=False)
 
     def test_execute_callable(self):
         tables = {
@@ -199,10 +214,11 @@ class TestExecutor(unittest.TestCase):
                 [],
             ),
         ]:
-            with self.subTest(sql):
-                result = execute(sql, schema=schema, tables=tables)
-                self.assertEqual(result.columns, tuple(cols))
-                self.assertEqual(result.rows, rows)
+            for engine in ENGINES:
+                with self.subTest(f"{sql} ({engine})"):
+                    result = execute(sql, schema=schema, tables=tables, engine=engine)
+                    self.assertEqual(result.columns, tuple(cols))
+                    self.assertEqual(result.rows, rows)
 
     def test_set_operations(self):
         tables = {
@@ -265,10 +281,11 @@ class TestExecutor(unittest.TestCase):
                 [(1,), (2,), (3,)],
             ),
         ]:
-            with self.subTest(sql):
-                result = execute(sql, schema=schema, tables=tables)
-                self.assertEqual(result.columns, tuple(cols))
-                self.assertEqual(set(result.rows), set(rows))
+            for engine in ENGINES:
+                with self.subTest(f"{sql} ({engine})"):
+                    result = execute(sql, schema=schema, tables=tables, engine=engine)
+                    self.assertEqual(result.columns, tuple(cols))
+                    self.assertEqual(set(result.rows), set(rows))
 
     def test_execute_catalog_db_table(self):
         tables = {
@@ -401,6 +418,285 @@ class TestExecutor(unittest.TestCase):
             ],
         )
 
+    def test_columnar_batches(self):
+        tables = {"x": [{"a": i, "b": i % 3} for i in range(100)]}
+        schema = {"x": {"a": "INT", "b": "INT"}}
+        executor = ColumnarExecutor(tables=ensure_tables(tables), batch_size=7)
+
+        for sql in (
+            "SELECT a FROM x WHERE b = 1 LIMIT 20",
+            "SELECT b, SUM(a) AS s, COUNT(a) AS c FROM x GROUP BY b",
+            "SELECT a FROM x ORDER BY b DESC, a LIMIT 5",
+        ):
+            with self.subTest(sql):
+                expected = execute(sql, schema=schema, tables=tables)
+                result = executor.execute(Plan(optimize(parse_one(sql), schema)))
+                self.assertEqual(result.columns, expected.columns)
+                self.assertEqual(result.rows, expected.rows)
+
+    def test_execute_parallel(self):
+        tables = {
+            "x": [{"a": i, "b": i % 3} for i in range(100)],
+            "y": [{"b": i, "c": str(i)} for i in range(3)],
+        }
+
+        for engine in ENGINES:
+            for sql in (
+                "SELECT x.a, y.c FROM x JOIN y ON x.b = y.b ORDER BY x.a",
+                "SELECT i.a, j.a FROM x AS i JOIN x AS j ON i.a = j.b ORDER BY i.a, j.a",
+                "WITH z AS (SELECT b, SUM(a) AS s FROM x GROUP BY b) "
+                "SELECT l.b, l.s, r.s FROM z AS l JOIN z AS r ON l.b = r.b",
+                "SELECT a FROM x WHERE b = 0 UNION SELECT b FROM y",
+            ):
+                with self.subTest(f"{sql} ({engine})"):
+                    expected = execute(sql, tables=tables, engine=engine)
+                    result = execute(sql, tables=tables, engine=engine, workers=4)
+                    self.assertEqual(result.columns, expected.columns)
+                    self.assertEqual(sorted(result.rows), sorted(expected.rows))
+
+        plan = Plan(
+            optimize(
+                parse_one("SELECT x.a FROM x JOIN y ON x.b = y.b"),
+                {
+                    "x": {"a": "INT", "b": "INT"},
+                    "y": {"b": "INT", "c": "VARCHAR"},
+                },
+            )
+        )
+        executor = PythonExecutor(tables=ensure_tables(tables), workers=2)
+        self.assertEqual(len(executor.execute(plan)), 100)
+        self.assertEqual(set(executor.timings), set(plan.dag))
+
+        # the steps only overlap while they wait, e.g. on I/O, because of the GIL
+        plan = Plan(
+            optimize(
+                parse_one("SELECT WAIT(a) AS a FROM x UNION ALL SELECT WAIT(b) AS a FROM y"),
+                {"x": {"a": "INT"}, "y": {"b": "INT"}},
+            )
+        )
+        elapsed = {}
+        for workers in (None, 2):
+            executor = PythonExecutor(
+                env={"WAIT": lambda a: time.sleep(0.005) or a},
+                tables=ensure_tables({"x": tables["x"][:20], "y": tables["y"] * 7}),
+                workers=workers,
+            )
+            start = time.perf_counter()
+            self.assertEqual(len(executor.execute(plan)), 41)
+            elapsed[workers] = time.perf_counter() - start
+        self.assertLess(elapsed[2], elapsed[None] * 0.75)
+
+    def test_streaming_limit(self):
+        calls = []
+        tables = {
+            "x": [{"a": i, "b": i % 3} for i in range(1000)],
+            "y": [{"b": i} for i in range(3)],
+        }
+        schema = {"x": {"a": "INT", "b": "INT"}, "y": {"b": "INT"}}
+        executor = StreamingExecutor(
+            env={"TRACK": lambda a: calls.append(a) or a},
+            tables=ensure_tables(tables),
+            batch_size=10,
+        )
+        sql = """
+            SELECT s.a, y.b
+            FROM (SELECT TRACK(a) AS a, b FROM x LIMIT 500) AS s
+            JOIN y
+              ON s.b = y.b
+            LIMIT 5
+        """
+
+        result = executor.execute(Plan(optimize(parse_one(sql), schema)))
+        self.assertEqual(result.rows, [(0, 0), (1, 1), (2, 2), (3, 0), (4, 1)])
+        self.assertEqual(len(calls), 10)
+
+    def test_hash_aggregate(self):
+        tables = {"x": [{"a": i % 7, "b": i, "c": None if i % 5 else i / 2} for i in range(200)]}
+
+        for sql in (
+            "SELECT a, SUM(b) AS s, COUNT(c) AS n, AVG(c) AS v FROM x GROUP BY a",
+            "SELECT a, MIN(c) AS l, MAX(c) AS h, COUNT(*) AS n FROM x GROUP BY a LIMIT 3",
+            "SELECT a, SUM(b + 1) / COUNT(b) AS s FROM x WHERE a > 2 GROUP BY a",
+            "SELECT a % 2 AS p, SUM(b) AS s FROM x GROUP BY a % 2",
+            "SELECT DISTINCT a FROM x",
+        ):
+            with self.subTest(sql):
+                with mock.patch.object(PythonExecutor, "HASH_AGGREGATE_THRESHOLD", math.inf):
+                    expected = execute(sql, tables=tables)
+                with mock.patch.object(PythonExecutor, "HASH_AGGREGATE_THRESHOLD", 0):
+                    result = execute(sql, tables=tables)
+                self.assertEqual(result.columns, expected.columns)
+                self.assertEqual(result.rows, expected.rows)
+
+        # AVG used to be computed with statistics.fmean, whose results the accumulator keeps exactly
+        values = [0.1] * 10 + [1e16, 1.0, -1e16, 3, 2**60 + 1, -(2**60)]
+        tables = {"x": [{"a": i % 3, "b": value} for i, value in enumerate(values)]}
+        with mock.patch.object(PythonExecutor, "HASH_AGGREGATE_THRESHOLD", 0):
+            result = execute("SELECT a, AVG(b) AS v FROM x GROUP BY a", tables=tables)
+        self.assertEqual(result.rows, [(a, statistics.fmean(values[a::3])) for a in range(3)])
+
+        accumulators = [AvgAccumulator(), AvgAccumulator()]
+        for i, value in enumerate(values):
+            accumulators[i % 2].update(value)
+        accumulators[0].combine(accumulators[1])
+        self.assertEqual(accumulators[0].result(), statistics.fmean(values))
+        self.assertNotEqual(sum(values) / len(values), statistics.fmean(values))
+
+    def test_top_n(self):
+        tables = {"x": [{"a": i % 10, "b": (i * 7) % 13, "c": i % 4} for i in range(300)]}
+
+        for sql in (
+            "SELECT a, b FROM x ORDER BY a DESC, b LIMIT 7",
+            "SELECT a, b + c AS d FROM x ORDER BY d, a DESC LIMIT 5",
+            "SELECT a, SUM(b) AS s FROM x GROUP BY a ORDER BY s DESC LIMIT 3",
+            "SELECT a FROM x ORDER BY a LIMIT 0",
+        ):
+            with self.subTest(sql):
+                full = execute(sql.rsplit(" LIMIT ", 1)[0], tables=tables)
+                limit = int(sql.rsplit(" ", 1)[1])
+
+                for engine in ENGINES:
+                    result = execute(sql, tables=tables, engine=engine)
+                    self.assertEqual(result.columns, full.columns)
+                    self.assertEqual(result.rows, full.rows[:limit])
+
+    def test_load_csv(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for name in ("nation", "lineitem"):
+                with self.subTest(name):
+                    with gzip.open(f"{DIR}{name}.csv.gz", "rb") as f:
+                        data = f.read()
+                    plain = os.path.join(tmp, f"{name}.csv")
+                    with open(plain, "wb") as f:
+                        f.write(data)
+
+                    executor = PythonExecutor()
+                    step = Plan(
+                        parse_one(f"SELECT * FROM READ_CSV('{plain}', 'delimiter', '|') AS t")
+                    ).root
+                    expected = [
+                        reader.row for reader in itertools.islice(executor.scan_csv(step), 1, None)
+                    ]
+
+                    table = load_csv(f"{DIR}{name}.csv.gz", delimiter="|")
+                    self.assertEqual(table.columns, tuple(TPCH_SCHEMA[name]))
+                    self.assertEqual(table.rows, expected)
+
+                    table = load_csv(plain, delimiter="|", workers=2, chunk_size=4096)
+                    self.assertEqual(table.rows, expected)
+
+                    binary = os.path.join(tmp, f"{name}.bin")
+                    load_csv(plain, delimiter="|", binary_file=binary)
+                    with mock.patch("sqlglot.executor.loader._load_csv") as parse:
+                        table = load_csv(plain, delimiter="|", binary_file=binary)
+                        parse.assert_not_called()
+                    self.assertEqual(table.columns, tuple(TPCH_SCHEMA[name]))
+                    self.assertEqual(table.rows, expected)
+
+            path = os.path.join(tmp, "mixed.bin")
+            rows = [(1, None, "é", 1.5, True), (2**70, "a", "", -0.0, False)]
+            save_table(Table(["a", "b", "c", "d", "e"], rows), path)
+            self.assertEqual(load_table(path).rows, rows)
+
+            save_table(Table(["a"]), path)
+            self.assertEqual(load_table(path).columns, ("a",))
+            self.assertEqual(load_table(path).rows, [])
+
+            with self.assertRaises(ExecuteError):
+                save_table(Table(["a"], [(date(2020, 1, 1),)]), path)
+
+            plain = os.path.join(tmp, "short.csv")
+            with open(plain, "w") as f:
+                f.write("a,b\n1,2\n3\n")
+            with self.assertRaises(ExecuteError):
+                load_csv(plain)
+
+            plain = os.path.join(tmp, "options.csv")
+            binary = os.path.join(tmp, "options.bin")
+            with open(plain, "w") as f:
+                f.write("a;b|c\n1;2|3\n")
+            self.assertEqual(load_csv(plain, delimiter=";", binary_file=binary).rows, [(1, "2|3")])
+            table = load_csv(plain, delimiter="|", binary_file=binary)
+            self.assertEqual((table.columns, table.rows), (("a;b", "c"), [("1;2", 3)]))
+
+    def test_compile_select(self):
+        executor = PythonExecutor()
+        table = Table(["a", "b"], [(1, "x"), (2, "y"), (3, None), (4, "z")])
+        step = Plan(parse_one("SELECT t.a + 1 AS c, t.b AS b FROM t WHERE t.a > 1")).root
+        select = executor.compile_select(step, {"t": table})
+
+        self.assertEqual(select(table.rows, math.inf), [(3, "y"), (4, None), (5, "z")])
+        self.assertEqual(select(table.rows, 2), [(3, "y"), (4, None)])
+        self.assertEqual(select(table.rows, 0), [])
+        self.assertIsNone(executor.compile_select(step, {"u": table}))
+
+        step = Plan(parse_one("SELECT TRANSFORM(t.b, x -> x) AS c FROM t")).root
+        self.assertIsNone(executor.compile_select(step, {"t": table}))
+
+    def test_join_strategies(self):
+        tables = {
+            "x": [{"a": i % 4, "b": i} for i in range(6)] + [{"a": None, "b": None}],
+            "y": [{"a": i % 5, "c": i} for i in range(30)] + [{"a": None, "c": None}],
+        }
+
+        for sql in (
+            "SELECT x.b, y.c FROM x JOIN y ON x.b < y.c",
+            "SELECT x.b, y.c FROM y JOIN x ON x.b + 10 >= y.c",
+            "SELECT x.b, y.c FROM x JOIN y ON y.c <= x.b * 2 AND x.a <> y.a",
+            "SELECT x.b, y.c FROM y JOIN x ON y.c > x.b",
+        ):
+            with self.subTest(sql):
+                with mock.patch("sqlglot.executor.python._range_key", return_value=None):
+                    expected = sorted(execute(sql, tables=tables).rows)
+
+                self.assertTrue(expected)
+                for ratio, method in ((0, "index_join"), (math.inf, "merge_join")):
+                    with mock.patch.object(PythonExecutor, "INDEX_JOIN_RATIO", ratio):
+                        with mock.patch.object(
+                            PythonExecutor, method, wraps=getattr(PythonExecutor(), method)
+                        ) as join:
+                            self.assertEqual(sorted(execute(sql, tables=tables).rows), expected)
+                            join.assert_called_once()
+
+        # the join side of the comparison also references the source table, so it's not a key
+        sql = "SELECT x.b, y.c FROM x JOIN y ON x.b < y.c + x.a"
+        self.assertEqual(
+            sorted(execute(sql, tables=tables).rows, key=repr),
+            sorted(
+                (
+                    (x["b"], y["c"])
+                    for x in tables["x"]
+                    for y in tables["y"]
+                    if None not in (x["a"], x["b"], y["c"]) and x["b"] < y["c"] + x["a"]
+                ),
+                key=repr,
+            ),
+        )
+
+        tables = {
+            "x": [{"a": i + 2, "b": i} for i in range(6)],
+            "y": [{"a": i % 5, "c": i} for i in range(30)],
+        }
+        inner = [(x["b"], y["c"]) for x in tables["x"] for y in tables["y"] if x["a"] == y["a"]]
+        x_rows = inner + [(x["b"], None) for x in tables["x"] if x["a"] > 4]
+        y_rows = inner + [(None, y["c"]) for y in tables["y"] if y["a"] < 2]
+
+        for sql, expected in (
+            ("SELECT x.b, y.c FROM x LEFT JOIN y ON x.a = y.a", x_rows),
+            ("SELECT x.b, y.c FROM y RIGHT JOIN x ON x.a = y.a", x_rows),
+            ("SELECT x.b, y.c FROM x RIGHT JOIN y ON x.a = y.a", y_rows),
+            ("SELECT x.b, y.c FROM y LEFT JOIN x ON x.a = y.a", y_rows),
+            ("SELECT x.b, y.c FROM y JOIN x ON x.a = y.a", inner),
+        ):
+            with self.subTest(sql):
+                self.assertEqual(
+                    sorted(execute(sql, tables=tables).rows, key=repr), sorted(expected, key=repr)
+                )
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ExecuteError):
+            execute("SELECT 1", engine="foo")
+
     def test_table_depth_mismatch(self):
         tables = {"table": []}
         schema = {"db": {"table": {"col": "VARCHAR"}}}
@@ -462,10 +758,11 @@ class TestExecutor(unittest.TestCase):
                 [(None, 0)],
             ),
         ]:
-            with self.subTest(sql):
-                result = execute(sql)
-                self.assertEqual(result.columns, tuple(cols))
-                self.assertEqual(result.rows, rows)
+            for engine in ENGINES:
+                with self.subTest(f"{sql} ({engine})"):
+                    result = execute(sql, engine=engine)
+                    self.assertEqual(result.columns, tuple(cols))
+                    self.assertEqual(result.rows, rows)
 
     def test_aggregate_without_group_by(self):
         result = execute("SELECT SUM(x) FROM t", tables={"t": [{"x": 1}, {"x": 2}]})
@@ -1,8 +1,11 @@
 import datetime
 import math
 import unittest
+from copy import deepcopy
 
 from sqlglot import alias, exp, parse_one
+from sqlglot.intern import InternPool
+from sqlglot.optimizer.annotate_types import annotate_types
 
 
 class TestExpressions(unittest.TestCase):
@@ -85,6 +88,71 @@ class TestExpressions(unittest.TestCase):
             ["a", "b", "c", "d"],
         )
 
+    def test_find_all_index(self):
+        expression = parse_one("SELECT a, b + 1 FROM x JOIN y ON x.c = y.c WHERE d > 2")
+
+        def assert_found(*names):
+            found = [node.name for node in expression.find_all(exp.Column, exp.Table)]
+            walked = [
+                node.name
+                for node, *_ in expression.walk()
+                if isinstance(node, (exp.Column, exp.Table))
+            ]
+            self.assertEqual(found, list(names))
+            self.assertEqual(walked, list(names))
+
+        assert_found("a", "b", "x", "y", "c", "c", "d")
+        self.assertTrue(expression._index.complete)
+        self.assertIs(expression.find(exp.Where)._index, expression._index)
+        assert_found("a", "b", "x", "y", "c", "c", "d")
+        self.assertEqual(expression.find(exp.Literal).name, "1")
+        self.assertEqual(list(expression.find_all(exp.Group)), [])
+
+        # the index is rebuilt after any change to the tree
+        expression.find(exp.GT).this.replace(exp.column("e"))
+        assert_found("a", "b", "x", "y", "c", "c", "e")
+        expression.find(exp.Join).pop()
+        assert_found("a", "b", "x", "e")
+        expression.find(exp.Add).set("expression", exp.column("f"))
+        expression.append("expressions", exp.column("g"))
+        assert_found("a", "g", "b", "f", "x", "e")
+
+        # detached subtrees don't keep the index of the tree they were removed from
+        join = parse_one("SELECT a FROM x JOIN y ON x.c = y.c")
+        list(join.find_all(exp.Column))
+        on = join.find(exp.Join).args["on"]
+        index = join._index
+        on.replace(exp.condition("x.d = y.d"))
+        self.assertFalse(any(node._index for node, *_ in on.walk()))
+        self.assertIsNone(index.root)
+        self.assertEqual(index.nodes, [])
+        self.assertEqual([column.name for column in on.find_all(exp.Column)], ["c", "c"])
+        self.assertEqual([column.name for column in join.find_all(exp.Column)], ["a", "d", "d"])
+
+        where = join.where("a > 1", copy=False).args["where"]
+        list(join.find_all(exp.Column))
+        join.set("where", None)
+        self.assertFalse(any(node._index for node, *_ in where.walk()))
+        self.assertEqual([column.name for column in join.find_all(exp.Column)], ["a", "d", "d"])
+
+        # a tree that refers to a node that was moved to another tree isn't indexed
+        moved = parse_one("SELECT a, b FROM x")
+        column = moved.find(exp.Column)
+        exp.alias_(column, "c", copy=False)
+        self.assertEqual([column.name for column in moved.find_all(exp.Column)], ["a", "b"])
+        column.set("this", exp.to_identifier("d"))
+        self.assertEqual([column.name for column in moved.find_all(exp.Column)], ["d", "b"])
+
+        # the nodes of frozen trees are shared with other trees, so they aren't indexed
+        frozen = InternPool().intern(parse_one("SELECT a FROM x WHERE b > 1"))
+        self.assertEqual([column.name for column in frozen.find_all(exp.Column)], ["a", "b"])
+        self.assertFalse(any(node._index for node, *_ in frozen.walk()))
+
+        # subtrees are searched without the index
+        self.assertEqual(
+            [column.name for column in expression.find(exp.Add).find_all(exp.Column)], ["b", "f"]
+        )
+
     def test_find_ancestor(self):
         column = parse_one("select * from foo where (a + 1 > 2)").find(exp.Column)
         self.assertIsInstance(column, exp.Column)
@@ -266,6 +334,133 @@ class TestExpressions(unittest.TestCase):
             },
         )
 
+    def test_copy(self):
+        expression = parse_one("SELECT a /* b */, CAST(c AS INT) FROM d WHERE e IN (1, 2)")
+        expression.find(exp.Column).type = "int"
+
+        for copy in (expression.copy(), deepcopy(expression)):
+            self.assertEqual(copy, expression)
+            self.assertEqual(copy.sql(), expression.sql())
+            self.assertIsNone(copy.parent)
+
+            nodes = list(expression.walk())
+            copies = list(copy.walk())
+            self.assertEqual(len(copies), len(nodes))
+
+            for node, new in zip(nodes, copies):
+                self.assertIsNot(new[0], node[0])
+                self.assertIs(new[0].comments, node[0].comments)
+                self.assertIs(new[0].type, node[0].type)
+                self.assertIs(new[1], new[0].parent)
+                self.assertEqual(new[2], node[2])
+                if new[1]:
+                    self.assertIs(new[0].arg_key, node[0].arg_key)
+
+            copy.find(exp.Column).replace(exp.column("x"))
+            self.assertEqual(expression.selects[0].name, "a")
+
+    def test_replaced(self):
+        expression = parse_one("SELECT a, b FROM x WHERE c = 1 AND d = 2")
+        first = expression.replaced(expression.find(exp.Column), exp.column("y"))
+        second = first.updated(first.find(exp.Where), "this", exp.condition("e > 3"))
+        third = second.replaced(second.expressions[1], None)
+
+        self.assertEqual(expression.sql(), "SELECT a, b FROM x WHERE c = 1 AND d = 2")
+        self.assertEqual(first.sql(), "SELECT y, b FROM x WHERE c = 1 AND d = 2")
+        self.assertEqual(second.sql(), "SELECT y, b FROM x WHERE e > 3")
+        self.assertEqual(third.sql(), "SELECT y FROM x WHERE e > 3")
+
+        # the unchanged subtrees are shared, and their parents belong to the version that created them
+        self.assertIs(first.args["where"], expression.args["where"])
+        self.assertIs(third.args["where"], second.args["where"])
+        self.assertIs(third.args["from"], expression.args["from"])
+        self.assertIs(third.args["from"].parent, expression)
+        self.assertIs(expression.expressions[1].parent_select, expression)
+        self.assertIs(third.find(exp.Column).parent_select, first)
+
+        # the original tree can still be modified in place, and the other versions are given
+        # copies of the shared nodes before they're modified
+        expression = parse_one("SELECT a, b FROM x WHERE c = 1 AND d = 2")
+        hash(expression)
+        new = expression.replaced(expression.find(exp.Column), exp.column("z"))
+        self.assertEqual(new.find(exp.Column).name, "z")
+        self.assertEqual([column.name for column in new.find_all(exp.Column)], ["z", "b", "c", "d"])
+        hash(new)
+
+        expression.find(exp.Where).set("this", exp.condition("e = 3"))
+        self.assertIsNot(new.args["where"], expression.args["where"])
+        self.assertIs(new.args["from"], expression.args["from"])
+        expression.transform(
+            lambda node: exp.column("f") if node == exp.column("b") else node, copy=False
+        )
+        annotate_types(expression)
+        self.assertEqual(expression.sql(), "SELECT a, f FROM x WHERE e = 3")
+        self.assertEqual(new.sql(), "SELECT z, b FROM x WHERE c = 1 AND d = 2")
+        self.assertEqual(expression, parse_one(expression.sql()))
+        self.assertEqual(new, parse_one(new.sql()))
+        self.assertEqual(hash(new), hash(parse_one(new.sql())))
+        self.assertEqual([column.name for column in new.find_all(exp.Column)], ["z", "b", "c", "d"])
+        self.assertIsNot(new.args["where"], expression.args["where"])
+
+        # and so is the new version
+        new.set("where", None)
+        new.selects[0].set("this", exp.to_identifier("w"))
+        new.args["from"].expressions[0].set("this", exp.to_identifier("y"))
+        self.assertEqual(new.sql(), "SELECT w, b FROM y")
+        self.assertEqual(expression.sql(), "SELECT a, f FROM x WHERE e = 3")
+
+        # older versions can also be edited with replaced and updated
+        older = expression.updated(expression.find(exp.EQ), "expression", exp.Literal.number(9))
+        self.assertEqual(older.sql(), "SELECT a, f FROM x WHERE e = 9")
+        self.assertEqual(expression.replaced(expression, exp.column("z")).sql(), "z")
+
+        with self.assertRaises(ValueError):
+            expression.replaced(exp.column("a"), None)
+
+    def test_hash_cache(self):
+        expression = parse_one("SELECT a + 1 FROM x WHERE b = 1 AND c = 2")
+        other = expression.copy()
+        self.assertEqual(hash(expression), hash(other))
+
+        # modifying a node clears the cached hashes of its ancestors
+        expression.find(exp.EQ).set("expression", exp.Literal.number(3))
+        self.assertNotEqual(expression, other)
+        self.assertNotEqual(hash(expression), hash(other))
+
+        other.find(exp.EQ).args["expression"].replace(exp.Literal.number(3))
+        self.assertEqual(expression, other)
+        self.assertEqual(hash(expression), hash(other))
+
+        expression.find(exp.Add).pop()
+        other.find(exp.Select).append("expressions", exp.column("d"))
+        self.assertNotEqual(hash(expression), hash(other))
+        expression.find(exp.Select).append("expressions", exp.column("d"))
+        self.assertNotEqual(expression, other)
+        other.find(exp.Add).pop()
+        self.assertEqual(expression, other)
+        self.assertEqual(hash(expression), hash(other))
+
+        # a node that's moved while its old parent still refers to it doesn't leave stale hashes
+        expression = parse_one("SELECT a + 1 FROM x WHERE b = 1")
+        hash(expression)
+        add = expression.find(exp.Add)
+        exp.alias_(add, "y", copy=False)
+        add.set("expression", exp.Literal.number(2))
+        other = parse_one("SELECT a + 2 FROM x WHERE b = 1")
+        self.assertEqual(expression, other)
+        self.assertEqual(hash(expression), hash(other))
+
+        hash(expression)
+        add.set("expression", exp.Literal.number(3))
+        other = parse_one("SELECT a + 3 FROM x WHERE b = 1")
+        self.assertEqual(expression, other)
+        self.assertEqual(hash(expression), hash(other))
+
+        chain = exp.or_(*(f"x = {i}" for i in range(3000)))
+        self.assertEqual(hash(chain), hash(chain.copy()))
+        chain.find(exp.Literal).replace(exp.Literal.number(-1))
+        self.assertNotEqual(hash(chain), hash(exp.or_(*(f"x = {i}" for i in range(3000)))))
+
     def test_sql(self):
         self.assertEqual(parse_one("x + y * 2").sql(), "x + y * 2")
         self.assertEqual(parse_one('select "x"').sql(dialect="hive", pretty=True), "SELECT\n  `x`")
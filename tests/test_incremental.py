@@ -0,0 +1,83 @@
+import unittest
+
+from sqlglot import ParseError, Tokenizer, parse
+from sqlglot.incremental import Session
+
+SQL = """SELECT a FROM x; -- trailing
+/* leading */ SELECT 'b;' FROM y;;
+SELECT c
+FROM z;
+"""
+
+
+class TestIncremental(unittest.TestCase):
+    def assertSession(self, session):
+        self.assertEqual(
+            [(t.token_type, t.text, t.line, t.col, t.comments) for t in session.tokens],
+            [
+                (t.token_type, t.text, t.line, t.col, t.comments)
+                for t in Tokenizer().tokenize(session.sql)
+            ],
+        )
+        self.assertEqual(session.expressions, parse(session.sql))
+
+    def test_edit(self):
+        session = Session(SQL)
+        self.assertSession(session)
+        first, second, third, fourth = session.expressions
+
+        session.edit(7, 8, "a2")
+        self.assertEqual(session.sql[:18], "SELECT a2 FROM x; ")
+        self.assertSession(session)
+        expressions = session.expressions
+        self.assertIsNot(expressions[0], first)
+        self.assertIs(expressions[2], third)
+        self.assertIs(expressions[3], fourth)
+
+        session.edit(session.sql.index("c\n"), session.sql.index("c\n") + 1, "c, d")
+        self.assertSession(session)
+        self.assertIs(session.expressions[0], expressions[0])
+        self.assertIs(session.expressions[1], expressions[1])
+        self.assertIsNot(session.expressions[3], fourth)
+        fourth = session.expressions[3]
+
+        # the following statements are shifted by a line, but they're not parsed again
+        session.edit(0, 0, "\n")
+        self.assertSession(session)
+        self.assertIs(session.expressions[3], fourth)
+
+        # without the semicolon, the second statement is merged into the first
+        start = session.sql.index(";")
+        session.edit(start, start + 1, "")
+        with self.assertRaises(ParseError):
+            session.expressions
+        session.edit(start, start, ";")
+        self.assertSession(session)
+        self.assertIs(session.expressions[3], fourth)
+
+        session.edit(0, len(session.sql), "")
+        self.assertSession(session)
+        self.assertEqual(session.expressions, [None])
+
+    def test_update(self):
+        session = Session(SQL, read="mysql")
+        fourth = session.expressions[3]
+
+        for sql in (SQL.replace("'b;'", "'b'"), SQL.replace("c\n", "c, d\n"), SQL + "SELECT 1"):
+            session.update(sql)
+            self.assertEqual(session.sql, sql)
+            self.assertEqual(session.expressions, parse(sql, read="mysql"))
+        self.assertIsNot(session.expressions[3], fourth)
+        self.assertEqual(session.expressions[4].sql(), "SELECT 1")
+
+    def test_unterminated(self):
+        session = Session("SELECT 1; SELECT 2")
+        session.edit(7, 7, "'")
+        with self.assertRaises(RuntimeError):
+            session.tokens
+        session.edit(9, 9, "'")
+        self.assertEqual(session.sql, "SELECT '1'; SELECT 2")
+        self.assertSession(session)
+
+        with self.assertRaises(ValueError):
+            session.edit(5, 100, "")
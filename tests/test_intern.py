@@ -0,0 +1,72 @@
+import unittest
+
+from sqlglot import exp, parse_one
+from sqlglot.intern import InternPool
+
+
+class TestIntern(unittest.TestCase):
+    def test_intern(self):
+        pool = InternPool()
+        sqls = [
+            "SELECT a, SUM(b) FROM x WHERE c > 1 GROUP BY a",
+            "SELECT a, SUM(b) FROM x WHERE c > 2 GROUP BY a",
+            'SELECT "A", SUM(b) FROM x WHERE c > 1 GROUP BY a',
+            "SELECT a, SUM(b) /* comment */ FROM x WHERE c > 1 GROUP BY a",
+        ]
+        first, second, third, fourth = (pool.intern(parse_one(sql)) for sql in sqls)
+
+        for expression, sql in zip((first, second, third, fourth), sqls):
+            self.assertEqual(expression.sql(), sql)
+            self.assertTrue(all(node.frozen for node, *_ in expression.walk()))
+
+        self.assertIs(first.args["from"], second.args["from"])
+        self.assertIs(first.args["group"], second.args["group"])
+        self.assertIsNot(first.args["where"], second.args["where"])
+        self.assertIs(first.selects[0].this, first.args["group"].expressions[0].this)
+        self.assertIs(first.selects[1], third.selects[1])
+        self.assertIsNot(first.selects[0], third.selects[0])
+        self.assertIsNot(first.selects[1], fourth.selects[1])
+
+        # the same column isn't shared between a projection and a grouping key
+        self.assertIsNot(first.selects[0], first.args["group"].expressions[0])
+
+        size = len(pool)
+        self.assertIs(pool.intern(parse_one(sqls[0])), first)
+        self.assertIs(pool.intern(first), first)
+        self.assertEqual(len(pool), size)
+
+    def test_find_all_index(self):
+        pool = InternPool()
+        pool.intern(parse_one("SELECT a FROM x WHERE b = 1"))
+        expression = parse_one("SELECT a FROM x WHERE b = 2")
+        self.assertEqual(len(list(expression.find_all(exp.Column))), 2)
+
+        # the index built before interning doesn't refer to the replaced nodes
+        expression = pool.intern(expression)
+        walked = [node for node, *_ in expression.walk() if isinstance(node, exp.Column)]
+        found = list(expression.find_all(exp.Column))
+        self.assertEqual(len(found), 2)
+        self.assertTrue(all(a is b for a, b in zip(found, walked)))
+
+    def test_frozen(self):
+        expression = InternPool().intern(parse_one("SELECT a FROM x WHERE b = 1"))
+        column = expression.find(exp.Column)
+
+        for mutate in (
+            lambda: expression.set("where", None),
+            lambda: expression.append("expressions", exp.column("c")),
+            lambda: column.replace(exp.column("c")),
+            lambda: column.pop(),
+            lambda: expression.transform(lambda node: node, copy=False),
+            lambda: setattr(column, "type", "int"),
+        ):
+            with self.assertRaises(ValueError):
+                mutate()
+
+        self.assertEqual(expression.sql(), "SELECT a FROM x WHERE b = 1")
+
+        copy = expression.copy()
+        self.assertFalse(any(node.frozen for node, *_ in copy.walk()))
+        copy.find(exp.Column).replace(exp.column("c"))
+        self.assertEqual(copy.sql(), "SELECT c FROM x WHERE b = 1")
+        self.assertEqual(expression.where("c = 2").sql(), "SELECT a FROM x WHERE b = 1 AND c = 2")
@@ -1,3 +1,4 @@
+import sys
 import unittest
 from functools import partial
 
@@ -113,6 +114,49 @@ class TestOptimizer(unittest.TestCase):
 
         self.check_file("optimizer", optimizer.optimize, pretty=True, execute=True, schema=schema)
 
+    def test_optimizer_session(self):
+        schema = {
+            "x": {"a": "INT", "b": "INT"},
+            "y": {"b": "INT", "c": "INT"},
+            "z": {"a": "INT", "c": "INT"},
+        }
+        session = optimizer.OptimizerSession(schema=schema)
+
+        for _ in range(2):
+            self.check_file("optimizer", lambda e: session.optimize(e), pretty=True)
+        self.assertGreater(session.cache.hits, 0)
+
+        sql = """
+            WITH a AS (SELECT x.a FROM x WHERE (x.a = 1 AND x.b = 2) OR (x.a = 1 AND x.b = 3)),
+            b AS (SELECT y.b FROM y WHERE y.c > {})
+            SELECT a.a, b.b FROM a JOIN b ON a.a = b.b
+        """
+        session.clear()
+        session.optimize(parse_one(sql.format(1)))
+        misses = session.cache.misses
+
+        for value in (2, 3):
+            expression = parse_one(sql.format(value))
+            self.assertEqual(
+                session.optimize(expression).sql(),
+                optimizer.optimize(expression, schema=schema).sql(),
+            )
+            # the query itself and its second CTE, which is the only part that goes through the
+            # local rules again
+            self.assertEqual(
+                session.cache.misses - misses, 1 + len(optimizer.OptimizerSession.LOCAL_RULES)
+            )
+            misses = session.cache.misses
+
+        def deep(name):
+            expression = exp.column(name)
+            for _ in range(sys.getrecursionlimit() * 2):
+                expression = exp.Not(this=expression)
+            return optimizer.optimizer._fingerprint(expression)
+
+        self.assertEqual(deep("a"), deep("a"))
+        self.assertNotEqual(deep("a"), deep("b"))
+
     def test_isolate_table_selects(self):
         self.check_file(
             "isolate_table_selects",
@@ -0,0 +1,83 @@
+import unittest
+from unittest.mock import patch
+
+from sqlglot import ErrorLevel, ParseError, parse, transpile
+from tests.helpers import assert_logger_contains
+
+SQL = """
+SELECT 'a;b' AS x FROM y; -- trailing;
+/* leading; */ SELECT "c;" FROM z;;
+SELECT 1 + (2 * 3) FROM (SELECT a FROM b) AS c WHERE d IN (SELECT e FROM f);
+SELECT x FROM y LIMIT 1;
+"""
+
+
+@patch("sqlglot.parallel.MIN_PARALLEL_SIZE", 0)
+class TestParallel(unittest.TestCase):
+    def test_parse(self):
+        expressions = parse(SQL, workers=2)
+        self.assertEqual(expressions, parse(SQL))
+        self.assertEqual([e.comments for e in expressions if e], [[], [" leading; "], [], []])
+
+        for expression in expressions:
+            for node, parent, _ in expression.bfs() if expression else []:
+                self.assertIs(node.parent, parent)
+
+    def test_transpile(self):
+        self.assertEqual(
+            transpile(SQL, read="postgres", write="spark", workers=2),
+            transpile(SQL, read="postgres", write="spark"),
+        )
+
+    def test_fallback(self):
+        # commands end at the first semicolon, even within a string
+        sql = "SHOW a '; SELECT ';'"
+        self.assertEqual(transpile(sql, workers=2), transpile(sql))
+
+    def test_errors(self):
+        sql = "SELECT 1; SELECT (; SELECT 2"
+
+        with self.assertRaises(ParseError) as context:
+            parse(sql, workers=2, error_level=ErrorLevel.RAISE)
+        self.assertEqual(context.exception.errors[0]["description"], "Expecting )")
+
+        with patch("sqlglot.parallel.logger") as logger:
+            expressions = parse(sql, workers=2, error_level=ErrorLevel.WARN)
+        assert_logger_contains("Expecting )", logger)
+        self.assertEqual(len(expressions), 3)
+
+    def test_error_positions(self):
+        def assert_same_errors(sql):
+            for error_level in (ErrorLevel.RAISE, ErrorLevel.IMMEDIATE):
+                errors = []
+                for workers in (None, 2):
+                    with self.assertRaises(ParseError) as context:
+                        parse(sql, workers=workers, error_level=error_level)
+                    errors.append((str(context.exception), context.exception.errors))
+                self.assertEqual(errors[0], errors[1])
+            return errors[1][1][0]
+
+        error = assert_same_errors("SELECT 1;\nSELECT 2;\nSELECT 3;\nSELECT (a FROM x")
+        self.assertEqual((error["line"], error["col"], error["highlight"]), (4, 11, "FROM"))
+
+        # the line breaks within strings and comments aren't counted by the tokenizer
+        sql = "SELECT 1;\nSELECT 'a\nb' /* c\nd */, 2;  SELECT x FROM y;\nSELECT a,\n  (b FROM z; SELECT ("
+        error = assert_same_errors(sql)
+        self.assertEqual((error["line"], error["col"]), (4, 6))
+
+        with patch("sqlglot.parallel.logger") as logger:
+            parse(sql, workers=2, error_level=ErrorLevel.WARN)
+        with patch("sqlglot.parser.logger") as serial_logger:
+            parse(sql, error_level=ErrorLevel.WARN)
+
+        # the sequential parse logs the errors of all the statements so far after each of them
+        warnings = [args[0][0] for args in logger.error.call_args_list]
+        self.assertEqual(len(warnings), 3)
+        self.assertEqual(set(warnings), {args[0][0] for args in serial_logger.error.call_args_list})
+
+    def test_small_input(self):
+        with patch("sqlglot.parallel.MIN_PARALLEL_SIZE", 10**6), patch(
+            "sqlglot.parallel.ProcessPoolExecutor"
+        ) as pool:
+            self.assertEqual(parse(SQL, workers=2), parse(SQL))
+        pool.assert_not_called()
@@ -1,8 +1,20 @@
+import io
 import unittest
 from unittest.mock import patch
 
-from sqlglot import Parser, exp, parse, parse_one
+from sqlglot import (
+    Parser,
+    Tokenizer,
+    TokenType,
+    exp,
+    parse,
+    parse_iter,
+    parse_one,
+    parse_recovering,
+)
 from sqlglot.errors import ErrorLevel, ParseError
+from sqlglot.parser import ParserMethod
+from sqlglot.tokens import TokenBuffer
 from tests.helpers import assert_logger_contains
 
 
@@ -155,6 +167,164 @@ class TestParser(unittest.TestCase):
         assert expressions[0].args["from"].expressions[0].this.name == "a"
         assert expressions[1].args["from"].expressions[0].this.name == "b"
 
+    def test_parse_iter(self):
+        sql = "SELECT 'a;b' FROM a; /* ; */ SELECT * FROM b;; SET x = 1; SELECT 1"
+
+        for source in (sql, io.StringIO(sql), io.BytesIO(sql.encode())):
+            with self.subTest(type(source).__name__):
+                expressions = parse_iter(source)
+                self.assertNotIsInstance(expressions, list)
+                self.assertEqual(list(expressions), parse(sql))
+
+        # the errors point at the same tokens, with the context of the statement they're in
+        sql = "SELECT 1; /* a */ SELECT 2;\n\n  SELECT x FROM y WHERE; SELECT 3"
+        with self.assertRaises(ParseError) as expected:
+            parse(sql)
+
+        for source in (sql, io.StringIO(sql)):
+            with self.subTest(type(source).__name__):
+                with self.assertRaises(ParseError) as ctx:
+                    list(parse_iter(source))
+                self.assertEqual(ctx.exception.errors[0]["line"], 3)
+                self.assertEqual(ctx.exception.errors[0]["col"], 19)
+                self.assertEqual(ctx.exception.errors[0]["highlight"], "WHERE")
+                self.assertEqual(ctx.exception.errors[0]["start_context"], "\n\n  SELECT x FROM y ")
+                self.assertTrue(
+                    expected.exception.errors[0]["start_context"].endswith(
+                        ctx.exception.errors[0]["start_context"]
+                    )
+                )
+
+        tokenizer = Tokenizer()
+        for chunk_size in (1, 7):
+            statements = list(tokenizer._tokenize_iter(io.StringIO(sql), chunk_size))
+            self.assertEqual(
+                [(text, sql_start) for _, text, sql_start in statements],
+                [
+                    ("SELECT 1;", (1, 1)),
+                    (" /* a */ SELECT 2;", (1, 10)),
+                    ("\n\n  SELECT x FROM y WHERE;", (1, 28)),
+                    (" SELECT 3", (3, 25)),
+                ],
+            )
+
+    def test_parse_compact(self):
+        sql = "SELECT a /* b */ FROM c; SELECT 'd''e' AS \"f\";"
+        tokenizer = Tokenizer()
+        self.assertEqual(
+            Parser().parse(tokenizer.tokenize_compact(sql), sql),
+            Parser().parse(tokenizer.tokenize(sql), sql),
+        )
+
+        # the parser reads the tokens from the buffer, instead of creating all of them at once
+        sql = "INSERT INTO t VALUES " + ", ".join(["(1, 'a', NULL, -2)"] * 1000)
+        parser = Parser()
+        self.assertEqual(parser.parse(tokenizer.tokenize_compact(sql), sql)[0], parse_one(sql))
+        self.assertIsInstance(parser._tokens, TokenBuffer)
+
+        sql = "SELECT 1 +; SELECT a FROM"
+        for error_level in (ErrorLevel.RAISE, ErrorLevel.RECOVER):
+            errors = []
+            for tokens in (tokenizer.tokenize(sql), tokenizer.tokenize_compact(sql)):
+                parser = Parser(error_level=error_level)
+                try:
+                    parser.parse(tokens, sql)
+                except ParseError as e:
+                    errors.append(e.errors)
+                else:
+                    errors.append(parser.errors)
+            self.assertEqual(errors[0], errors[1])
+
+    def test_dispatch_tables(self):
+        from sqlglot.dialects.mysql import MySQL
+
+        self.assertIs(Parser._statement_parsers[TokenType.CREATE], Parser._parse_create)
+        self.assertIs(Parser._range_parsers[TokenType.IN], Parser._parse_in)
+        self.assertIs(Parser._function_parsers["EXTRACT"], Parser._parse_extract)
+
+        # other parsers, e.g. lambdas, are kept as they are
+        self.assertIs(
+            Parser._statement_parsers[TokenType.USE], Parser.STATEMENT_PARSERS[TokenType.USE]
+        )
+        self.assertIs(
+            Parser._primary_parsers[TokenType.SESSION_PARAMETER],
+            Parser.PRIMARY_PARSERS[TokenType.SESSION_PARAMETER],
+        )
+
+        self.assertIs(MySQL.Parser._statement_parsers[TokenType.SHOW], MySQL.Parser._parse_show)
+        self.assertNotIn(TokenType.SHOW, Parser._statement_parsers)
+        self.assertEqual(
+            [key for key, _ in Parser._query_modifier_parsers], list(Parser.QUERY_MODIFIER_PARSERS)
+        )
+
+        # the tables are compiled again when they're assigned, also in the subclasses
+        class Base(Parser):
+            pass
+
+        class Sub(Base):
+            pass
+
+        Base.FUNCTION_PARSERS = {**Parser.FUNCTION_PARSERS, "FOO": ParserMethod("_parse_foo")}
+        Base._parse_foo = lambda self: exp.Literal.number(1)
+        Base.FACTOR = {**Parser.FACTOR, TokenType.DPIPE: exp.Mul}
+        for klass in (Base, Sub):
+            self.assertIs(klass._function_parsers["FOO"], Base._parse_foo)
+            self.assertEqual(klass().parse(Tokenizer().tokenize("FOO()"))[0].sql(), "1")
+            self.assertEqual(
+                klass().parse(Tokenizer().tokenize("1 + 2 || 3"))[0].sql(), "1 + 2 * 3"
+            )
+
+        self.assertNotIn("FOO", Parser._function_parsers)
+
+    def test_binary_precedence(self):
+        expression = parse_one("a AND b OR c = d + e * f")
+        self.assertIsInstance(expression, exp.Or)
+        self.assertIsInstance(expression.expression.expression.expression, exp.Mul)
+        self.assertIsInstance(parse_one("a < b << c").expression, exp.BitwiseLeftShift)
+        self.assertIsInstance(parse_one("a + 1 BETWEEN b AND c > d").this, exp.Between)
+        self.assertIsInstance(parse_one("a IS NULL = b NOT IN (c)").expression, exp.Not)
+        self.assertIsInstance(Parser().parse(Tokenizer().tokenize("a + b < c"))[0], exp.LT)
+
+    def test_deep_binary(self):
+        sql = " + ".join(str(i) for i in range(10000))
+        expression = parse_one(f"SELECT {sql} AND x = 1 FROM y")
+        copy = expression.copy()
+
+        self.assertEqual(expression.sql(), f"SELECT {sql} AND x = 1 FROM y")
+        self.assertEqual(expression, copy)
+        self.assertEqual(hash(expression), hash(copy))
+        self.assertEqual(len(list(copy.dfs())), len(list(expression.bfs())))
+
+        copy.find(exp.Literal).replace(exp.Literal.number(-1))
+        self.assertNotEqual(expression, copy)
+
+    def test_bulk_values(self):
+        rows = [
+            f"({i}, 'it''s {i}', NULL, TRUE, -{i}.5)" for i in range(Parser.BULK_VALUES_MIN_ROWS)
+        ]
+        sql = f"INSERT INTO t VALUES {', '.join(rows)}"
+        expression = parse_one(sql)
+        values = expression.expression
+
+        self.assertIsInstance(values.expressions[0], exp.Rows)
+        self.assertEqual(values.expressions[0].args["rows"][1], ("1", "it's 1", None, True, "-1.5"))
+        self.assertEqual(expression.sql(), sql)
+        self.assertEqual(expression.sql("hive"), sql.replace("''", "\\'"))
+        self.assertEqual(expression.sql(pretty=True), parse_one(sql).sql(pretty=True))
+
+        # the rows are the same as those that are parsed into Tuple expressions
+        tuples = parse_one(f"INSERT INTO t VALUES {', '.join(rows[:2])}").expression.expressions
+        self.assertEqual(values.expressions[0].tuples()[:2], tuples)
+        self.assertEqual(values.expressions[0].tuples()[1].sql(), rows[1])
+
+        for row in ("(1, 'a', NULL, TRUE, x)", "(1, 2, NULL, TRUE, 3)", "(1, 'a', NULL, TRUE)"):
+            expression = parse_one(f"{sql}, {row}")
+            self.assertIsInstance(expression.expression.expressions[0], exp.Tuple)
+            self.assertEqual(expression.sql(), f"{sql}, {row}")
+
+        with self.assertRaises(ParseError):
+            parse_one(f"{sql}, 1")
+
     def test_expression(self):
         ignore = Parser(error_level=ErrorLevel.IGNORE)
         self.assertIsInstance(ignore.expression(exp.Hint, expressions=[""]), exp.Hint)
@@ -316,3 +486,27 @@ class TestParser(unittest.TestCase):
             "Expected table name",
             logger,
         )
+
+    def test_recover(self):
+        sql = "SELECT a FROM x WHERE ) GROUP BY b; SELECT 1 SELECT 2; SELECT (; SELECT 3"
+        parser = Parser(error_level=ErrorLevel.RECOVER)
+        expressions = parser.parse(Tokenizer().tokenize(sql), sql)
+
+        self.assertEqual(
+            [expression and expression.sql() for expression in expressions],
+            ["SELECT a FROM x GROUP BY b", "SELECT 1", "SELECT 2", None, "SELECT 3"],
+        )
+        self.assertEqual(
+            [(error.statement, error.index, error.line, error.col) for error in parser.errors],
+            [(0, 5, 1, 23), (1, 2, 1, 46), (2, 2, 1, 63)],
+        )
+        self.assertEqual(parser.errors[1].description, "Invalid expression / Unexpected token")
+        self.assertEqual(parse("SELECT 1", error_level=ErrorLevel.RECOVER)[0].sql(), "SELECT 1")
+
+        expressions, errors = parse_recovering("SELECT a, ( FROM y; SELECT b FROM z")
+        self.assertEqual(
+            [expression.sql() for expression in expressions], ["SELECT a FROM y", "SELECT b FROM z"]
+        )
+        self.assertEqual(
+            [(error.statement, error.description) for error in errors], [(0, "Expecting )")]
+        )
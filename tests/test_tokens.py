@@ -1,3 +1,4 @@
+import io
 import unittest
 
 from sqlglot.tokens import Tokenizer, TokenType
@@ -62,3 +63,74 @@ class TestTokens(unittest.TestCase):
                 (TokenType.SEMICOLON, ";"),
             ],
         )
+
+    def test_fast_scanner(self):
+        sqls = [
+            "SELECT a, b AS \"c d\", 1.5, 2e5, 0x1F FROM x WHERE y >= 1 ORDER  BY\n\tz",
+            "SELECT 'a''b', N'c' /* comment */ FROM x -- trailing\r\nLIMIT 1",
+            "SET x = 1; SHOW TABLES; SELECT x::INT, y->>'z' FROM t",
+            "SELECT 1 FROM x",
+        ]
+
+        for sql in sqls:
+            with self.subTest(sql):
+                tokens = Tokenizer().tokenize(sql)
+
+                fast_scanner = Tokenizer._FAST_SCANNER
+                Tokenizer._FAST_SCANNER = None
+                try:
+                    expected = Tokenizer().tokenize(sql)
+                finally:
+                    Tokenizer._FAST_SCANNER = fast_scanner
+
+                self.assertEqual(
+                    [(t.token_type, t.text, t.line, t.col, t.comments) for t in tokens],
+                    [(t.token_type, t.text, t.line, t.col, t.comments) for t in expected],
+                )
+
+    def test_tokenize_iter(self):
+        sql = "SELECT 'é;' -- a;\nFROM x; SHOW TABLES;\n\nSELECT \"b;\" /* c; */;"
+        tokens = Tokenizer().tokenize(sql)
+        expected = [
+            [(t.token_type, t.text, t.line, t.col, t.comments) for t in statement]
+            for statement in (tokens[:4], tokens[5:7], tokens[8:10])
+        ]
+
+        for source in (sql, io.StringIO(sql), io.BytesIO(sql.encode())):
+            for chunk_size in (1, 4, 1024):
+                with self.subTest(f"{type(source).__name__} {chunk_size}"):
+                    if not isinstance(source, str):
+                        source.seek(0)
+                    self.assertEqual(
+                        [
+                            [(t.token_type, t.text, t.line, t.col, t.comments) for t in statement]
+                            for statement in Tokenizer().tokenize_iter(source, chunk_size)
+                        ],
+                        expected,
+                    )
+
+    def test_split(self):
+        sql = "SELECT 'a;b' -- c;\n; /* d; */ SELECT \"e;\";  -- f\nSELECT 1; \n"
+        self.assertEqual(
+            Tokenizer().split(sql),
+            ["SELECT 'a;b' -- c;\n; /* d; */ ", "SELECT \"e;\";  -- f", "\nSELECT 1; \n"],
+        )
+        self.assertEqual(Tokenizer().split(""), [""])
+        self.assertEqual(Tokenizer().split(";"), [";"])
+
+    def test_tokenize_compact(self):
+        sql = "SELECT 'a''b', \"c\", x::INT /* d */ FROM y -- e\n; SET z = 1"
+        tokens = Tokenizer().tokenize(sql)
+        buffer = Tokenizer().tokenize_compact(sql)
+
+        self.assertEqual(len(buffer), len(tokens))
+        self.assertEqual(
+            [(t.token_type, t.text, t.line, t.col, t.comments) for t in buffer],
+            [(t.token_type, t.text, t.line, t.col, t.comments) for t in tokens],
+        )
+        self.assertEqual(buffer.token_type(1), TokenType.STRING)
+        self.assertEqual(buffer.text(1), "a'b")
+        self.assertEqual(buffer.text(3), "c")
+        self.assertEqual(buffer.texts, {1: "a'b"})
+        self.assertEqual([len(view) for view in buffer.split(TokenType.SEMICOLON)], [10, 2])
+        self.assertEqual(buffer[-1].text, " z = 1")